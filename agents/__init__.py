@@ -5,10 +5,13 @@ This module contains the three main agents of the AI Operations Assistant:
 - Planner Agent: Creates execution plans from natural language
 - Executor Agent: Executes plans and calls APIs
 - Verifier Agent: Validates and formats results
+
+BatchExecutor runs many plans at once on one shared, fair step scheduler.
 """
 
 from .planner import PlannerAgent
 from .executor import ExecutorAgent
+from .batch import BatchExecutor
 from .verifier import VerifierAgent
 
-__all__ = ["PlannerAgent", "ExecutorAgent", "VerifierAgent"]
+__all__ = ["PlannerAgent", "ExecutorAgent", "BatchExecutor", "VerifierAgent"]
@@ -0,0 +1,294 @@
+"""
+Batch Executor - Shares one step scheduler between many concurrently running plans
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from agents.executor import EarlyDispatch, ExecutionContext, ExecutorAgent, ReadyQueue, SharedCall
+from agents.planner import ExecutionPlan, PlanStep
+from tools.registry import ToolRegistry
+
+
+@dataclass
+class PlanState:
+    """Scheduling state of one plan submitted to a BatchExecutor."""
+    context: ExecutionContext
+    remaining_deps: Dict[int, int]
+    dependents: Dict[int, List[int]]
+    ready: ReadyQueue
+    done: asyncio.Future  # Resolves to True if a required step failed
+    pass_value: float = 0.0  # Stride-scheduling position; lowest goes next
+    in_flight: int = 0
+    failed: bool = False
+    failure_reason: Optional[str] = None
+
+
+class BatchExecutor(ExecutorAgent):
+    """
+    Executor service that runs many plans at once from one global ready-queue.
+    
+    Every plan submitted through ``execute_plan``, ``execute_plan_stream`` or
+    ``resume_plan`` is scheduled by a single loop that keeps at most
+    ``max_concurrency`` steps in flight across all plans. Slots are handed out
+    by stride scheduling: each plan advances by ``1 / weight`` per launched
+    step and the plan that is furthest behind goes next. A 200-step bulk plan
+    therefore shares capacity with, rather than starves, a single-step
+    interactive request. Identical calls in flight in different plans are made
+    once and shared.
+    """
+    
+    def __init__(
+        self,
+        llm_factory,
+        tool_registry: ToolRegistry,
+        max_concurrency: Optional[int] = None,
+        **kwargs: Any
+    ):
+        """
+        Initialize batch executor.
+        
+        Args:
+            llm_factory: Factory used to create the recovery LLM
+            tool_registry: Registry used to execute step capabilities
+            max_concurrency: Maximum steps in flight across all plans
+                (defaults to EXECUTOR_MAX_CONCURRENCY)
+            **kwargs: Other ExecutorAgent options (plan_deadline, retry_policy, ...)
+        """
+        super().__init__(
+            llm_factory, tool_registry, mode="concurrent", max_concurrency=max_concurrency, **kwargs
+        )
+        self._plans: List[PlanState] = []
+        self._tasks: Dict[asyncio.Task, Tuple[PlanState, PlanStep]] = {}
+        self._shared_calls: Dict[str, SharedCall] = {}
+        self._scheduler: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._virtual_time = 0.0
+    
+    async def execute_plan(
+        self,
+        plan: ExecutionPlan,
+        deadline: Optional[float] = None,
+        weight: float = 1.0,
+        early_dispatch: Optional[EarlyDispatch] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a plan alongside every other plan submitted to this executor.
+        
+        Args:
+            plan: Execution plan to execute
+            deadline: Seconds the whole plan may take (defaults to plan_deadline)
+            weight: Relative share of the step slots while plans compete
+            early_dispatch: Calls already started for steps of this plan
+                while it was being generated
+        
+        Returns:
+            Execution results with metadata
+        """
+        if weight <= 0:
+            raise ValueError("Plan weight must be positive")
+        
+        context = self._create_context(plan, deadline)
+        context.weight = weight
+        context.early_dispatch = early_dispatch
+        return await self._run_plan(context)
+    
+    async def execute_plans(
+        self,
+        plans: Sequence[ExecutionPlan],
+        weights: Optional[Sequence[float]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several plans at once.
+        
+        Args:
+            plans: Execution plans to execute
+            weights: Relative share of the step slots per plan (default 1.0 each)
+        
+        Returns:
+            Execution results in the same order as ``plans``
+        """
+        weights = weights or [1.0] * len(plans)
+        return list(await asyncio.gather(*[
+            self.execute_plan(plan, weight=weight) for plan, weight in zip(plans, weights)
+        ]))
+    
+    async def _run_concurrent(self, context: ExecutionContext) -> bool:
+        """Submit a plan to the shared scheduler and wait for it to finish."""
+        steps = context.plan.steps
+        
+        # Validates dependencies and rejects cycles before anything is started
+        sorted_steps = self._sort_steps_by_dependencies(steps)
+        
+        remaining_deps, dependents = self._build_dependency_graph(steps)
+        state = PlanState(
+            context=context,
+            remaining_deps=remaining_deps,
+            dependents=dependents,
+            ready=self._create_ready_queue(sorted_steps, dependents),
+            done=asyncio.get_running_loop().create_future(),
+            pass_value=self._virtual_time
+        )
+        for step in steps:
+            if remaining_deps[step.step_id] == 0:
+                self._mark_ready(step, context)
+                state.ready.push(step)
+        context.shared_calls = self._shared_calls
+        context.metadata["scheduler"].update({"batch": True, "weight": context.weight})
+        
+        self._plans.append(state)
+        self._wake()
+        try:
+            return await state.done
+        finally:
+            if state in self._plans:
+                # The caller went away (e.g. a closed stream); stop its steps
+                self._remove_plan(state)
+    
+    def _wake(self) -> None:
+        """Start the scheduler on the running loop if needed and signal new work."""
+        loop = asyncio.get_running_loop()
+        if self._scheduler is None or self._scheduler.done() or self._scheduler.get_loop() is not loop:
+            self._tasks = {}
+            self._wakeup = asyncio.Event()
+            self._scheduler = asyncio.create_task(self._schedule())
+        self._wakeup.set()
+    
+    async def _schedule(self) -> None:
+        """Launch steps fairly across plans and collect their results until no work is left."""
+        try:
+            while self._plans or self._tasks:
+                self._wakeup.clear()
+                await self._launch_ready()
+                self._finish_idle_plans()
+                if not self._plans and not self._tasks:
+                    break
+                
+                waiter = asyncio.ensure_future(self._wakeup.wait())
+                try:
+                    done, _ = await asyncio.wait(
+                        set(self._tasks) | {waiter}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    waiter.cancel()
+                
+                for task in done:
+                    if task is not waiter:
+                        self._collect(task)
+        except BaseException as e:
+            for state in list(self._plans):
+                self._remove_plan(state, e if isinstance(e, Exception) else None)
+            raise
+    
+    def _next_plan(self) -> Optional[PlanState]:
+        """Get the plan with launchable steps that has received the least service."""
+        candidates = [state for state in self._plans if state.ready and not state.failed]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda state: state.pass_value)
+    
+    async def _launch_ready(self) -> None:
+        """Launch ready steps up to the global concurrency limit."""
+        while len(self._tasks) < self.max_concurrency:
+            state = self._next_plan()
+            if state is None:
+                return
+            
+            step = state.ready.pop()
+            context = state.context
+            if step.step_id in context.results:
+                # Restored from a checkpoint
+                self._resolve(state, step.step_id)
+            elif not await self._should_execute_step(step, context):
+                # Skipped steps still unblock their dependents
+                self._resolve(state, step.step_id)
+            elif self._skip_if_past_deadline(step, context):
+                if not step.optional:
+                    self._fail(state, "Plan deadline exceeded")
+                self._resolve(state, step.step_id)
+            else:
+                task = asyncio.create_task(self._execute_or_share(step, context))
+                self._tasks[task] = (state, step)
+                state.in_flight += 1
+                self._virtual_time = state.pass_value
+                state.pass_value += 1.0 / context.weight
+    
+    def _collect(self, task: asyncio.Task) -> None:
+        """Record a finished step task."""
+        state, step = self._tasks.pop(task)
+        state.in_flight -= 1
+        if state not in self._plans:
+            return  # Plan was abandoned by its caller
+        
+        context = state.context
+        if task.cancelled():
+            context.cancelled[step.step_id] = state.failure_reason or "Cancelled"
+            self._emit(context, "cancelled", step, 0)
+            return
+        if task.exception() is not None:
+            self._remove_plan(state, task.exception())
+            return
+        
+        result = task.result()
+        self._record_result(step, result, context)
+        if result.is_error() and not step.optional:
+            self._fail(state, f"Required step {step.step_id} failed")
+        self._resolve(state, step.step_id)
+    
+    def _resolve(self, state: PlanState, step_id: int) -> None:
+        """Unblock the dependents of a finished or skipped step."""
+        for dependent_id in state.dependents[step_id]:
+            state.remaining_deps[dependent_id] -= 1
+            if state.remaining_deps[dependent_id] == 0:
+                dependent = state.context.step_index[dependent_id]
+                self._mark_ready(dependent, state.context)
+                state.ready.push(dependent)
+    
+    def _fail(self, state: PlanState, reason: str) -> None:
+        """Stop a plan after a required failure, cancelling its running steps if fail_fast."""
+        if state.failed:
+            return
+        
+        state.failed = True
+        state.failure_reason = reason
+        state.ready.clear()
+        if self.fail_fast:
+            for task, (owner, _) in self._tasks.items():
+                if owner is state:
+                    task.cancel()
+    
+    def _finish_idle_plans(self) -> None:
+        """Complete plans that have nothing ready and nothing in flight."""
+        for state in list(self._plans):
+            if state.in_flight or (state.ready and not state.failed):
+                continue
+            
+            self._plans.remove(state)
+            if state.failed:
+                self._cancel_remaining(state.context, state.failure_reason)
+            if not state.done.done():
+                state.done.set_result(state.failed)
+    
+    def _remove_plan(self, state: PlanState, error: Optional[BaseException] = None) -> None:
+        """Drop a plan, cancelling its running steps and failing its waiter with ``error``."""
+        if state in self._plans:
+            self._plans.remove(state)
+        for task, (owner, _) in self._tasks.items():
+            if owner is state:
+                task.cancel()
+        
+        if not state.done.done():
+            if error is not None:
+                state.done.set_exception(error)
+            else:
+                state.done.cancel()
+    
+    def get_batch_stats(self) -> Dict[str, Any]:
+        """Get the number of active plans, steps in flight and shared in-flight calls."""
+        return {
+            "active_plans": len(self._plans),
+            "in_flight": len(self._tasks),
+            "max_concurrency": self.max_concurrency,
+            "shared_calls": len(self._shared_calls)
+        }
@@ -0,0 +1,127 @@
+"""
+Checkpoint Store - Durable per-step results so failed plans can be resumed
+"""
+
+import sqlite3
+import time
+import uuid
+from typing import Dict, Optional, Tuple
+
+from agents.planner import ExecutionPlan
+from tools.base import ToolResult
+
+
+class CheckpointStore:
+    """
+    SQLite store of execution plans and the result of every finished step.
+    
+    Each step result is committed as soon as the step finishes, so a plan
+    that fails partway through can be resumed without repeating the calls
+    that already succeeded.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS executions (
+            execution_id TEXT PRIMARY KEY,
+            plan TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS step_results (
+            execution_id TEXT NOT NULL REFERENCES executions(execution_id),
+            step_id INTEGER NOT NULL,
+            result TEXT NOT NULL,
+            updated_at REAL NOT NULL,
+            PRIMARY KEY (execution_id, step_id)
+        );
+    """
+    
+    def __init__(self, path: str):
+        """
+        Initialize checkpoint store.
+        
+        Args:
+            path: SQLite database file (":memory:" keeps checkpoints in process)
+        """
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema on first use."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(self.SCHEMA)
+        return self._connection
+    
+    def create_execution(self, plan: ExecutionPlan) -> str:
+        """
+        Record a new execution of a plan.
+        
+        Returns:
+            Execution ID used to checkpoint and resume the plan
+        """
+        execution_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO executions VALUES (?, ?, ?, ?, ?)",
+                (execution_id, plan.model_dump_json(), "running", now, now)
+            )
+        return execution_id
+    
+    def save_result(self, execution_id: str, step_id: int, result: ToolResult) -> None:
+        """Checkpoint the latest result of a step."""
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO step_results VALUES (?, ?, ?, ?)",
+                (execution_id, step_id, result.model_dump_json(), time.time())
+            )
+    
+    def set_status(self, execution_id: str, status: str) -> None:
+        """Update the status of an execution ("running", "success" or "failed")."""
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE executions SET status = ?, updated_at = ? WHERE execution_id = ?",
+                (status, time.time(), execution_id)
+            )
+    
+    def get_status(self, execution_id: str) -> Optional[str]:
+        """Get the status of an execution, or None if it is unknown."""
+        row = self._connect().execute(
+            "SELECT status FROM executions WHERE execution_id = ?", (execution_id,)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def load(self, execution_id: str) -> Tuple[ExecutionPlan, Dict[int, ToolResult]]:
+        """
+        Load a checkpointed execution.
+        
+        Args:
+            execution_id: Execution ID returned by create_execution
+        
+        Returns:
+            Tuple of (plan, step_id -> latest result)
+        """
+        connection = self._connect()
+        row = connection.execute(
+            "SELECT plan FROM executions WHERE execution_id = ?", (execution_id,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Unknown execution: {execution_id}")
+        
+        results = {
+            step_id: ToolResult.model_validate_json(result)
+            for step_id, result in connection.execute(
+                "SELECT step_id, result FROM step_results WHERE execution_id = ?", (execution_id,)
+            )
+        }
+        return ExecutionPlan.model_validate_json(row[0]), results
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,71 @@
+"""
+Step History - Learned per-capability step costs used to estimate plans before running them
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from tools.latency import LatencyTracker
+
+
+class StepHistory:
+    """
+    Rolling record of how executed steps behaved, per capability.
+    
+    Keeps each step's total duration (all attempts and backoff), the number
+    of upstream attempts it took and the size of its result data, so plan
+    estimates follow what the APIs actually do.
+    """
+    
+    def __init__(self, window: int = 256):
+        """
+        Initialize step history.
+        
+        Args:
+            window: Number of most recent steps kept per capability
+        """
+        self.window = window
+        self.durations = LatencyTracker(window)
+        self._attempts: Dict[str, Deque[int]] = {}
+        self._result_sizes: Dict[str, Deque[int]] = {}
+    
+    def record(self, capability: str, duration: float, attempts: int, result_size: int) -> None:
+        """
+        Record one executed step.
+        
+        Args:
+            capability: Capability the step called
+            duration: Seconds from the first attempt to the final result
+            attempts: Upstream attempts made
+            result_size: Characters of the result data as JSON
+        """
+        self.durations.record(capability, duration)
+        for samples, value in ((self._attempts, attempts), (self._result_sizes, result_size)):
+            if capability not in samples:
+                samples[capability] = deque(maxlen=self.window)
+            samples[capability].append(value)
+    
+    def duration(self, capability: str, pct: float) -> Optional[float]:
+        """Get a step duration percentile, or None without history."""
+        return self.durations.percentile(capability, pct)
+    
+    def mean_attempts(self, capability: str) -> Optional[float]:
+        """Get the mean number of attempts per step, or None without history."""
+        samples = self._attempts.get(capability)
+        return sum(samples) / len(samples) if samples else None
+    
+    def mean_result_size(self, capability: str) -> Optional[float]:
+        """Get the mean result size in characters, or None without history."""
+        samples = self._result_sizes.get(capability)
+        return sum(samples) / len(samples) if samples else None
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get recorded steps, duration percentiles, mean attempts and result size per capability."""
+        return {
+            capability: {
+                **stats,
+                "mean_attempts": self.mean_attempts(capability),
+                "mean_result_size": self.mean_result_size(capability)
+            }
+            for capability, stats in self.durations.get_stats().items()
+        }
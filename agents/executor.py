@@ -3,14 +3,65 @@ Executor Agent - Executes plans and calls APIs
 """
 
 import asyncio
+import heapq
+import itertools
+import json
+import os
 import time
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import uuid
+from collections import deque
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 
+from config import settings
 from llm.base import BaseLLM, LLMMessage
 from tools.registry import ToolRegistry
-from tools.base import ToolResult, ToolStatus
+from tools.base import (
+    ErrorCategory, ToolResult, ToolStatus, call_key, canonicalize_parameters
+)
 from agents.planner import ExecutionPlan, PlanStep
+from agents.retry import RetryPolicy
+from agents.checkpoint import CheckpointStore
+from agents.estimator import StepHistory
+from agents.timeline import StepTimeline, write_chrome_trace
+
+
+class ReadyQueue:
+    """Steps whose dependencies are resolved, highest priority first and FIFO among ties."""
+    
+    def __init__(self, priorities: Optional[Dict[int, float]] = None):
+        """
+        Initialize ready queue.
+        
+        Args:
+            priorities: Mapping of step_id -> priority (missing steps get 0)
+        """
+        self.priorities = priorities or {}
+        self._heap: List[Tuple[float, int, PlanStep]] = []
+        self._counter = itertools.count()
+    
+    def push(self, step: PlanStep) -> None:
+        """Add a ready step."""
+        priority = self.priorities.get(step.step_id, 0.0)
+        heapq.heappush(self._heap, (-priority, next(self._counter), step))
+    
+    def pop(self) -> PlanStep:
+        """Remove and return the highest-priority step."""
+        return heapq.heappop(self._heap)[2]
+    
+    def clear(self) -> None:
+        """Drop all ready steps."""
+        self._heap.clear()
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+@dataclass
+class SharedCall:
+    """Upstream call shared by identical in-flight steps of different plans."""
+    task: asyncio.Task
+    waiters: int = 0
 
 
 @dataclass
@@ -19,56 +70,559 @@ class ExecutionContext:
     plan: ExecutionPlan
     results: Dict[int, ToolResult] = None
     metadata: Dict[str, Any] = None
+    events: Optional[asyncio.Queue] = None  # Receives StepEvents when streaming
+    deadline: Optional[float] = None  # time.monotonic() value the plan must finish by
+    skipped: Dict[int, str] = None  # step_id -> reason the step was never attempted
+    cancelled: Dict[int, str] = None  # step_id -> reason the step was abandoned after a failure
+    retries_remaining: Optional[int] = None  # Plan-wide retry budget left (None = unlimited)
+    calls: Dict[str, Tuple[int, asyncio.Future]] = None  # call key -> (first step_id, result)
+    calls_saved: int = 0  # Steps served by an identical call made earlier in the plan
+    step_index: Dict[int, PlanStep] = None  # step_id -> step
+    execution_id: Optional[str] = None  # Checkpoint ID when a CheckpointStore is configured
+    shared_calls: Optional[Dict[str, SharedCall]] = None  # In-flight calls shared across plans
+    weight: float = 1.0  # Share of a BatchExecutor's capacity relative to other plans
+    started_at: float = 0.0  # time.perf_counter() when the plan started; timeline origin
+    timeline: Dict[int, StepTimeline] = None  # step_id -> timestamps
+    early_dispatch: Optional["EarlyDispatch"] = None  # Calls started while the plan was generated
     
     def __post_init__(self):
+        if self.timeline is None:
+            self.timeline = {}
+        if self.step_index is None:
+            self.step_index = {step.step_id: step for step in self.plan.steps}
         if self.results is None:
             self.results = {}
+        if self.calls is None:
+            self.calls = {}
         if self.metadata is None:
             self.metadata = {}
+        if self.skipped is None:
+            self.skipped = {}
+        if self.cancelled is None:
+            self.cancelled = {}
+
+
+class EarlyDispatch:
+    """
+    Calls started for plan steps while the rest of the plan is still being generated.
+    
+    Pass ``dispatch`` as the planner's ``on_step`` callback and the same object
+    to ``execute_plan``: each dependency-free step starts executing (with the
+    executor's retries and timeouts) as soon as it streams in, and the plan
+    step with the same call key picks up the running call instead of making
+    it again. Calls no step picks up are cancelled when the plan finishes;
+    call ``cancel`` if planning fails.
+    """
+    
+    def __init__(self, executor: "ExecutorAgent", max_calls: Optional[int] = None):
+        """
+        Initialize early dispatch.
+        
+        Args:
+            executor: Executor whose retry, timeout and deadline settings apply
+            max_calls: Maximum calls started before the plan is complete
+                (defaults to the executor's max_concurrency)
+        """
+        self.executor = executor
+        self.max_calls = executor.max_concurrency if max_calls is None else max_calls
+        self._calls: Dict[str, Tuple[PlanStep, ExecutionContext, asyncio.Task]] = {}
+        self.dispatched = 0
+        self.used = 0
+    
+    def dispatch(self, step: PlanStep) -> None:
+        """Start executing a step that has no dependencies."""
+        if step.dependencies or self.dispatched >= self.max_calls:
+            return
+        key = self.executor._get_call_key(step)
+        if key in self._calls:
+            return
+        
+        # Each call runs in its own context until a plan step picks it up
+        context = self.executor._create_context(
+            ExecutionPlan(
+                task_description=step.description,
+                steps=[step],
+                estimated_complexity="simple",
+                required_tools=[],
+                success_criteria=[]
+            ),
+            checkpoint=False
+        )
+        context.started_at = time.perf_counter()
+        task = asyncio.create_task(self.executor._execute_step(step, context))
+        self._calls[key] = (step, context, task)
+        self.dispatched += 1
+    
+    def take(self, key: str) -> Optional[Tuple[PlanStep, ExecutionContext, asyncio.Task]]:
+        """Claim the call started for a call key, if any."""
+        call = self._calls.pop(key, None)
+        if call is not None:
+            self.used += 1
+        return call
+    
+    def cancel(self) -> None:
+        """Cancel calls that no plan step picked up."""
+        for _, _, task in self._calls.values():
+            task.cancel()
+        self._calls.clear()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of calls started early and picked up by the plan."""
+        return {"dispatched": self.dispatched, "used": self.used}
+
+
+@dataclass
+class StepEvent:
+    """Step-level event emitted while a plan is executing."""
+    event: str  # "started", "retried", "succeeded", "failed", "cancelled" or "completed"
+    step_id: Optional[int] = None
+    attempt: int = 0
+    result: Optional[ToolResult] = None
+    execution: Optional[Dict[str, Any]] = None  # Final execution result ("completed" only)
+    timestamp: float = field(default_factory=time.time)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the event to a JSON-friendly dict."""
+        return {
+            "event": self.event,
+            "step_id": self.step_id,
+            "attempt": self.attempt,
+            "result": self.result.model_dump(mode="json") if self.result else None,
+            "execution": self.execution,
+            "timestamp": self.timestamp
+        }
 
 
 class ExecutorAgent:
     """Agent that executes plans and manages API calls."""
     
-    def __init__(self, llm_factory, tool_registry: ToolRegistry):
-        """Initialize executor agent."""
+    MODES = ("sequential", "concurrent")
+    PRIORITIES = ("fifo", "critical_path")
+    
+    # Assumed latency (seconds) of capabilities without recorded history
+    DEFAULT_STEP_LATENCY = 1.0
+    
+    # Verification token estimates: ~4 characters per token, an assumed result
+    # size for capabilities without history, and fixed prompt/response costs
+    # of the verify and format LLM calls beyond the plan and results
+    CHARS_PER_TOKEN = 4
+    DEFAULT_RESULT_SIZE = 2000
+    VERIFICATION_PROMPT_OVERHEAD = 1200
+    VERIFICATION_COMPLETION_TOKENS = 1000
+    
+    def __init__(
+        self,
+        llm_factory,
+        tool_registry: ToolRegistry,
+        mode: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        plan_deadline: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        fail_fast: Optional[bool] = None,
+        priority: Optional[str] = None,
+        trace_dir: Optional[str] = None
+    ):
+        """
+        Initialize executor agent.
+        
+        Args:
+            llm_factory: Factory used to create the recovery LLM
+            tool_registry: Registry used to execute step capabilities
+            mode: "sequential" or "concurrent" (defaults to EXECUTOR_MODE)
+            max_concurrency: Maximum steps in flight in concurrent mode
+                (defaults to EXECUTOR_MAX_CONCURRENCY)
+            plan_deadline: Default seconds a whole plan may take, 0 for no
+                deadline (defaults to EXECUTOR_PLAN_DEADLINE)
+            retry_policy: Decides which failed attempts are retried and how
+                long to back off (defaults to RetryPolicy from settings)
+            checkpoint_store: Store that persists each finished step so failed
+                plans can be resumed (defaults to CHECKPOINT_PATH when
+                CHECKPOINT_ENABLED is true)
+            fail_fast: Cancel in-flight steps as soon as a required step fails
+                in concurrent mode (defaults to EXECUTOR_FAIL_FAST)
+            priority: Order in which ready steps start, "fifo" or
+                "critical_path" (defaults to EXECUTOR_STEP_PRIORITY)
+            trace_dir: Directory that receives a Chrome trace of every
+                execution, empty to disable (defaults to EXECUTOR_TRACE_DIR)
+        """
         self.llm_factory = llm_factory
         self.tool_registry = tool_registry
         self.llm = llm_factory.create_llm()
-        self.max_retries = 3
-        self.retry_delay = 1.0
+        self.retry_policy = retry_policy or RetryPolicy()
+        
+        self.mode = (mode or settings.executor_mode).lower()
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unsupported executor mode: {self.mode}")
+        self.max_concurrency = max(1, max_concurrency or settings.executor_max_concurrency)
+        self.fail_fast = settings.executor_fail_fast if fail_fast is None else fail_fast
+        self.priority = (priority or settings.executor_step_priority).lower()
+        if self.priority not in self.PRIORITIES:
+            raise ValueError(f"Unsupported step priority: {self.priority}")
+        self.trace_dir = settings.executor_trace_dir if trace_dir is None else trace_dir
+        
+        # Per-attempt timeouts and the whole-plan time budget
+        self.step_timeout = float(settings.request_timeout)
+        self.capability_timeouts: Dict[str, float] = dict(settings.capability_timeouts)
+        self.plan_deadline = settings.executor_plan_deadline if plan_deadline is None else plan_deadline
+        
+        if checkpoint_store is None and settings.checkpoint_enabled:
+            checkpoint_store = CheckpointStore(settings.checkpoint_path)
+        self.checkpoint_store = checkpoint_store
+        
+        # Learned from executed steps; used by estimate() and critical-path priority
+        self.step_history = StepHistory()
     
-    async def execute_plan(self, plan: ExecutionPlan) -> Dict[str, Any]:
+    async def execute_plan(
+        self,
+        plan: ExecutionPlan,
+        deadline: Optional[float] = None,
+        early_dispatch: Optional[EarlyDispatch] = None
+    ) -> Dict[str, Any]:
         """
         Execute an execution plan.
         
         Args:
             plan: Execution plan to execute
+            deadline: Seconds the whole plan may take (defaults to plan_deadline)
+            early_dispatch: Calls already started for steps of this plan
+                while it was being generated
+            
+        Returns:
+            Execution results with metadata
+        """
+        context = self._create_context(plan, deadline)
+        context.early_dispatch = early_dispatch
+        return await self._run_plan(context)
+    
+    def create_early_dispatch(self) -> EarlyDispatch:
+        """Create an EarlyDispatch for starting steps of a plan that is still being generated."""
+        return EarlyDispatch(self)
+    
+    async def resume_plan(
+        self,
+        execution_id: str,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Resume a checkpointed execution, re-running only steps that did not succeed.
+        
+        Successful step results are restored from the checkpoint store;
+        failed and unexecuted steps run again under the same execution ID.
+        
+        Args:
+            execution_id: ID from a previous result's ``metadata["execution_id"]``
+            deadline: Seconds the resumed run may take (defaults to plan_deadline)
             
         Returns:
             Execution results with metadata
         """
-        context = ExecutionContext(plan=plan)
+        if self.checkpoint_store is None:
+            raise ValueError("Resuming a plan requires a checkpoint store")
+        
+        plan, results = self.checkpoint_store.load(execution_id)
+        context = self._create_context(plan, deadline, execution_id=execution_id)
+        for step_id, result in results.items():
+            if result.is_success() and step_id in context.step_index:
+                context.results[step_id] = result
+        context.metadata["resumed_steps"] = len(context.results)
+        
+        self.checkpoint_store.set_status(execution_id, "running")
+        return await self._run_plan(context)
+    
+    def _create_context(
+        self,
+        plan: ExecutionPlan,
+        deadline: Optional[float] = None,
+        events: Optional[asyncio.Queue] = None,
+        execution_id: Optional[str] = None,
+        checkpoint: bool = True
+    ) -> ExecutionContext:
+        """Create the execution context, converting the time budget to a deadline."""
+        budget = self.plan_deadline if deadline is None else deadline
+        retry_budget = self.retry_policy.retry_budget
+        if execution_id is None and checkpoint and self.checkpoint_store is not None:
+            execution_id = self.checkpoint_store.create_execution(plan)
+        
+        context = ExecutionContext(
+            plan=plan,
+            events=events,
+            deadline=time.monotonic() + budget if budget and budget > 0 else None,
+            retries_remaining=retry_budget if retry_budget is not None and retry_budget >= 0 else None,
+            execution_id=execution_id
+        )
+        if execution_id is not None:
+            context.metadata["execution_id"] = execution_id
+        return context
+    
+    async def execute_plan_stream(
+        self,
+        plan: ExecutionPlan,
+        deadline: Optional[float] = None,
+        early_dispatch: Optional[EarlyDispatch] = None
+    ) -> AsyncIterator[StepEvent]:
+        """
+        Execute an execution plan, yielding step events as they happen.
+        
+        Yields a "started", "retried", "succeeded", "failed" or "cancelled"
+        StepEvent for each step as soon as it is available, followed by a single
+        "completed" event whose ``execution`` holds the same dict that
+        ``execute_plan`` returns. Closing the generator early cancels the
+        remaining steps.
+        
+        Args:
+            plan: Execution plan to execute
+            deadline: Seconds the whole plan may take (defaults to plan_deadline)
+            early_dispatch: Calls already started for steps of this plan
+                while it was being generated
+            
+        Yields:
+            Step events in the order they occur
+        """
+        events: asyncio.Queue = asyncio.Queue()
+        context = self._create_context(plan, deadline, events)
+        context.early_dispatch = early_dispatch
+        runner = asyncio.create_task(self._run_plan(context))
+        runner.add_done_callback(lambda _: events.put_nowait(None))
         
         try:
-            # Sort steps by dependencies (topological sort)
-            sorted_steps = self._sort_steps_by_dependencies(plan.steps)
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
             
-            # Execute steps in order
-            for step in sorted_steps:
-                if await self._should_execute_step(step, context):
-                    result = await self._execute_step(step, context)
-                    context.results[step.step_id] = result
-                    
-                    # Handle step failure
-                    if result.is_error() and not step.optional:
-                        return self._create_execution_result(context, failed=True)
+            yield StepEvent(event="completed", execution=runner.result())
+        finally:
+            if not runner.done():
+                runner.cancel()
+    
+    async def _run_plan(self, context: ExecutionContext) -> Dict[str, Any]:
+        """Run the plan in the configured scheduler mode and build the result."""
+        context.metadata["scheduler"] = {
+            "mode": self.mode,
+            "max_concurrency": self.max_concurrency if self.mode == "concurrent" else 1,
+            "priority": self.priority if self.mode == "concurrent" else "fifo"
+        }
+        start_time = time.perf_counter()
+        context.started_at = start_time
+        
+        try:
+            if self.mode == "concurrent":
+                failed = await self._run_concurrent(context)
+            else:
+                failed = await self._run_sequential(context)
+            
+            context.metadata["scheduler"]["wall_time"] = time.perf_counter() - start_time
             
-            return self._create_execution_result(context, failed=False)
+            error = None
+            if any(step.step_id in context.skipped and not step.optional for step in context.plan.steps):
+                error = "Plan deadline exceeded"
+            self._checkpoint_status(context, failed)
+            return self._finish_execution(context, failed=failed, error=error)
             
         except Exception as e:
             context.metadata["execution_error"] = str(e)
-            return self._create_execution_result(context, failed=True, error=str(e))
+            self._checkpoint_status(context, True)
+            return self._finish_execution(context, failed=True, error=str(e))
+        
+        finally:
+            if context.early_dispatch is not None:
+                # Calls started for steps the final plan does not have
+                context.early_dispatch.cancel()
+    
+    def _finish_execution(
+        self,
+        context: ExecutionContext,
+        failed: bool,
+        error: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build the execution result and write its Chrome trace if tracing is enabled."""
+        if context.early_dispatch is not None:
+            context.metadata["early_dispatch"] = context.early_dispatch.get_stats()
+        result = self._create_execution_result(context, failed=failed, error=error)
+        if self.trace_dir:
+            os.makedirs(self.trace_dir, exist_ok=True)
+            name = context.execution_id or uuid.uuid4().hex
+            write_chrome_trace(result, os.path.join(self.trace_dir, f"{name}.json"))
+        return result
+    
+    def _step_timeline(self, step: PlanStep, context: ExecutionContext) -> StepTimeline:
+        """Get a step's timeline, creating it on first use."""
+        timeline = context.timeline.get(step.step_id)
+        if timeline is None:
+            timeline = context.timeline[step.step_id] = StepTimeline(
+                step_id=step.step_id, capability=step.capability
+            )
+        return timeline
+    
+    def _elapsed(self, context: ExecutionContext) -> float:
+        """Get seconds since the plan started."""
+        return time.perf_counter() - context.started_at
+    
+    def _mark_ready(self, step: PlanStep, context: ExecutionContext) -> None:
+        """Record when a step's dependencies were resolved."""
+        self._step_timeline(step, context).ready = self._elapsed(context)
+    
+    def _record_result(self, step: PlanStep, result: ToolResult, context: ExecutionContext) -> None:
+        """Store a finished step's result and checkpoint it."""
+        context.results[step.step_id] = result
+        timeline = self._step_timeline(step, context)
+        timeline.finished = self._elapsed(context)
+        if timeline.attempts and (result.metadata or {}).get("cache") != "hit":
+            # Made its own upstream calls (not restored, shared or cached); learn from it
+            self.step_history.record(
+                step.capability,
+                timeline.finished - timeline.attempts[0]["start"],
+                len(timeline.attempts),
+                len(json.dumps(result.data, default=str)) if result.data else 0
+            )
+        if context.execution_id is not None and self.checkpoint_store is not None:
+            self.checkpoint_store.save_result(context.execution_id, step.step_id, result)
+    
+    def _checkpoint_status(self, context: ExecutionContext, failed: bool) -> None:
+        """Record the final status of a checkpointed execution."""
+        if context.execution_id is not None and self.checkpoint_store is not None:
+            self.checkpoint_store.set_status(context.execution_id, "failed" if failed else "success")
+    
+    async def _run_sequential(self, context: ExecutionContext) -> bool:
+        """Execute steps one at a time in topological order. Returns True on failure."""
+        # Sort steps by dependencies (topological sort)
+        sorted_steps = self._sort_steps_by_dependencies(context.plan.steps)
+        
+        # Execute steps in order
+        for step in sorted_steps:
+            if step.step_id in context.results:
+                continue  # Restored from a checkpoint
+            
+            if await self._should_execute_step(step, context):
+                self._mark_ready(step, context)
+                if self._skip_if_past_deadline(step, context):
+                    if not step.optional:
+                        self._cancel_remaining(context, "Plan deadline exceeded")
+                        return True
+                    continue
+                
+                result = await self._execute_or_share(step, context)
+                self._record_result(step, result, context)
+                
+                # Handle step failure
+                if result.is_error() and not step.optional:
+                    self._cancel_remaining(context, f"Required step {step.step_id} failed")
+                    return True
+        
+        return False
+    
+    async def _run_concurrent(self, context: ExecutionContext) -> bool:
+        """
+        Execute steps as soon as their dependencies are resolved.
+        
+        Independent steps run concurrently, with at most ``max_concurrency``
+        steps in flight. Once a required step fails no new steps are started
+        and, with ``fail_fast``, steps already in flight are cancelled (which
+        aborts their HTTP requests). Unfinished steps are recorded as cancelled.
+        
+        Returns:
+            True if a required step failed
+        """
+        steps = context.plan.steps
+        
+        # Validates dependencies and rejects cycles before anything is started
+        sorted_steps = self._sort_steps_by_dependencies(steps)
+        
+        step_map = context.step_index
+        remaining_deps, dependents = self._build_dependency_graph(steps)
+        
+        ready = self._create_ready_queue(sorted_steps, dependents)
+        for step in steps:
+            if remaining_deps[step.step_id] == 0:
+                self._mark_ready(step, context)
+                ready.push(step)
+        in_flight: Dict[asyncio.Task, PlanStep] = {}
+        failed = False
+        failure_reason = None
+        
+        def resolve(step_id: int) -> None:
+            for dependent_id in dependents[step_id]:
+                remaining_deps[dependent_id] -= 1
+                if remaining_deps[dependent_id] == 0:
+                    self._mark_ready(step_map[dependent_id], context)
+                    ready.push(step_map[dependent_id])
+        
+        try:
+            while ready or in_flight:
+                # Launch ready steps up to the concurrency limit
+                while ready and not failed and len(in_flight) < self.max_concurrency:
+                    step = ready.pop()
+                    if step.step_id in context.results:
+                        # Restored from a checkpoint
+                        resolve(step.step_id)
+                    elif not await self._should_execute_step(step, context):
+                        # Skipped steps still unblock their dependents
+                        resolve(step.step_id)
+                    elif self._skip_if_past_deadline(step, context):
+                        if not step.optional and not failed:
+                            failed, failure_reason = True, "Plan deadline exceeded"
+                        resolve(step.step_id)
+                    else:
+                        task = asyncio.create_task(self._execute_or_share(step, context))
+                        in_flight[task] = step
+                
+                if failed:
+                    ready.clear()
+                    if self.fail_fast and in_flight:
+                        await self._cancel_in_flight(in_flight, context, failure_reason)
+                if not in_flight:
+                    continue
+                
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = in_flight.pop(task)
+                    result = task.result()
+                    self._record_result(step, result, context)
+                    
+                    if result.is_error() and not step.optional and not failed:
+                        failed, failure_reason = True, f"Required step {step.step_id} failed"
+                    resolve(step.step_id)
+            
+            if failed:
+                self._cancel_remaining(context, failure_reason)
+        finally:
+            # Only reached with tasks left if the scheduler itself was cancelled
+            for task in in_flight:
+                task.cancel()
+        
+        return failed
+    
+    async def _cancel_in_flight(
+        self,
+        in_flight: Dict[asyncio.Task, PlanStep],
+        context: ExecutionContext,
+        reason: str
+    ) -> None:
+        """Cancel running steps and wait for them to unwind; steps that finished anyway keep their result."""
+        tasks = list(in_flight)
+        for task in tasks:
+            task.cancel()
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for task, outcome in zip(tasks, outcomes):
+            step = in_flight.pop(task)
+            if isinstance(outcome, ToolResult):
+                self._record_result(step, outcome, context)
+            else:
+                context.cancelled[step.step_id] = reason
+                self._emit(context, "cancelled", step, 0)
+    
+    def _cancel_remaining(self, context: ExecutionContext, reason: str) -> None:
+        """Record every step that has not run (and was not skipped) as cancelled."""
+        for step in context.plan.steps:
+            if (
+                step.step_id not in context.results
+                and step.step_id not in context.skipped
+                and step.step_id not in context.cancelled
+            ):
+                context.cancelled[step.step_id] = reason
     
     async def _should_execute_step(self, step: PlanStep, context: ExecutionContext) -> bool:
         """Check if a step should be executed based on dependencies."""
@@ -83,81 +637,450 @@ class ExecutorAgent:
         
         return True
     
+    def _emit(
+        self,
+        context: ExecutionContext,
+        event: str,
+        step: PlanStep,
+        attempt: int,
+        result: Optional[ToolResult] = None
+    ) -> None:
+        """Publish a step event if the plan is being streamed."""
+        if context.events is not None:
+            context.events.put_nowait(
+                StepEvent(event=event, step_id=step.step_id, attempt=attempt, result=result)
+            )
+    
+    def _get_call_key(self, step: PlanStep) -> str:
+        """Get the key identifying a step's upstream call (capability + canonical parameters)."""
+        capability = self.tool_registry.get_capability(step.capability)
+        return call_key(step.capability, canonicalize_parameters(step.parameters, capability))
+    
+    async def _execute_or_share(self, step: PlanStep, context: ExecutionContext) -> ToolResult:
+        """
+        Execute a step, or reuse the result of an identical call in the same plan.
+        
+        The first step to make a given call executes it; later steps with the
+        same capability and canonical parameters wait for and share its result.
+        """
+        self._step_timeline(step, context).started = self._elapsed(context)
+        key = self._get_call_key(step)
+        
+        if key in context.calls:
+            source_step_id, future = context.calls[key]
+            result = await asyncio.shield(future)
+            context.calls_saved += 1
+            
+            shared = result.model_copy(update={
+                "metadata": {**(result.metadata or {}), "shared_from_step": source_step_id}
+            })
+            self._emit(context, "succeeded" if not shared.is_error() else "failed", step, 0, shared)
+            return shared
+        
+        future = asyncio.get_running_loop().create_future()
+        context.calls[key] = (step.step_id, future)
+        early = context.early_dispatch.take(key) if context.early_dispatch is not None else None
+        try:
+            if early is not None:
+                result = await self._join_early_call(step, early, context)
+            elif context.shared_calls is None:
+                result = await self._execute_step(step, context)
+            else:
+                result = await self._join_shared_call(key, step, context)
+        except BaseException:
+            future.cancel()
+            raise
+        
+        future.set_result(result)
+        return result
+    
+    async def _join_early_call(
+        self,
+        step: PlanStep,
+        early: Tuple[PlanStep, ExecutionContext, asyncio.Task],
+        context: ExecutionContext
+    ) -> ToolResult:
+        """
+        Wait for a call started while the plan was generated and adopt its timeline.
+        
+        Its attempts are moved onto this plan's time origin, so they may start
+        before zero (during planning).
+        """
+        early_step, early_context, task = early
+        self._emit(context, "started", step, 1)
+        result = await task
+        
+        offset = early_context.started_at - context.started_at
+        source = self._step_timeline(early_step, early_context)
+        timeline = self._step_timeline(step, context)
+        timeline.attempts = [
+            {**attempt, "start": attempt["start"] + offset, "end": attempt["end"] + offset}
+            for attempt in source.attempts
+        ]
+        timeline.backoffs = [
+            {"start": backoff["start"] + offset, "end": backoff["end"] + offset}
+            for backoff in source.backoffs
+        ]
+        timeline.slot_waits = [
+            {"start": wait["start"] + offset, "end": wait["end"] + offset}
+            for wait in source.slot_waits
+        ]
+        if timeline.attempts:
+            timeline.started = timeline.attempts[0]["start"]
+            timeline.ready = min(timeline.ready, timeline.started) if timeline.ready is not None else timeline.started
+        
+        result = result.model_copy(update={
+            "metadata": {**(result.metadata or {}), "early_dispatch": True}
+        })
+        self._emit(context, "succeeded" if not result.is_error() else "failed", step, len(source.attempts), result)
+        return result
+    
+    async def _join_shared_call(self, key: str, step: PlanStep, context: ExecutionContext) -> ToolResult:
+        """
+        Execute a step through the calls shared by concurrently running plans.
+        
+        The first plan to make a call runs it in its own task; identical steps
+        of other plans wait for that task instead of calling the upstream
+        again. The call is cancelled only once every waiting step is.
+        """
+        shared_calls = context.shared_calls
+        entry = shared_calls.get(key)
+        joined = entry is not None
+        if not joined:
+            entry = SharedCall(task=asyncio.create_task(self._execute_step(step, context)))
+            shared_calls[key] = entry
+            entry.task.add_done_callback(
+                lambda _: shared_calls.pop(key) if shared_calls.get(key) is entry else None
+            )
+        
+        entry.waiters += 1
+        try:
+            result = await asyncio.shield(entry.task)
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.task.done():
+                entry.task.cancel()
+                if shared_calls.get(key) is entry:
+                    del shared_calls[key]
+        
+        if not joined:
+            return result
+        
+        context.calls_saved += 1
+        shared = result.model_copy(update={
+            "metadata": {**(result.metadata or {}), "shared_in_flight": True}
+        })
+        self._emit(context, "succeeded" if not shared.is_error() else "failed", step, 0, shared)
+        return shared
+    
+    def _get_step_timeout(self, capability: str) -> Optional[float]:
+        """Get the per-attempt timeout for a capability (None = no timeout)."""
+        timeout = self.capability_timeouts.get(capability, self.step_timeout)
+        return timeout if timeout and timeout > 0 else None
+    
+    def _remaining_time(self, context: ExecutionContext) -> Optional[float]:
+        """Get seconds left before the plan deadline (None = no deadline)."""
+        if context.deadline is None:
+            return None
+        return context.deadline - time.monotonic()
+    
+    def _skip_if_past_deadline(self, step: PlanStep, context: ExecutionContext) -> bool:
+        """Mark a step skipped if the plan deadline has passed. Returns True if skipped."""
+        remaining = self._remaining_time(context)
+        if remaining is None or remaining > 0:
+            return False
+        
+        context.skipped[step.step_id] = "Plan deadline exceeded before step could start"
+        return True
+    
     async def _execute_step(self, step: PlanStep, context: ExecutionContext) -> ToolResult:
         """Execute a single plan step."""
-        start_time = time.time()
+        start_time = time.perf_counter()
+        timeline = self._step_timeline(step, context)
+        step_timeout = self._get_step_timeout(step.capability)
+        self._emit(context, "started", step, 1)
         
-        for attempt in range(self.max_retries):
+        for attempt in range(self.retry_policy.max_attempts):
+            remaining = self._remaining_time(context)
+            if remaining is None:
+                timeout = step_timeout
+            else:
+                timeout = min(step_timeout, remaining) if step_timeout else remaining
+            
+            attempt_start = self._elapsed(context)
             try:
                 # Prepare execution context
                 execution_context = {
                     "step_id": step.step_id,
                     "attempt": attempt + 1,
                     "previous_results": context.results,
-                    "plan_metadata": context.metadata
+                    "plan_metadata": context.metadata,
+                    "timeout": timeout,  # Seconds the call may run once it holds a concurrency slot
+                    "deadline_remaining": remaining  # Seconds left in the plan budget
                 }
                 
-                # Execute the capability
-                result = await self.tool_registry.execute_capability(
-                    capability=step.capability,
-                    parameters=step.parameters,
-                    context=execution_context
+                # Execute the capability; the registry applies ``timeout`` once
+                # a concurrency slot is held, and the plan deadline bounds the rest
+                result = await asyncio.wait_for(
+                    self.tool_registry.execute_capability(
+                        capability=step.capability,
+                        parameters=step.parameters,
+                        context=execution_context
+                    ),
+                    timeout=remaining
                 )
                 
-                # Add execution time
-                execution_time = time.time() - start_time
-                result.execution_time = execution_time
-                
-                if result.is_success() or result.is_partial():
-                    return result
-                
-                # If we got an error and this isn't the last attempt, retry
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
-                    continue
+            except asyncio.TimeoutError:
+                result = ToolResult(
+                    status=ToolStatus.ERROR,
+                    error=f"Step timed out after {timeout:.1f}s",
+                    metadata={"error_category": ErrorCategory.RETRYABLE.value}
+                )
                 
-                return result
+            except ValueError as e:
+                # Unknown capability or invalid parameters: retrying cannot help
+                result = ToolResult(
+                    status=ToolStatus.ERROR,
+                    error=f"Step execution failed: {str(e)}",
+                    metadata={"error_category": ErrorCategory.PERMANENT.value}
+                )
                 
             except Exception as e:
-                if attempt == self.max_retries - 1:
-                    return ToolResult(
-                        status=ToolStatus.ERROR,
-                        error=f"Step execution failed after {self.max_retries} attempts: {str(e)}",
-                        execution_time=time.time() - start_time
-                    )
+                result = ToolResult(
+                    status=ToolStatus.ERROR,
+                    error=f"Step execution failed after {attempt + 1} attempts: {str(e)}"
+                )
+            
+            # Add execution time (all attempts and backoff; see the timeline for a breakdown)
+            result.execution_time = time.perf_counter() - start_time
+            if execution_context.get("queue_wait"):
+                slot_acquired = execution_context["slot_acquired"] - context.started_at
+                timeline.slot_waits.append({
+                    "start": slot_acquired - execution_context["queue_wait"],
+                    "end": slot_acquired
+                })
+            timeline.attempts.append({
+                "attempt": attempt + 1,
+                "start": attempt_start,
+                "end": self._elapsed(context),
+                "status": result.status.value
+            })
+            
+            if result.is_success() or result.is_partial():
+                self._emit(context, "succeeded", step, attempt + 1, result)
+                return result
+            
+            if self._should_retry(result, attempt + 1, context):
+                delay = self.retry_policy.get_delay(result, attempt + 1)
+                remaining = self._remaining_time(context)
                 
-                await asyncio.sleep(self.retry_delay * (attempt + 1))
+                # Only retry if the backoff fits in the plan budget
+                if remaining is None or remaining > delay:
+                    if context.retries_remaining is not None:
+                        context.retries_remaining -= 1
+                    context.metadata["retries"] = context.metadata.get("retries", 0) + 1
+                    self._emit(context, "retried", step, attempt + 1, result)
+                    backoff_start = self._elapsed(context)
+                    await asyncio.sleep(delay)
+                    timeline.backoffs.append({"start": backoff_start, "end": self._elapsed(context)})
+                    continue
+            
+            self._emit(context, "failed", step, attempt + 1, result)
+            return result
     
-    def _sort_steps_by_dependencies(self, steps: List[PlanStep]) -> List[PlanStep]:
-        """Sort steps topologically based on dependencies."""
-        # Create step lookup
-        step_map = {step.step_id: step for step in steps}
+    def _should_retry(self, result: ToolResult, attempt: int, context: ExecutionContext) -> bool:
+        """Check the retry policy and the plan-wide retry budget."""
+        if context.retries_remaining is not None and context.retries_remaining <= 0:
+            return False
+        return self.retry_policy.should_retry(result, attempt)
+    
+    def _estimate_step_latency(self, capability: str, pct: float = 50) -> float:
+        """
+        Estimate a step's latency percentile.
         
-        # Topological sort
-        visited = set()
-        temp_visited = set()
-        sorted_steps = []
+        Uses recorded step durations (including retries and backoff), then the
+        registry's per-call latency, then DEFAULT_STEP_LATENCY.
+        """
+        estimate = self.step_history.duration(capability, pct)
+        if estimate is not None:
+            return estimate
         
-        def visit(step_id: int):
-            if step_id in temp_visited:
-                raise ValueError(f"Circular dependency detected involving step {step_id}")
-            if step_id in visited:
-                return
-            
-            temp_visited.add(step_id)
-            step = step_map[step_id]
+        estimate = self.tool_registry.latency.percentile(capability, pct)
+        return estimate if estimate is not None else self.DEFAULT_STEP_LATENCY
+    
+    def estimate(self, plan: ExecutionPlan) -> Dict[str, Any]:
+        """
+        Estimate a plan's cost and latency without executing it (dry run).
+        
+        Upstream calls count identical calls once and use each capability's
+        recorded mean attempts. Wall time replays the scheduler with the
+        current mode, concurrency and step priority using p50 and p95 step
+        durations. Verification tokens assume the verifier sends the plan and
+        the expected results to the LLM, sized from recorded result data.
+        
+        Args:
+            plan: Execution plan to estimate
             
-            # Visit dependencies first
-            for dep_id in step.dependencies:
-                visit(dep_id)
+        Returns:
+            Estimated upstream calls, wall time and verification tokens
+        """
+        sorted_steps = self._sort_steps_by_dependencies(plan.steps)
+        _, dependents = self._build_dependency_graph(plan.steps)
+        
+        calls: Dict[str, str] = {}
+        for step in plan.steps:
+            calls.setdefault(self._get_call_key(step), step.capability)
+        upstream_calls = sum(
+            self.step_history.mean_attempts(capability) or 1.0 for capability in calls.values()
+        )
+        
+        wall_time = {}
+        for pct in (50, 95):
+            durations = {step.step_id: self._estimate_step_latency(step.capability, pct) for step in plan.steps}
+            wall_time[f"p{pct}"] = self._simulate_wall_time(sorted_steps, dependents, durations)
+        critical_path = max(self._get_critical_path_lengths(sorted_steps, dependents).values(), default=0.0)
+        
+        result_size = sum(
+            self.step_history.mean_result_size(step.capability) or self.DEFAULT_RESULT_SIZE
+            for step in plan.steps
+        )
+        # The verify and format calls both include the results; verify also includes the plan
+        prompt_chars = 2 * result_size + len(plan.model_dump_json(indent=2))
+        prompt_tokens = self.VERIFICATION_PROMPT_OVERHEAD + int(prompt_chars / self.CHARS_PER_TOKEN)
+        
+        return {
+            "steps": len(plan.steps),
+            "upstream_calls": round(upstream_calls, 2),
+            "unique_calls": len(calls),
+            "wall_time": {**wall_time, "critical_path": critical_path},
+            "scheduler": {
+                "mode": self.mode,
+                "max_concurrency": self.max_concurrency if self.mode == "concurrent" else 1,
+                "priority": self.priority if self.mode == "concurrent" else "fifo"
+            },
+            "verification_tokens": {
+                "prompt": prompt_tokens,
+                "completion": self.VERIFICATION_COMPLETION_TOKENS,
+                "total": prompt_tokens + self.VERIFICATION_COMPLETION_TOKENS
+            },
+            "capabilities_without_history": sorted({
+                step.capability for step in plan.steps
+                if self.step_history.duration(step.capability, 50) is None
+            })
+        }
+    
+    def _simulate_wall_time(
+        self,
+        sorted_steps: List[PlanStep],
+        dependents: Dict[int, List[int]],
+        durations: Dict[int, float]
+    ) -> float:
+        """Replay the scheduler on estimated step durations and return the makespan."""
+        if self.mode == "sequential":
+            return sum(durations.values())
+        
+        remaining_deps, _ = self._build_dependency_graph(sorted_steps)
+        step_map = {step.step_id: step for step in sorted_steps}
+        ready = self._create_ready_queue(sorted_steps, dependents)
+        for step in sorted_steps:
+            if remaining_deps[step.step_id] == 0:
+                ready.push(step)
+        
+        running: List[Tuple[float, int]] = []  # (finish time, step_id)
+        now = 0.0
+        while ready or running:
+            while ready and len(running) < self.max_concurrency:
+                step = ready.pop()
+                heapq.heappush(running, (now + durations[step.step_id], step.step_id))
+            now, step_id = heapq.heappop(running)
+            for dependent_id in dependents[step_id]:
+                remaining_deps[dependent_id] -= 1
+                if remaining_deps[dependent_id] == 0:
+                    ready.push(step_map[dependent_id])
+        return now
+    
+    def _get_critical_path_lengths(
+        self,
+        sorted_steps: List[PlanStep],
+        dependents: Dict[int, List[int]]
+    ) -> Dict[int, float]:
+        """
+        Get each step's estimated latency to the end of the plan along its longest path.
+        
+        Args:
+            sorted_steps: Steps in topological order
+            dependents: step_id -> ids of the steps that depend on it
             
-            temp_visited.remove(step_id)
-            visited.add(step_id)
-            sorted_steps.append(step)
+        Returns:
+            Mapping of step_id -> own latency plus the longest dependent chain
+        """
+        estimates: Dict[str, float] = {}
+        lengths: Dict[int, float] = {}
+        for step in reversed(sorted_steps):
+            if step.capability not in estimates:
+                estimates[step.capability] = self._estimate_step_latency(step.capability)
+            lengths[step.step_id] = estimates[step.capability] + max(
+                (lengths[dependent_id] for dependent_id in dependents[step.step_id]), default=0.0
+            )
+        return lengths
+    
+    def _create_ready_queue(
+        self,
+        sorted_steps: List[PlanStep],
+        dependents: Dict[int, List[int]]
+    ) -> ReadyQueue:
+        """Create the ready queue for the configured step priority."""
+        if self.priority == "critical_path":
+            return ReadyQueue(self._get_critical_path_lengths(sorted_steps, dependents))
+        return ReadyQueue()
+    
+    def _build_dependency_graph(
+        self,
+        steps: List[PlanStep]
+    ) -> Tuple[Dict[int, int], Dict[int, List[int]]]:
+        """
+        Build in-degree counters and reverse edges for a plan in O(V + E).
+        
+        Returns:
+            Tuple of (step_id -> number of distinct dependencies,
+            step_id -> ids of the steps that depend on it)
+        """
+        in_degree = {step.step_id: 0 for step in steps}
+        dependents: Dict[int, List[int]] = {step.step_id: [] for step in steps}
         
         for step in steps:
-            if step.step_id not in visited:
-                visit(step.step_id)
+            for dep_id in dict.fromkeys(step.dependencies):
+                if dep_id not in dependents:
+                    raise ValueError(f"Step {step.step_id} depends on non-existent step {dep_id}")
+                dependents[dep_id].append(step.step_id)
+                in_degree[step.step_id] += 1
+        
+        return in_degree, dependents
+    
+    def _sort_steps_by_dependencies(self, steps: List[PlanStep]) -> List[PlanStep]:
+        """
+        Sort steps topologically based on dependencies (Kahn's algorithm).
+        
+        Iterative, so long dependency chains cannot hit the recursion limit.
+        Independent steps keep their plan order.
+        """
+        step_map = {step.step_id: step for step in steps}
+        in_degree, dependents = self._build_dependency_graph(steps)
+        
+        ready = deque(step.step_id for step in steps if in_degree[step.step_id] == 0)
+        sorted_steps = []
+        
+        while ready:
+            step_id = ready.popleft()
+            sorted_steps.append(step_map[step_id])
+            for dependent_id in dependents[step_id]:
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    ready.append(dependent_id)
+        
+        if len(sorted_steps) < len(steps):
+            step_id = next(step.step_id for step in steps if in_degree[step.step_id] > 0)
+            raise ValueError(f"Circular dependency detected involving step {step_id}")
         
         return sorted_steps
     
@@ -173,7 +1096,7 @@ class ExecutorAgent:
         partial_steps = []
         
         for step_id, result in context.results.items():
-            step = next(s for s in context.plan.steps if s.step_id == step_id)
+            step = context.step_index[step_id]
             
             if result.is_success():
                 successful_steps.append({
@@ -198,6 +1121,26 @@ class ExecutorAgent:
                     "error": result.error
                 })
         
+        skipped_steps = []
+        for step in context.plan.steps:
+            if step.step_id in context.skipped:
+                skipped_steps.append({
+                    "step_id": step.step_id,
+                    "description": step.description,
+                    "capability": step.capability,
+                    "reason": context.skipped[step.step_id]
+                })
+        
+        cancelled_steps = []
+        for step in context.plan.steps:
+            if step.step_id in context.cancelled:
+                cancelled_steps.append({
+                    "step_id": step.step_id,
+                    "description": step.description,
+                    "capability": step.capability,
+                    "reason": context.cancelled[step.step_id]
+                })
+        
         total_execution_time = sum(
             result.execution_time or 0 for result in context.results.values()
         )
@@ -210,18 +1153,31 @@ class ExecutorAgent:
                 "successful_steps": len(successful_steps),
                 "failed_steps": len(failed_steps),
                 "partial_steps": len(partial_steps),
+                "skipped_steps": len(skipped_steps),
+                "cancelled_steps": len(cancelled_steps),
+                "calls_saved": context.calls_saved,
                 "total_execution_time": total_execution_time
             },
             "results": {
                 "successful": successful_steps,
                 "failed": failed_steps,
-                "partial": partial_steps
+                "partial": partial_steps,
+                "skipped": skipped_steps,
+                "cancelled": cancelled_steps
             },
             "data": {
                 step_id: result.data 
                 for step_id, result in context.results.items() 
                 if result.data
             },
+            "timeline": {
+                "wall_time": context.metadata.get("scheduler", {}).get("wall_time"),
+                "steps": [
+                    context.timeline[step.step_id].to_dict()
+                    for step in context.plan.steps
+                    if step.step_id in context.timeline
+                ]
+            },
             "metadata": context.metadata,
             "error": error
         }
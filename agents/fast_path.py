@@ -0,0 +1,210 @@
+"""
+Fast-Path Planner - Deterministic plans for simple single-capability requests
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from agents.planner import ExecutionPlan, PlanStep
+from tools.registry import ToolRegistry
+
+
+CITY = r"(?P<city>[^\W\d_][\w.'-]*(?: [^\W\d_][\w.'-]*){0,2}?)"  # Up to 3 words
+USERNAME = r"(?P<username>[a-z\d](?:[a-z\d-]{0,38}))"
+REPOSITORY = r"(?P<owner>[\w.-]+)/(?P<repo>[\w.-]+)"
+TOPIC = r"(?P<query>[^\W_][\w .'+#-]*?)"
+INFO = r"(?:(?:get |show |fetch )?(?:me )?(?:info(?:rmation)?|details|stats|profile) (?:on|about|for|of) )?(?:the )?"
+WHEN = r"(?: (?:right now|now|today))?"
+
+# Slot values containing these could mean a second intent; leave them to the LLM
+AMBIGUOUS_PATTERN = re.compile(
+    r"\b(?:and|or|vs|versus|then|compare|weather|forecast|news|headlines|github|repo|repos|repository|user)\b|[,;&]",
+    re.IGNORECASE
+)
+
+# City values containing these carry a qualifier (time, units, trip details)
+# the single-call plan would drop, filler the weather API would not resolve
+# ("london please"), or name a region rather than a city ("the UK"); leave
+# them to the LLM
+CITY_QUALIFIER_PATTERN = re.compile(
+    r"\b(?:today|tonight|tomorrow|yesterday|now|next|this|last|week|weekend|month|morning|afternoon|"
+    r"evening|night|hourly|daily|days?|hours?|celsius|fahrenheit|kelvin|metric|imperial|units?|degrees|"
+    r"in|at|on|for|to|from|of|by|with|during|near|around|my|our|your|his|her|their|its|me|us|i|we|"
+    r"the|a|an|please|pls|plz|thanks|thank|thx|kindly)\b",
+    re.IGNORECASE
+)
+
+
+@dataclass
+class IntentRule:
+    """Compiled patterns that map a whole request onto one capability call."""
+    capability: str
+    patterns: List[str]
+    description: str  # Step description; formatted with the slot values
+    success_criterion: str
+    parameters: Dict[str, Any] = field(default_factory=dict)  # Fixed parameters added to the slots
+    compiled: List[Pattern] = field(init=False)
+    
+    def __post_init__(self):
+        self.compiled = [re.compile(pattern, re.IGNORECASE) for pattern in self.patterns]
+    
+    def match(self, text: str) -> Optional[Dict[str, str]]:
+        """Get the slot values if any pattern matches the whole text."""
+        for pattern in self.compiled:
+            match = pattern.fullmatch(text)
+            if match:
+                return {name: value.strip() for name, value in match.groupdict().items() if value}
+        return None
+
+
+DEFAULT_RULES = [
+    IntentRule(
+        capability="get_current_weather",
+        patterns=[
+            rf"(?:what(?:'s| is) )?(?:the )?(?:current )?weather (?:like )?(?:in|for|at) {CITY}{WHEN}",
+            rf"(?:current )?{CITY} weather{WHEN}"
+        ],
+        description="Get current weather for {city}",
+        success_criterion="Current weather for {city} retrieved"
+    ),
+    IntentRule(
+        capability="get_weather_forecast",
+        patterns=[
+            rf"(?:what(?:'s| is) )?(?:the )?(?:weather )?forecast (?:in|for) {CITY}",
+            rf"{CITY} (?:weather )?forecast"
+        ],
+        description="Get weather forecast for {city}",
+        success_criterion="Weather forecast for {city} retrieved"
+    ),
+    IntentRule(
+        capability="get_user_info",
+        patterns=[
+            rf"{INFO}github user {USERNAME}",
+            rf"{INFO}{USERNAME} on github"
+        ],
+        description="Get GitHub user information for {username}",
+        success_criterion="GitHub user {username} retrieved"
+    ),
+    IntentRule(
+        capability="get_repository",
+        patterns=[rf"{INFO}(?:github )?(?:repo|repository) {REPOSITORY}"],
+        description="Get GitHub repository {owner}/{repo}",
+        success_criterion="Repository {owner}/{repo} retrieved"
+    ),
+    IntentRule(
+        capability="get_top_headlines",
+        patterns=[
+            rf"(?:(?:show |get )(?:me )?)?(?:the )?(?:top |latest )?(?:news )?headlines (?:about|on|for) {TOPIC}",
+            r"(?:(?:show |get )(?:me )?)?(?:the )?(?:top |latest )?(?P<category>[a-z]+) (?:news|headlines)"
+        ],
+        description="Get top headlines about {query}{category}",
+        success_criterion="Headlines retrieved"
+    )
+]
+
+
+class FastPathPlanner:
+    """
+    Rule-based planner for requests that need exactly one capability call.
+    
+    A request is planned only if it matches exactly one rule, its slot values
+    look like single entities, and they fit the capability's declared
+    parameters (names and enums). Everything else returns None and goes to
+    the LLM planner.
+    """
+    
+    def __init__(self, tool_registry: ToolRegistry, rules: Optional[List[IntentRule]] = None):
+        """
+        Initialize fast-path planner.
+        
+        Args:
+            tool_registry: Registry providing capability definitions
+            rules: Intent rules (defaults to DEFAULT_RULES)
+        """
+        self.tool_registry = tool_registry
+        self.rules = DEFAULT_RULES if rules is None else rules
+        self.hits = 0
+        self.misses = 0
+    
+    def plan(self, user_input: str) -> Optional[ExecutionPlan]:
+        """
+        Plan a simple request without the LLM.
+        
+        Args:
+            user_input: Natural language task description
+        
+        Returns:
+            Single-step plan (not yet validated), or None to fall through to the LLM
+        """
+        plan = self._plan(user_input)
+        if plan is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return plan
+    
+    def _plan(self, user_input: str) -> Optional[ExecutionPlan]:
+        """Match the rules and build the plan."""
+        text = " ".join(user_input.split()).rstrip("?!. ")
+        matches: List[Tuple[IntentRule, Dict[str, str]]] = []
+        for rule in self.rules:
+            slots = rule.match(text)
+            if slots is not None:
+                matches.append((rule, slots))
+        if len(matches) != 1:
+            return None
+        
+        rule, slots = matches[0]
+        if any(AMBIGUOUS_PATTERN.search(value) for value in slots.values()):
+            return None
+        if "city" in slots and CITY_QUALIFIER_PATTERN.search(slots["city"]):
+            return None
+        parameters = self._fill_parameters(rule, slots)
+        if parameters is None:
+            return None
+        
+        tool = self.tool_registry.get_tool_for_capability(rule.capability)
+        template_fields = re.findall(r"{(\w+)}", rule.description + rule.success_criterion)
+        values = {name: slots.get(name, "") for name in template_fields}
+        step = PlanStep(
+            step_id=1,
+            capability=rule.capability,
+            parameters=parameters,
+            description=rule.description.format(**values)
+        )
+        return ExecutionPlan(
+            task_description=user_input,
+            steps=[step],
+            estimated_complexity="simple",
+            required_tools=[tool.name] if tool is not None else [],
+            success_criteria=[rule.success_criterion.format(**values)]
+        )
+    
+    def _fill_parameters(self, rule: IntentRule, slots: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """Map slot values onto the capability's parameters, or None if they do not fit."""
+        capability = self.tool_registry.get_capability(rule.capability)
+        if capability is None:
+            return None
+        
+        declared = {param.name: param for param in capability.parameters}
+        parameters = dict(rule.parameters)
+        for name, value in slots.items():
+            param = declared.get(name)
+            if param is None:
+                return None
+            if param.enum:
+                value = value.lower()
+                if value not in param.enum:
+                    return None
+            parameters[name] = value
+        return parameters
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fast-path hit/miss statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0
+        }
@@ -0,0 +1,109 @@
+"""
+Plan Cache - TTL + LRU cache of validated execution plans keyed by normalized input
+"""
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from agents.planner import ExecutionPlan  # planner imports this module
+
+
+# Punctuation that does not change a word's meaning when it leads or trails it;
+# "+", "#", "/", "-" and inner dots are kept ("c++", "c#", "node.js", "owner/repo")
+EDGE_PUNCTUATION = "?!.,;:'\"`()[]{}\u2018\u2019\u201c\u201d"
+
+
+def normalize_task(user_input: str) -> str:
+    """
+    Normalize a task so trivially different phrasings share a cache key.
+    
+    Case-folds, strips sentence punctuation and quotes from the edges of
+    words and collapses whitespace, e.g. "Weather in  London?" ->
+    "weather in london". Punctuation that can carry meaning is kept, so
+    "top c++ repos" and "top c repos" get different keys.
+    """
+    text = user_input.casefold().replace("\u2019", "'")  # Typographic apostrophe
+    words = (word.strip(EDGE_PUNCTUATION) for word in text.split())
+    return " ".join(word for word in words if word)
+
+
+class PlanCache:
+    """
+    Cache of validated plans keyed by normalized user input.
+    
+    Entries expire after ``ttl`` seconds and the least recently used entry is
+    evicted once more than ``max_entries`` are held. Plans are copied on the
+    way in and out, so callers may modify the plans they get.
+    """
+    
+    def __init__(self, ttl: float = 900, max_entries: int = 512):
+        """
+        Initialize plan cache.
+        
+        Args:
+            ttl: Seconds a cached plan stays fresh
+            max_entries: Maximum number of cached plans
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        
+        # key -> (expires_at, plan); order is least to most recently used
+        self._entries: "OrderedDict[str, Tuple[float, 'ExecutionPlan']]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, user_input: str) -> Optional["ExecutionPlan"]:
+        """
+        Get a fresh cached plan for a task.
+        
+        Args:
+            user_input: Natural language task description
+        
+        Returns:
+            Copy of the cached plan (with this task as its description) or None on a miss
+        """
+        key = normalize_task(user_input)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        plan = entry[1].model_copy(deep=True)
+        plan.task_description = user_input
+        return plan
+    
+    def set(self, user_input: str, plan: "ExecutionPlan") -> None:
+        """Cache a validated plan for a task."""
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        
+        key = normalize_task(user_input)
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, plan.model_copy(deep=True))
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions
+        }
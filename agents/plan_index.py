@@ -0,0 +1,275 @@
+"""
+Plan Index - Reuses plans of previously successful tasks for near-duplicate requests
+"""
+
+import math
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from agents.planner import ExecutionPlan  # planner imports this module
+
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Words that do not change which plan a task needs ("paris weather now" ~ "weather in paris")
+FILLER_WORDS = frozenset({
+    "a", "an", "the", "in", "at", "on", "of", "for", "to", "from", "by", "with", "about",
+    "what", "whats", "s", "is", "are", "was", "how", "me", "my", "i", "you", "please",
+    "show", "tell", "get", "give", "find", "fetch", "list", "check", "look", "up",
+    "now", "today", "current", "currently", "right", "like", "some", "any", "there"
+})
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into word tokens."""
+    return WORD_PATTERN.findall(text)
+
+
+def _find_run(tokens: List[str], run: List[str]) -> Optional[int]:
+    """Get the first position of ``run`` as a contiguous sequence in ``tokens``."""
+    for i in range(len(tokens) - len(run) + 1):
+        if tokens[i:i + len(run)] == run:
+            return i
+    return None
+
+
+def _features(template: List[str]) -> Counter:
+    """Character trigrams of each word, each slot placeholder, and intent word bigrams."""
+    features: Counter = Counter()
+    for word in template:
+        if word.startswith("<"):
+            features[word] += 1
+            continue
+        padded = f"#{word}#"
+        for i in range(len(padded) - 2):
+            features[padded[i:i + 3]] += 1
+    # Bigrams of the intent words make their order count ("weather forecast" vs
+    # "forecast weather"); slots are left out so the entity may come first or last
+    words = [word for word in template if not word.startswith("<")]
+    for first, second in zip(words, words[1:]):
+        features[f"{first} {second}"] += 1
+    return features
+
+
+@dataclass
+class PlanSlot:
+    """Entity value of a task that was passed through to plan parameters."""
+    name: str  # Placeholder name (the first parameter that uses the value)
+    value: Any  # Value as it appears in the plan
+    length: int  # Number of words in the value
+    targets: List[Tuple[int, str]] = field(default_factory=list)  # (step_id, parameter) using it
+
+
+@dataclass
+class IndexedPlan:
+    """Successful task and its plan, with entity slots masked out of the task."""
+    plan: "ExecutionPlan"
+    template: List[str]  # Task words without filler, slots replaced by "<name>"
+    slots: List[PlanSlot]  # In order of appearance in the task
+    features: Counter
+    last_used: float = 0.0
+
+
+class PlanIndex:
+    """
+    Local similarity index over successful task -> plan pairs.
+    
+    A task's entity slots are the parameter values (city, repo, username,
+    ...) that appear verbatim in it. Tasks are compared after masking slots
+    and dropping filler words, as TF-IDF weighted character trigrams plus
+    intent word bigrams, so paraphrases still match while word order counts.
+    A near match is reused by substituting the new task's words into the
+    slots, each of which must take exactly as many words as the original
+    value. No embedding service is involved.
+    """
+    
+    def __init__(self, threshold: float = 0.85, max_entries: int = 256):
+        """
+        Initialize plan index.
+        
+        Args:
+            threshold: Minimum cosine similarity (0-1) for a plan to be reused
+            max_entries: Maximum number of indexed plans (least recently used are dropped)
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, ...], IndexedPlan] = {}  # template -> entry
+        self._document_frequency: Counter = Counter()
+        self.lookups = 0
+        self.matches = 0
+    
+    def add(self, user_input: str, plan: "ExecutionPlan") -> None:
+        """Index the plan of a task that executed successfully."""
+        if self.max_entries <= 0:
+            return
+        
+        words = [token.casefold() for token in _tokenize(user_input)]
+        slots: Dict[Tuple[int, int], PlanSlot] = {}
+        for step in plan.steps:
+            for name, value in step.parameters.items():
+                if isinstance(value, bool) or not isinstance(value, (str, int)):
+                    continue
+                value_words = [token.casefold() for token in _tokenize(str(value))]
+                position = _find_run(words, value_words) if value_words else None
+                if position is None:
+                    continue
+                span = (position, len(value_words))
+                if span not in slots:
+                    if any(start < position + span[1] and position < start + length for start, length in slots):
+                        continue  # Overlaps a different value
+                    slots[span] = PlanSlot(name=name, value=value, length=span[1])
+                slots[span].targets.append((step.step_id, name))
+        
+        template = self._mask(words, [(start, length, slot.name) for (start, length), slot in slots.items()])
+        entry = IndexedPlan(
+            plan=plan.model_copy(deep=True),
+            template=template,
+            slots=[slots[span] for span in sorted(slots)],
+            features=_features(template),
+            last_used=time.monotonic()
+        )
+        
+        key = tuple(template)
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._document_frequency.update(entry.features.keys())
+        
+        while len(self._entries) > self.max_entries:
+            self._remove(min(self._entries, key=lambda k: self._entries[k].last_used))
+    
+    def match(self, user_input: str) -> Optional["ExecutionPlan"]:
+        """
+        Get a copy of the most similar indexed plan with this task's slot values.
+        
+        Returns:
+            Plan with substituted parameters, or None if no plan is similar
+            enough or the task's entities cannot be mapped onto its slots.
+            The plan still needs to be validated before use.
+        """
+        self.lookups += 1
+        tokens = _tokenize(user_input)
+        words = [token.casefold() for token in tokens]
+        
+        best: Optional[Tuple[float, IndexedPlan, List[Tuple[int, int]]]] = None
+        for entry in self._entries.values():
+            runs = self._extract_slots(entry, words)
+            if runs is None:
+                continue
+            spans = [(start, length, slot.name) for (start, length), slot in zip(runs, entry.slots)]
+            template = self._mask(words, spans)
+            similarity = self._similarity(_features(template), entry.features)
+            if similarity >= self.threshold and (best is None or similarity > best[0]):
+                best = (similarity, entry, runs)
+        
+        if best is None:
+            return None
+        
+        _, entry, runs = best
+        values = [" ".join(tokens[start:start + length]) for start, length in runs]
+        plan = self._substitute(entry, values)
+        if plan is None:
+            return None
+        
+        entry.last_used = time.monotonic()
+        plan.task_description = user_input
+        self.matches += 1
+        return plan
+    
+    def _mask(self, words: List[str], spans: List[Tuple[int, int, str]]) -> List[str]:
+        """Replace slot spans with "<name>" placeholders and drop filler words."""
+        placeholders = {start: (length, name) for start, length, name in spans}
+        template = []
+        i = 0
+        while i < len(words):
+            if i in placeholders:
+                length, name = placeholders[i]
+                template.append(f"<{name}>")
+                i += length
+                continue
+            if words[i] not in FILLER_WORDS:
+                template.append(words[i])
+            i += 1
+        return template
+    
+    def _extract_slots(self, entry: IndexedPlan, words: List[str]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find the (start, length) runs of words that fill an entry's slots.
+        
+        Words that are neither filler nor part of the entry's task are the new
+        slot values; each contiguous run fills the next slot in order.
+        """
+        known = {word for word in entry.template if not word.startswith("<")} | FILLER_WORDS
+        runs: List[Tuple[int, int]] = []
+        for i, word in enumerate(words):
+            if word in known:
+                continue
+            if runs and runs[-1][0] + runs[-1][1] == i:
+                runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+            else:
+                runs.append((i, 1))
+        
+        if len(runs) != len(entry.slots):
+            return None
+        # A longer run may have absorbed words of the new task's intent
+        # ("forecast Paris", "Paris tomorrow"), so the word count must match
+        if any(length != slot.length for (_, length), slot in zip(runs, entry.slots)):
+            return None
+        return runs
+    
+    def _substitute(self, entry: IndexedPlan, values: List[str]) -> Optional["ExecutionPlan"]:
+        """Copy an entry's plan with new slot values in parameters and descriptions."""
+        plan = entry.plan.model_copy(deep=True)
+        steps = {step.step_id: step for step in plan.steps}
+        for slot, value in zip(entry.slots, values):
+            if isinstance(slot.value, int):
+                if not value.isdigit():
+                    return None
+                value = int(value)
+            for step_id, name in slot.targets:
+                steps[step_id].parameters[name] = value
+            
+            old = re.compile(rf"\b{re.escape(str(slot.value))}\b", re.IGNORECASE)
+            for step in plan.steps:
+                step.description = old.sub(str(value), step.description)
+            plan.success_criteria = [old.sub(str(value), criterion) for criterion in plan.success_criteria]
+        return plan
+    
+    def _similarity(self, features: Counter, indexed: Counter) -> float:
+        """Cosine similarity of two feature counts, IDF-weighted over the index."""
+        total = len(self._entries)
+        
+        def weight(feature: str) -> float:
+            return math.log((1 + total) / (1 + self._document_frequency[feature])) + 1
+        
+        dot = sum(
+            count * indexed[feature] * weight(feature) ** 2
+            for feature, count in features.items()
+            if feature in indexed
+        )
+        if not dot:
+            return 0.0
+        norm = math.sqrt(sum((count * weight(feature)) ** 2 for feature, count in features.items()))
+        indexed_norm = math.sqrt(sum((count * weight(feature)) ** 2 for feature, count in indexed.items()))
+        return dot / (norm * indexed_norm)
+    
+    def _remove(self, key: Tuple[str, ...]) -> None:
+        """Drop an entry and its document frequencies."""
+        entry = self._entries.pop(key)
+        self._document_frequency.subtract(entry.features.keys())
+        self._document_frequency += Counter()  # Drop zero counts
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size and match statistics."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "threshold": self.threshold,
+            "lookups": self.lookups,
+            "matches": self.matches,
+            "match_ratio": self.matches / self.lookups if self.lookups else 0.0
+        }
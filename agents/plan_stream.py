@@ -0,0 +1,107 @@
+"""
+Plan Stream Parser - Extracts plan steps from streamed JSON as each one closes
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+
+class PlanStreamParser:
+    """
+    Incremental JSON scanner for a streamed execution plan.
+    
+    ``feed`` returns each element of the top-level object's ``steps`` array
+    as soon as its closing brace arrives, so steps can be acted on before the
+    rest of the plan has been generated. Text before the opening brace (such
+    as a markdown code fence) is ignored.
+    """
+    
+    def __init__(self, array_key: str = "steps"):
+        """
+        Initialize plan stream parser.
+        
+        Args:
+            array_key: Key of the top-level array whose elements are returned
+        """
+        self.array_key = array_key
+        self._chunks: List[str] = []
+        self._stack: List[str] = []  # Open "{" and "[" brackets
+        self._in_string = False
+        self._escape = False
+        self._string: List[str] = []  # Characters of the current top-level string
+        self._last_string: Optional[str] = None
+        self._key: Optional[str] = None  # Last key seen in the top-level object
+        self._in_array = False  # Inside the top-level ``array_key`` array
+        self._element: Optional[List[str]] = None  # Characters of the current array element
+        self._closed = False  # Top-level object finished
+    
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Scan the next chunk of the stream.
+        
+        Returns:
+            Array elements (decoded objects) completed by this chunk
+        """
+        self._chunks.append(chunk)
+        elements = []
+        for char in chunk:
+            if self._closed or (not self._stack and char != "{"):
+                continue
+            if self._element is not None:
+                self._element.append(char)
+            
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1:
+                        self._last_string = "".join(self._string)
+                elif len(self._stack) == 1:
+                    self._string.append(char)
+                continue
+            
+            if char == '"':
+                self._in_string = True
+                self._string = []
+            elif char == ":" and len(self._stack) == 1:
+                self._key = self._last_string
+            elif char in "{[":
+                if char == "[" and self._stack == ["{"] and self._key == self.array_key:
+                    self._in_array = True
+                elif char == "{" and self._in_array and len(self._stack) == 2:
+                    self._element = ["{"]
+                self._stack.append(char)
+            elif char in "}]":
+                self._stack.pop()
+                if self._element is not None and len(self._stack) == 2:
+                    try:
+                        element = json.loads("".join(self._element))
+                    except ValueError:
+                        element = None  # Left for the full parse to report
+                    if isinstance(element, dict):
+                        elements.append(element)
+                    self._element = None
+                elif char == "]" and len(self._stack) == 1:
+                    self._in_array = False
+                elif not self._stack:
+                    self._closed = True
+        return elements
+    
+    def result(self) -> Dict[str, Any]:
+        """
+        Decode the complete streamed object.
+        
+        Raises:
+            ValueError: If the stream is not a single JSON object
+        """
+        text = "".join(self._chunks)
+        start, end = text.find("{"), text.rfind("}")
+        if start < 0 or end < start:
+            raise ValueError("No JSON object in response")
+        data = json.loads(text[start:end + 1])
+        if not isinstance(data, dict):
+            raise ValueError("Response is not a JSON object")
+        return data
@@ -2,12 +2,19 @@
 Planner Agent - Converts natural language to structured execution plans
 """
 
-import json
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Any, Optional
 from pydantic import BaseModel, Field
 
+from config import settings
 from llm.base import BaseLLM, LLMMessage
+from agents.plan_cache import PlanCache
+from agents.plan_index import PlanIndex
+from agents.plan_stream import PlanStreamParser
 from tools.registry import ToolRegistry
+from tools.validation import mark_validated
+
+if TYPE_CHECKING:
+    from agents.fast_path import FastPathPlanner  # fast_path imports this module
 
 
 class PlanStep(BaseModel):
@@ -32,81 +39,219 @@ class ExecutionPlan(BaseModel):
 class PlannerAgent:
     """Agent that creates execution plans from natural language tasks."""
     
-    def __init__(self, llm_factory, tool_registry: ToolRegistry):
-        """Initialize planner agent."""
+    def __init__(
+        self,
+        llm_factory,
+        tool_registry: ToolRegistry,
+        plan_cache: Optional[PlanCache] = None,
+        plan_index: Optional[PlanIndex] = None,
+        fast_path: Optional["FastPathPlanner"] = None,
+        capability_top_k: Optional[int] = None
+    ):
+        """
+        Initialize planner agent.
+        
+        Args:
+            llm_factory: Factory used to create the planning LLM
+            tool_registry: Registry whose capabilities plans may use
+            plan_cache: Cache of validated plans by normalized input (defaults
+                to one built from PLAN_CACHE_* settings when PLAN_CACHE_ENABLED)
+            plan_index: Similarity index of successful plans reused for
+                near-duplicate tasks (defaults to one built from PLAN_INDEX_*
+                settings when PLAN_INDEX_ENABLED)
+            fast_path: Rule-based planner tried before everything else for
+                simple single-capability requests
+            capability_top_k: Number of capabilities, retrieved by relevance
+                to the task, sent in the planning prompt; the full catalog is
+                used if the plan from them is invalid (0 sends all; defaults
+                to PLANNER_CAPABILITY_TOP_K)
+        """
         self.llm_factory = llm_factory
         self.tool_registry = tool_registry
         self.llm = llm_factory.create_llm()
+        
+        if plan_cache is None and settings.plan_cache_enabled:
+            plan_cache = PlanCache(settings.plan_cache_ttl, settings.plan_cache_max_entries)
+        self.plan_cache = plan_cache
+        
+        if plan_index is None and settings.plan_index_enabled:
+            plan_index = PlanIndex(settings.plan_index_threshold, settings.plan_index_max_entries)
+        self.plan_index = plan_index
+        self.fast_path = fast_path
+        self.capability_top_k = (
+            settings.planner_capability_top_k if capability_top_k is None else capability_top_k
+        )
+        self.retrieval_stats = {"plans": 0, "fallbacks": 0}
+        
+        # System prompt for the registry's catalog_version it was built from
+        self._system_prompt: Optional[str] = None
+        self._system_prompt_version: Any = None
     
-    async def create_plan(self, user_input: str) -> ExecutionPlan:
+    async def create_plan(
+        self,
+        user_input: str,
+        on_step: Optional[Callable[[PlanStep], None]] = None
+    ) -> ExecutionPlan:
         """
         Create an execution plan from natural language input.
         
         Args:
             user_input: Natural language task description
-            
+            on_step: Called with each step that has no dependencies as soon as
+                it has streamed from the LLM and passed validation, before the
+                rest of the plan is generated (e.g. EarlyDispatch.dispatch).
+                Not called for plans that skip the LLM, and the final plan
+                may still be rejected as a whole.
+        
         Returns:
             Structured execution plan
         """
-        # Get available capabilities
-        available_capabilities = self._get_available_capabilities()
+        plan = self._plan_fast_path(user_input)
+        if plan is not None:
+            return plan
         
-        # Create planning prompt
-        messages = [
-            LLMMessage(
-                role="system",
-                content=self._get_planning_system_prompt(available_capabilities)
-            ),
-            LLMMessage(
-                role="user",
-                content=f"Create an execution plan for this task: {user_input}"
-            )
-        ]
+        if self.plan_cache is not None:
+            plan = self.plan_cache.get(user_input)
+            if plan is not None:
+                return plan
         
-        # Generate structured plan
-        plan_schema = ExecutionPlan.model_json_schema()
-        plan_data = await self.llm.generate_structured(
+        plan = self._match_similar_plan(user_input)
+        if plan is not None:
+            return plan
+        
+        capabilities = self._select_capabilities(user_input)
+        if capabilities is not None:
+            self.retrieval_stats["plans"] += 1
+        
+        while True:
+            # Create planning prompt
+            messages = [
+                LLMMessage(
+                    role="system",
+                    content=self._get_system_prompt(capabilities)
+                ),
+                LLMMessage(
+                    role="user",
+                    content=f"Create an execution plan for this task: {user_input}"
+                )
+            ]
+            
+            # Generate structured plan
+            plan_schema = ExecutionPlan.model_json_schema()
+            if on_step is None:
+                plan_data = await self.llm.generate_structured(
+                    messages=messages,
+                    schema=plan_schema,
+                    temperature=0.1
+                )
+            else:
+                plan_data = await self._stream_plan_data(messages, plan_schema, on_step)
+            
+            # Validate and create plan object
+            try:
+                plan = self._validate_plan(ExecutionPlan(**plan_data))
+                break
+            except Exception as e:
+                if capabilities is None:
+                    raise RuntimeError(f"Failed to create valid plan: {e}")
+                # The task may need a capability retrieval missed; plan again with all of them
+                self.retrieval_stats["fallbacks"] += 1
+                capabilities = None
+        
+        if self.plan_cache is not None:
+            self.plan_cache.set(user_input, plan)
+        return plan
+    
+    async def _stream_plan_data(
+        self,
+        messages: List[LLMMessage],
+        plan_schema: Dict[str, Any],
+        on_step: Callable[[PlanStep], None]
+    ) -> Dict[str, Any]:
+        """Stream the plan JSON, handing each valid dependency-free step to ``on_step`` as it closes."""
+        parser = PlanStreamParser()
+        seen = set()
+        async for chunk in self.llm.stream_structured(
             messages=messages,
             schema=plan_schema,
             temperature=0.1
-        )
+        ):
+            for step_data in parser.feed(chunk):
+                try:
+                    step = self._validate_step(PlanStep(**step_data))
+                except Exception:
+                    continue  # Reported when the whole plan is validated
+                if step.step_id not in seen and not step.dependencies:
+                    on_step(step)
+                seen.add(step.step_id)
         
-        # Validate and create plan object
         try:
-            plan = ExecutionPlan(**plan_data)
+            return parser.result()
+        except ValueError as e:
+            raise RuntimeError(f"Invalid JSON plan from LLM stream: {e}")
+    
+    def _plan_fast_path(self, user_input: str) -> Optional[ExecutionPlan]:
+        """Plan a simple single-capability request without the LLM, if the fast path matches."""
+        if self.fast_path is None:
+            return None
+        
+        plan = self.fast_path.plan(user_input)
+        if plan is None:
+            return None
+        try:
             return self._validate_plan(plan)
-        except Exception as e:
-            raise RuntimeError(f"Failed to create valid plan: {e}")
+        except ValueError:
+            return None
     
-    def _get_available_capabilities(self) -> List[Dict[str, Any]]:
-        """Get list of available capabilities from tool registry."""
-        capabilities = []
-        for tool_name in self.tool_registry.list_tools():
-            tool = self.tool_registry.get_tool(tool_name)
-            if tool:
-                for cap in tool.get_capabilities():
-                    capabilities.append({
-                        "name": cap.name,
-                        "description": cap.description,
-                        "tool": tool_name,
-                        "parameters": [
-                            {
-                                "name": p.name,
-                                "type": p.type,
-                                "description": p.description,
-                                "required": p.required,
-                                "default": p.default
-                            }
-                            for p in cap.parameters
-                        ],
-                        "examples": cap.examples
-                    })
+    def _match_similar_plan(self, user_input: str) -> Optional[ExecutionPlan]:
+        """Reuse the plan of a near-duplicate successful task if it validates with the new slot values."""
+        if self.plan_index is None:
+            return None
+        
+        plan = self.plan_index.match(user_input)
+        if plan is None:
+            return None
+        try:
+            plan = self._validate_plan(plan)
+        except ValueError:
+            return None
+        
+        if self.plan_cache is not None:
+            self.plan_cache.set(user_input, plan)
+        return plan
+    
+    def remember_plan(self, user_input: str, plan: ExecutionPlan) -> None:
+        """Index a plan that executed successfully so similar tasks can reuse it."""
+        if self.plan_index is not None:
+            self.plan_index.add(user_input, plan)
+    
+    def _select_capabilities(self, user_input: str) -> Optional[List[str]]:
+        """Get the top-k capabilities relevant to the task, or None to send the full catalog."""
+        k = self.capability_top_k
+        if k <= 0 or len(self.tool_registry.list_capabilities()) <= k:
+            return None
+        capabilities = self.tool_registry.get_relevant_capabilities(user_input, k)
+        if not capabilities:
+            return None  # Nothing matched; let the LLM see everything
         return capabilities
     
-    def _get_planning_system_prompt(self, capabilities: List[Dict[str, Any]]) -> str:
-        """Generate system prompt for planning."""
-        capabilities_text = json.dumps(capabilities, indent=2)
+    def _get_system_prompt(self, capabilities: Optional[List[str]] = None) -> str:
+        """
+        Get the planning system prompt for some capabilities (None for all).
+        
+        The full-catalog prompt is rebuilt only when the registry changes.
+        """
+        if capabilities is not None:
+            return self._get_planning_system_prompt(self.tool_registry.get_catalog_prompt(capabilities))
         
+        version = self.tool_registry.catalog_version
+        if self._system_prompt is None or version != self._system_prompt_version:
+            self._system_prompt = self._get_planning_system_prompt(self.tool_registry.get_catalog_prompt())
+            self._system_prompt_version = version
+        return self._system_prompt
+    
+    def _get_planning_system_prompt(self, capabilities_text: str) -> str:
+        """Generate system prompt for planning."""
         return f"""You are an AI Planning Agent that creates structured execution plans for natural language tasks.
 
 Your job is to:
@@ -115,7 +260,7 @@ Your job is to:
 3. Map each step to available tool capabilities
 4. Create a complete execution plan
 
-Available capabilities:
+Available capabilities (one JSON object per line; parameters are required unless marked optional):
 {capabilities_text}
 
 Guidelines:
@@ -128,22 +273,14 @@ Guidelines:
 
 You must respond with valid JSON following the ExecutionPlan schema.
 Do not include any explanations or text outside the JSON response."""
-    
+
     def _validate_plan(self, plan: ExecutionPlan) -> ExecutionPlan:
         """Validate that the plan is executable."""
         if not plan.steps:
             raise ValueError("Plan must have at least one step")
         
-        # Check that all capabilities exist
         for step in plan.steps:
-            tool = self.tool_registry.get_tool_for_capability(step.capability)
-            if not tool:
-                raise ValueError(f"Unknown capability: {step.capability}")
-            
-            # Validate parameters
-            is_valid, error_msg = tool.validate_parameters(step.capability, step.parameters)
-            if not is_valid:
-                raise ValueError(f"Invalid parameters for {step.capability}: {error_msg}")
+            self._validate_step(step)
         
         # Check dependencies
         step_ids = {step.step_id for step in plan.steps}
@@ -154,6 +291,21 @@ Do not include any explanations or text outside the JSON response."""
         
         return plan
     
+    def _validate_step(self, step: PlanStep) -> PlanStep:
+        """Validate that a step's capability exists and accepts its parameters."""
+        tool = self.tool_registry.get_tool_for_capability(step.capability)
+        if not tool:
+            raise ValueError(f"Unknown capability: {step.capability}")
+        
+        # Validate parameters
+        is_valid, error_msg = tool.validate_parameters(step.capability, step.parameters)
+        if not is_valid:
+            raise ValueError(f"Invalid parameters for {step.capability}: {error_msg}")
+        
+        # Let the registry and tool skip validating these parameters again
+        step.parameters = mark_validated(step.parameters, step.capability)
+        return step
+    
     async def refine_plan(self, plan: ExecutionPlan, feedback: str) -> ExecutionPlan:
         """
         Refine an existing plan based on feedback.
@@ -161,7 +313,7 @@ Do not include any explanations or text outside the JSON response."""
         Args:
             plan: Existing execution plan
             feedback: Feedback for improvement
-            
+        
         Returns:
             Refined execution plan
         """
@@ -0,0 +1,90 @@
+"""
+Retry Policy - Decides whether and when failed plan steps are retried
+"""
+
+import random
+from typing import Optional
+
+from config import settings
+from tools.base import ErrorCategory, ToolResult
+
+
+class RetryPolicy:
+    """
+    Error-classified retry policy with exponential backoff and full jitter.
+    
+    Tools report ``metadata["error_category"]`` (and ``metadata["retry_after"]``
+    for rate limits) on error results. Permanent failures are never retried,
+    rate-limited failures wait for the upstream's reset time, and everything
+    else backs off exponentially. Subclass and override ``should_retry`` or
+    ``get_delay`` to customize.
+    """
+    
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        retry_budget: Optional[int] = None
+    ):
+        """
+        Initialize retry policy.
+        
+        Args:
+            max_attempts: Attempts per step, including the first
+                (defaults to EXECUTOR_MAX_RETRIES)
+            base_delay: Backoff before the first retry, doubled per attempt
+                (defaults to EXECUTOR_RETRY_BASE_DELAY)
+            max_delay: Cap on any single backoff or rate-limit wait
+                (defaults to EXECUTOR_RETRY_MAX_DELAY)
+            retry_budget: Retries allowed across a whole plan
+                (defaults to EXECUTOR_RETRY_BUDGET)
+        """
+        self.max_attempts = max(1, max_attempts if max_attempts is not None else settings.executor_max_retries)
+        self.base_delay = base_delay if base_delay is not None else settings.executor_retry_base_delay
+        self.max_delay = max_delay if max_delay is not None else settings.executor_retry_max_delay
+        self.retry_budget = retry_budget if retry_budget is not None else settings.executor_retry_budget
+    
+    def classify(self, result: ToolResult) -> ErrorCategory:
+        """Get the error category of a failed result (unclassified errors are retryable)."""
+        category = (result.metadata or {}).get("error_category")
+        try:
+            return ErrorCategory(category) if category else ErrorCategory.RETRYABLE
+        except ValueError:
+            return ErrorCategory.RETRYABLE
+    
+    def should_retry(self, result: ToolResult, attempt: int) -> bool:
+        """
+        Check whether a failed attempt should be retried.
+        
+        Args:
+            result: Error result of the attempt
+            attempt: Attempt number that produced the result (1-based)
+        """
+        if attempt >= self.max_attempts:
+            return False
+        
+        category = self.classify(result)
+        if category == ErrorCategory.RATE_LIMITED:
+            # Retrying before the upstream's reset would only be rejected again
+            retry_after = (result.metadata or {}).get("retry_after")
+            return retry_after is None or float(retry_after) <= self.max_delay
+        return category != ErrorCategory.PERMANENT
+    
+    def get_delay(self, result: ToolResult, attempt: int) -> float:
+        """
+        Get seconds to wait before the next attempt.
+        
+        Rate-limited results honor the upstream's ``retry_after``; otherwise
+        the delay is drawn uniformly from [0, base_delay * 2^(attempt - 1)].
+        
+        Args:
+            result: Error result of the attempt
+            attempt: Attempt number that produced the result (1-based)
+        """
+        retry_after = (result.metadata or {}).get("retry_after")
+        if self.classify(result) == ErrorCategory.RATE_LIMITED and retry_after is not None:
+            return float(retry_after)
+        
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, backoff)
@@ -0,0 +1,94 @@
+"""
+Step Timeline - Per-step timestamps of plan execution and Chrome trace export
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class StepTimeline:
+    """
+    Timestamps of one step, in seconds since the plan started (time.perf_counter).
+    
+    ``ready`` is when the step's dependencies were resolved, ``started`` when
+    it began executing (the gap is time spent waiting for a concurrency slot)
+    and ``finished`` when its final result was recorded. ``slot_waits`` are
+    the parts of attempts spent queueing for a ToolRegistry concurrency limit.
+    """
+    step_id: int
+    capability: str
+    ready: Optional[float] = None
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    attempts: List[Dict[str, Any]] = field(default_factory=list)  # attempt, start, end, status
+    backoffs: List[Dict[str, float]] = field(default_factory=list)  # start, end
+    slot_waits: List[Dict[str, float]] = field(default_factory=list)  # start, end
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict with derived queue, run and backoff durations."""
+        data = asdict(self)
+        slot_wait = sum(wait["end"] - wait["start"] for wait in self.slot_waits)
+        data["queue_time"] = (
+            self.started - self.ready + slot_wait
+            if self.started is not None and self.ready is not None else None
+        )
+        data["run_time"] = sum(attempt["end"] - attempt["start"] for attempt in self.attempts) - slot_wait
+        data["backoff_time"] = sum(backoff["end"] - backoff["start"] for backoff in self.backoffs)
+        return data
+
+
+def chrome_trace(execution_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert an execution result's timeline to Chrome trace-event JSON.
+    
+    Load the output in chrome://tracing or https://ui.perfetto.dev. Each step
+    gets its own track with "queued", "attempt N" and "backoff" slices, and
+    "slot wait" slices inside attempts that queued for a concurrency limit.
+    
+    Args:
+        execution_result: Result returned by ExecutorAgent.execute_plan
+    
+    Returns:
+        Trace in the JSON object format ({"traceEvents": [...]})
+    """
+    events: List[Dict[str, Any]] = []
+    
+    def add(name: str, step: Dict[str, Any], start: Optional[float], end: Optional[float], **args: Any) -> None:
+        if start is None or end is None:
+            return
+        events.append({
+            "name": name,
+            "cat": step["capability"],
+            "ph": "X",
+            "pid": 1,
+            "tid": step["step_id"],
+            "ts": start * 1e6,
+            "dur": max(0.0, end - start) * 1e6,
+            "args": args
+        })
+    
+    for step in execution_result.get("timeline", {}).get("steps", []):
+        events.append({
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": step["step_id"],
+            "args": {"name": f"step {step['step_id']} ({step['capability']})"}
+        })
+        add("queued", step, step["ready"], step["started"])
+        for attempt in step["attempts"]:
+            add(f"attempt {attempt['attempt']}", step, attempt["start"], attempt["end"], status=attempt["status"])
+        for backoff in step["backoffs"]:
+            add("backoff", step, backoff["start"], backoff["end"])
+        for wait in step.get("slot_waits", []):
+            add("slot wait", step, wait["start"], wait["end"])
+    
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(execution_result: Dict[str, Any], path: str) -> None:
+    """Write an execution result's timeline to ``path`` as Chrome trace-event JSON."""
+    with open(path, "w") as f:
+        json.dump(chrome_trace(execution_result), f)
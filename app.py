@@ -5,10 +5,12 @@ Provides FastAPI endpoint and Streamlit UI for the multi-agent system
 """
 
 import asyncio
+import json
 import sys
 from typing import Optional, Dict, Any
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 
@@ -58,10 +60,12 @@ async def root():
         "endpoints": {
             "health": "/health",
             "execute": "/execute",
+            "execute_stream": "/execute/stream",
             "docs": "/docs"
         },
         "usage": {
-            "execute": "POST /execute with task parameter"
+            "execute": "POST /execute with task parameter",
+            "execute_stream": "POST /execute/stream with task parameter (NDJSON events)"
         }
     }
 
@@ -112,6 +116,16 @@ async def execute_task(request: TaskRequest):
         )
 
 
+@app.post("/execute/stream")
+async def execute_task_stream(request: TaskRequest):
+    """Execute a task, streaming plan, step and result events as NDJSON."""
+    async def event_lines():
+        async for event in assistant.process_request_stream(request.task):
+            yield json.dumps(event, default=str) + "\n"
+    
+    return StreamingResponse(event_lines(), media_type="application/x-ndjson")
+
+
 @app.get("/agents")
 async def get_agents_info():
     """Get information about available agents."""
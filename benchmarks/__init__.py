@@ -0,0 +1,6 @@
+"""
+Benchmarks - Wall-clock and throughput measurements for the agent pipeline
+
+Benchmarks use stub tools and LLMs so they run without API keys. Run them
+from the repository root, e.g. ``python -m benchmarks.executor_concurrency``.
+"""
@@ -0,0 +1,47 @@
+"""
+Executor Concurrency Benchmark - Sequential vs concurrent wall-clock time
+
+Runs wide plans (independent steps with simulated 50ms upstream latency)
+through ExecutorAgent in both scheduler modes.
+
+    python -m benchmarks.executor_concurrency
+"""
+
+import asyncio
+import time
+
+from agents.executor import ExecutorAgent
+from tools.registry import ToolRegistry
+from benchmarks.stubs import SleepTool, StubLLMFactory, wide_plan
+
+LATENCY = 0.05
+WIDTHS = [1, 5, 10, 25, 50]
+MAX_CONCURRENCY = 8
+
+
+async def time_plan(mode: str, width: int) -> float:
+    registry = ToolRegistry()
+    registry.register_tool(SleepTool(capabilities={"sleep": LATENCY}))
+    executor = ExecutorAgent(
+        StubLLMFactory(), registry, mode=mode, max_concurrency=MAX_CONCURRENCY
+    )
+    
+    start = time.perf_counter()
+    result = await executor.execute_plan(wide_plan(width))
+    elapsed = time.perf_counter() - start
+    
+    assert result["status"] == "success", result["error"]
+    return elapsed
+
+
+async def main() -> None:
+    print(f"Simulated latency {LATENCY * 1000:.0f}ms/step, max_concurrency={MAX_CONCURRENCY}")
+    print(f"{'steps':>6} {'sequential':>12} {'concurrent':>12} {'speedup':>8}")
+    for width in WIDTHS:
+        sequential = await time_plan("sequential", width)
+        concurrent = await time_plan("concurrent", width)
+        print(f"{width:>6} {sequential:>11.3f}s {concurrent:>11.3f}s {sequential / concurrent:>7.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
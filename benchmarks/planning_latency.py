@@ -0,0 +1,141 @@
+"""
+Planning Latency Benchmark - Rule-based fast path vs the LLM planner
+
+Plans a mix of simple and compound requests with the real tool registry.
+Fast-path requests never reach the LLM; the rest fall through to it. The LLM
+path uses the configured provider when an API key is set and it answers,
+and otherwise a simulated LLM that answers after LLM_LATENCY seconds (the
+request timings are then the fast path plus that fixed delay).
+
+    python -m benchmarks.planning_latency
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Any, Dict, List
+
+from agents.fast_path import FastPathPlanner
+from agents.planner import PlannerAgent
+from config import settings
+from llm.factory import LLMFactory
+from tools.github import GitHubTool
+from tools.news import NewsTool
+from tools.registry import ToolRegistry
+from tools.weather import WeatherTool
+
+LLM_LATENCY = 1.5  # Simulated seconds per planning call without a provider
+FAST_PATH_ITERATIONS = 2000
+LLM_REQUESTS = 5
+
+SIMPLE = [
+    "weather in London",
+    "What's the weather like in New York?",
+    "forecast for Tokyo",
+    "info on github user torvalds",
+    "repo facebook/react",
+    "headlines about artificial intelligence",
+    "technology headlines"
+]
+COMPOUND = [
+    "Compare the weather in London and Paris",
+    "Find popular Python repositories and news about Python",
+    "What are the top machine learning repos this week?"
+]
+
+
+class SimulatedLLM:
+    """Planning LLM that answers after a fixed delay with a one-step weather plan."""
+    
+    async def generate_structured(self, messages: List[Any], schema: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        await asyncio.sleep(LLM_LATENCY)
+        return {
+            "task_description": messages[-1].content,
+            "steps": [{
+                "step_id": 1,
+                "capability": "get_current_weather",
+                "parameters": {"city": "London"},
+                "description": "Get current weather for London"
+            }],
+            "estimated_complexity": "simple",
+            "required_tools": ["weather"],
+            "success_criteria": ["Weather retrieved"]
+        }
+
+
+class SimulatedLLMFactory:
+    """Factory for SimulatedLLM."""
+    
+    def create_llm(self, provider: Any = None, model: Any = None) -> SimulatedLLM:
+        return SimulatedLLM()
+
+
+def build_registry() -> ToolRegistry:
+    registry = ToolRegistry()
+    for tool in (GitHubTool(), WeatherTool(), NewsTool()):
+        registry.register_tool(tool)
+    return registry
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+async def main() -> None:
+    registry = build_registry()
+    fast_path = FastPathPlanner(registry)
+    
+    planner = None
+    try:
+        settings.get_llm_provider()
+        planner = PlannerAgent(LLMFactory(), registry, fast_path=fast_path)
+        planner.plan_cache = planner.plan_index = None
+        await planner.create_plan(COMPOUND[0])
+        llm_label = "configured LLM"
+    except Exception as e:
+        if planner is not None:
+            print(f"Configured LLM unavailable ({type(e).__name__}); using the simulated LLM")
+        planner = None
+    
+    if planner is None:
+        planner = PlannerAgent(SimulatedLLMFactory(), registry, fast_path=fast_path)
+        llm_label = f"simulated LLM ({LLM_LATENCY:.1f}s)"
+    # Plan caches are off so every request is actually planned
+    planner.plan_cache = planner.plan_index = None
+    
+    print(f"{'request':<58} {'path':>5} {'p50':>12} {'p99':>12}")
+    for task in SIMPLE + COMPOUND:
+        if fast_path.plan(task) is not None:
+            samples = []
+            for _ in range(FAST_PATH_ITERATIONS):
+                start = time.perf_counter()
+                await planner.create_plan(task)
+                samples.append(time.perf_counter() - start)
+            path = "fast"
+        else:
+            samples = []
+            for _ in range(LLM_REQUESTS):
+                start = time.perf_counter()
+                try:
+                    await planner.create_plan(task)
+                except RuntimeError:
+                    pass  # An invalid plan still cost the LLM round-trip
+                samples.append(time.perf_counter() - start)
+            path = "llm"
+        print(
+            f"{task:<58} {path:>5} {statistics.median(samples) * 1e3:>10.3f}ms "
+            f"{percentile(samples, 99) * 1e3:>10.3f}ms"
+        )
+    
+    # What a fall-through costs the LLM path: matching every rule and failing
+    start = time.perf_counter()
+    for _ in range(FAST_PATH_ITERATIONS):
+        for task in COMPOUND:
+            fast_path.plan(task)
+    miss = (time.perf_counter() - start) / (FAST_PATH_ITERATIONS * len(COMPOUND))
+    print(f"\nLLM path: {llm_label}; fast-path miss overhead {miss * 1e6:.1f}us per request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,161 @@
+"""
+Prompt Size Report - Planner system prompt before and after the compact catalog
+
+Compares the capability catalog as it used to be sent (rebuilt from every
+tool on each plan and dumped with ``json.dumps(indent=2)``) with the
+registry's cached, minified catalog. Tokens are estimated at
+ExecutorAgent.CHARS_PER_TOKEN characters per token, as in executor.estimate().
+
+The second part registers SYNTHETIC_DOMAINS internal tools next to the real
+ones and compares the full catalog with the BM25 top-k capabilities the
+planner sends (PLANNER_CAPABILITY_TOP_K), and checks that each task's
+needed capability is among them.
+
+    python -m benchmarks.prompt_size
+"""
+
+import json
+import time
+from typing import Any, Dict, List
+
+from agents.executor import ExecutorAgent
+from agents.planner import PlannerAgent
+from benchmarks.planning_latency import SimulatedLLMFactory, build_registry
+from tools.base import BaseTool, ToolCapability, ToolParameter
+from tools.registry import ToolRegistry
+
+ITERATIONS = 2000
+TOP_K = 8
+
+SYNTHETIC_DOMAINS = {
+    "jira": "ticket", "calendar": "event", "billing": "invoice", "crm": "contact",
+    "slack": "message", "drive": "document", "hr": "employee", "inventory": "product",
+    "monitoring": "alert", "deploy": "release", "support": "case", "analytics": "report"
+}
+SYNTHETIC_ACTIONS = ["create", "list", "update", "delete"]
+
+# Task -> capabilities its plan needs
+TASKS = {
+    "What's the weather like in New York?": ["get_current_weather"],
+    "Compare the weather in London and Paris": ["get_current_weather"],
+    "Will it rain in Oslo this weekend?": ["get_weather_forecast"],
+    "Find popular Python repositories and news about Python": ["search_repositories", "search_news"],
+    "What are the latest commits in torvalds/linux?": ["list_repository_commits"],
+    "Show the top technology headlines": ["get_top_headlines"],
+    "Create a jira ticket for the login bug": ["jira_create_ticket"],
+    "List open monitoring alerts and today's calendar events": ["monitoring_list_alert", "calendar_list_event"]
+}
+
+
+class CatalogTool(BaseTool):
+    """Internal tool with create/list/update/delete capabilities for one record type."""
+    
+    def __init__(self, name: str, record: str):
+        super().__init__(name=name, description=f"Internal {name} service")
+        self.capabilities = [
+            ToolCapability(
+                name=f"{name}_{action}_{record}",
+                description=f"{action.capitalize()} {record}s in {name}",
+                parameters=[
+                    ToolParameter(name=f"{record}_id", type="string", description=f"{name} {record} identifier", required=action != "create" and action != "list"),
+                    ToolParameter(name="fields", type="object", description=f"{record.capitalize()} fields", required=False)
+                ],
+                examples=[f"{name}_{action}_{record}({record}_id='123')"]
+            )
+            for action in SYNTHETIC_ACTIONS
+        ]
+    
+    async def execute(self, capability, parameters, context=None):
+        raise NotImplementedError
+    
+    def get_capabilities(self):
+        return self.capabilities
+    
+    def validate_parameters(self, capability, parameters):
+        return True, None
+
+
+def legacy_catalog(registry: ToolRegistry) -> List[Dict[str, Any]]:
+    """Capability catalog as the planner built it on every call."""
+    capabilities = []
+    for tool_name in registry.list_tools():
+        tool = registry.get_tool(tool_name)
+        for cap in tool.get_capabilities():
+            capabilities.append({
+                "name": cap.name,
+                "description": cap.description,
+                "tool": tool_name,
+                "parameters": [
+                    {
+                        "name": p.name,
+                        "type": p.type,
+                        "description": p.description,
+                        "required": p.required,
+                        "default": p.default
+                    }
+                    for p in cap.parameters
+                ],
+                "examples": cap.examples
+            })
+    return capabilities
+
+
+def legacy_prompt(registry: ToolRegistry) -> str:
+    return json.dumps(legacy_catalog(registry), indent=2)
+
+
+def per_call(fn: Any) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+def main() -> None:
+    registry = build_registry()
+    planner = PlannerAgent(SimulatedLLMFactory(), registry)
+    
+    before = legacy_prompt(registry)
+    after = registry.get_catalog_prompt()
+    prompt_before = planner._get_planning_system_prompt(before)
+    prompt_after = planner._get_system_prompt()
+    
+    print(f"{'':<24} {'chars':>8} {'~tokens':>8}")
+    for label, text in (
+        ("catalog (indent=2)", before),
+        ("catalog (compact)", after),
+        ("system prompt before", prompt_before),
+        ("system prompt after", prompt_after)
+    ):
+        print(f"{label:<24} {len(text):>8} {len(text) // ExecutorAgent.CHARS_PER_TOKEN:>8}")
+    saved = 1 - len(prompt_after) / len(prompt_before)
+    print(f"\nSystem prompt {saved:.0%} smaller over {len(registry.get_capability_catalog())} capabilities")
+    
+    rebuild = per_call(lambda: planner._get_planning_system_prompt(legacy_prompt(registry)))
+    cached = per_call(planner._get_system_prompt)
+    print(f"Prompt build per plan: {rebuild * 1e6:.1f}us rebuilt, {cached * 1e6:.2f}us cached")
+    
+    for name, record in SYNTHETIC_DOMAINS.items():
+        registry.register_tool(CatalogTool(name, record))
+    planner = PlannerAgent(SimulatedLLMFactory(), registry, capability_top_k=TOP_K)
+    full = len(planner._get_system_prompt()) // ExecutorAgent.CHARS_PER_TOKEN
+    total = len(registry.list_capabilities())
+    
+    print(f"\nWith {len(SYNTHETIC_DOMAINS)} more tools ({total} capabilities), top-{TOP_K} retrieval:")
+    print(f"{'task':<58} {'~tokens':>8} {'recall':>7}")
+    for task, needed in TASKS.items():
+        capabilities = planner._select_capabilities(task)
+        tokens = len(planner._get_system_prompt(capabilities)) // ExecutorAgent.CHARS_PER_TOKEN
+        if capabilities is None:
+            recall = "full"  # No term matched; the planner sends everything
+        else:
+            recall = f"{sum(name in capabilities for name in needed)}/{len(needed)}"
+        print(f"{task:<58} {tokens:>8} {recall:>7}")
+    print(f"{'full catalog':<58} {full:>8}")
+    
+    retrieval = per_call(lambda: planner._select_capabilities("Find popular Python repositories and news about Python"))
+    print(f"Retrieval per plan: {retrieval * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
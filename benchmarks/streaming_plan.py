@@ -0,0 +1,99 @@
+"""
+Streaming Plan Benchmark - Plan-then-execute vs early dispatch while the plan streams
+
+A simulated LLM streams plans of independent steps (plus one summary step
+that depends on all of them) at TOKENS_PER_SECOND, and each step calls a
+stub tool with LATENCY seconds of upstream latency. Compares time from
+request to execution result when the executor waits for the whole plan with
+starting each dependency-free step as soon as its JSON object closes.
+
+    python -m benchmarks.streaming_plan
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List
+
+from agents.executor import ExecutorAgent
+from agents.planner import PlannerAgent
+from benchmarks.stubs import SleepTool, wide_plan
+from tools.registry import ToolRegistry
+
+LATENCY = 0.5
+TOKENS_PER_SECOND = 400  # Plan JSON streamed at ~4 characters per token
+WIDTHS = [1, 3, 6]
+
+
+class StreamingLLM:
+    """Planning LLM that streams a fixed plan at a simulated token rate."""
+    
+    def __init__(self, plan_json: str):
+        self.plan_json = plan_json
+    
+    async def generate_structured(self, messages: List[Any], schema: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        async for _ in self.stream_structured(messages, schema):
+            pass
+        return json.loads(self.plan_json)
+    
+    async def stream_structured(self, messages: List[Any], schema: Dict[str, Any], **kwargs: Any) -> AsyncIterator[str]:
+        for i in range(0, len(self.plan_json), 4):
+            await asyncio.sleep(1 / TOKENS_PER_SECOND)
+            yield self.plan_json[i:i + 4]
+
+
+class StreamingLLMFactory:
+    """Factory for StreamingLLM."""
+    
+    def __init__(self, plan_json: str):
+        self.plan_json = plan_json
+    
+    def create_llm(self, provider: Any = None, model: Any = None) -> StreamingLLM:
+        return StreamingLLM(self.plan_json)
+
+
+def fan_in_plan_json(width: int) -> str:
+    """Plan JSON with ``width`` independent steps and one step that depends on all of them."""
+    plan = wide_plan(width + 1)
+    plan.steps[-1].dependencies = [step.step_id for step in plan.steps[:-1]]
+    plan.steps[-1].description = "Summarize the results of the other steps"
+    return plan.model_dump_json(indent=2)
+
+
+async def time_request(width: int, streaming: bool) -> float:
+    plan_json = fan_in_plan_json(width)
+    registry = ToolRegistry()
+    registry.register_tool(SleepTool(capabilities={"sleep": LATENCY}))
+    factory = StreamingLLMFactory(plan_json)
+    planner = PlannerAgent(factory, registry, capability_top_k=0)
+    planner.plan_cache = planner.plan_index = None
+    executor = ExecutorAgent(factory, registry, mode="concurrent")
+    
+    start = time.perf_counter()
+    if streaming:
+        early_dispatch = executor.create_early_dispatch()
+        plan = await planner.create_plan("benchmark", on_step=early_dispatch.dispatch)
+        result = await executor.execute_plan(plan, early_dispatch=early_dispatch)
+    else:
+        plan = await planner.create_plan("benchmark")
+        result = await executor.execute_plan(plan)
+    elapsed = time.perf_counter() - start
+    
+    assert result["status"] == "success", result["error"]
+    return elapsed
+
+
+async def main() -> None:
+    print(f"Simulated LLM {TOKENS_PER_SECOND} tokens/s, {LATENCY * 1000:.0f}ms/step upstream latency")
+    print(f"{'steps':>6} {'plan chars':>11} {'plan, execute':>14} {'streamed':>10} {'saved':>8}")
+    for width in WIDTHS:
+        baseline = await time_request(width, streaming=False)
+        streamed = await time_request(width, streaming=True)
+        print(
+            f"{width + 1:>6} {len(fan_in_plan_json(width)):>11} {baseline:>13.2f}s "
+            f"{streamed:>9.2f}s {baseline - streamed:>7.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""
+Benchmark Stubs - Offline tools and LLM factory used by the benchmarks
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from agents.planner import ExecutionPlan, PlanStep
+from tools.base import BaseTool, ToolCapability, ToolParameter, ToolResult, ToolStatus
+
+
+class StubLLMFactory:
+    """LLM factory that never talks to a provider."""
+    
+    def create_llm(self, provider: Optional[str] = None, model: Optional[str] = None):
+        """Return no LLM; benchmarks never call one."""
+        return None
+
+
+class SleepTool(BaseTool):
+    """Tool whose capabilities simulate upstream latency with asyncio.sleep."""
+    
+    def __init__(self, name: str = "sleep", capabilities: Optional[Dict[str, float]] = None):
+        """
+        Initialize sleep tool.
+        
+        Args:
+            name: Tool name
+            capabilities: Mapping of capability name -> simulated latency in seconds
+        """
+        super().__init__(name=name, description="Simulated upstream API")
+        self.latencies = capabilities or {"sleep": 0.05}
+        self.calls = 0
+        self.capabilities = [
+            ToolCapability(
+                name=capability,
+                description=f"Sleep for {latency:.3f}s and echo parameters",
+                parameters=[
+                    ToolParameter(
+                        name="key",
+                        type="string",
+                        description="Arbitrary key echoed back in the result",
+                        required=False
+                    )
+                ]
+            )
+            for capability, latency in self.latencies.items()
+        ]
+    
+    async def execute(
+        self,
+        capability: str,
+        parameters: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> ToolResult:
+        """Sleep for the capability's latency and echo the parameters."""
+        self.calls += 1
+        await asyncio.sleep(self.latencies[capability])
+        return ToolResult(status=ToolStatus.SUCCESS, data={"echo": dict(parameters)})
+    
+    def get_capabilities(self) -> List[ToolCapability]:
+        """Get list of available capabilities."""
+        return self.capabilities
+    
+    def validate_parameters(
+        self,
+        capability: str,
+        parameters: Dict[str, Any]
+    ) -> tuple[bool, Optional[str]]:
+        """Accept any parameters for known capabilities."""
+        if capability not in self.latencies:
+            return False, f"Unknown capability: {capability}"
+        return True, None
+
+
+def wide_plan(width: int, capability: str = "sleep") -> ExecutionPlan:
+    """Build a plan of ``width`` independent steps."""
+    steps = [
+        PlanStep(
+            step_id=i,
+            capability=capability,
+            parameters={"key": f"item-{i}"},
+            description=f"Independent step {i}"
+        )
+        for i in range(1, width + 1)
+    ]
+    return ExecutionPlan(
+        task_description=f"Wide plan with {width} steps",
+        steps=steps,
+        estimated_complexity="moderate",
+        required_tools=["sleep"],
+        success_criteria=["All steps succeed"]
+    )
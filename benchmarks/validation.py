@@ -0,0 +1,98 @@
+"""
+Parameter Validation Benchmark - Hand-written validators vs compiled validators and the validated marker
+
+Each step's parameters are validated three times: by the planner, by
+ToolRegistry.execute_capability and by the tool's execute. Times one
+validation, and a step's three validations, with the hand-written validators
+the tools used to have (linear capability scan plus if-chains), with
+validators compiled from the parameter schemas, and with the marker set by
+the first validation letting the other two skip.
+
+    python -m benchmarks.validation
+"""
+
+import timeit
+from typing import Any, Dict, Optional, Tuple
+
+from tools.base import BaseTool
+from tools.github import GitHubTool
+from tools.news import NewsTool
+from tools.validation import mark_validated
+from tools.weather import WeatherTool
+
+NUMBER = 100_000
+
+CALLS = [
+    (GitHubTool, "list_repository_commits", {"owner": "python", "repo": "cpython", "per_page": 5}),
+    (WeatherTool, "get_weather_by_coordinates", {"lat": 51.5074, "lon": -0.1278, "units": "imperial"}),
+    (NewsTool, "get_sources", {"category": "technology", "language": "en", "country": "us"})
+]
+
+
+def legacy_validate(tool: BaseTool, capability: str, parameters: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """Validation as the GitHub, weather and news tools hand-wrote it."""
+    cap = next((c for c in tool.capabilities if c.name == capability), None)
+    if not cap:
+        return False, f"Unknown capability: {capability}"
+    
+    for param in cap.parameters:
+        if param.required and param.name not in parameters:
+            return False, f"Missing required parameter: {param.name}"
+    
+    if capability in ["search_repositories", "list_repository_commits"]:
+        per_page = parameters.get("per_page", 10)
+        if not isinstance(per_page, int) or per_page < 1 or per_page > 100:
+            return False, "per_page must be an integer between 1 and 100"
+    
+    elif capability == "get_weather_by_coordinates":
+        lat = parameters.get("lat")
+        lon = parameters.get("lon")
+        if not isinstance(lat, (int, float)) or not (-90 <= lat <= 90):
+            return False, "lat must be a number between -90 and 90"
+        if not isinstance(lon, (int, float)) or not (-180 <= lon <= 180):
+            return False, "lon must be a number between -180 and 180"
+    
+    elif tool.name == "news":
+        page_size = parameters.get("page_size", 20)
+        if not isinstance(page_size, int) or page_size < 1 or page_size > 100:
+            return False, "page_size must be an integer between 1 and 100"
+        if "country" in parameters:
+            country = parameters["country"]
+            if not isinstance(country, str) or len(country) != 2:
+                return False, "country must be a 2-letter ISO country code"
+        if "language" in parameters:
+            language = parameters["language"]
+            if not isinstance(language, str) or len(language) != 2:
+                return False, "language must be a 2-letter ISO language code"
+    
+    return True, None
+
+
+def time_us(func: Any) -> float:
+    """Best-of-three microseconds per call."""
+    return min(timeit.repeat(func, number=NUMBER, repeat=3)) / NUMBER * 1e6
+
+
+def main() -> None:
+    print(f"{'capability':<28} {'hand-written':>13} {'compiled':>9} {'x3 before':>10} {'x3 marked':>10}")
+    for tool_class, capability, parameters in CALLS:
+        tool = tool_class()
+        assert legacy_validate(tool, capability, parameters) == (True, None)
+        assert tool.validate_parameters(capability, parameters) == (True, None)
+        
+        legacy = time_us(lambda: legacy_validate(tool, capability, parameters))
+        compiled = time_us(lambda: tool.validate_parameters(capability, parameters))
+        
+        def marked_step() -> None:
+            # Planner validates and marks; registry and tool skip
+            tool.validate_parameters(capability, parameters)
+            marked = mark_validated(parameters, capability)
+            tool.validate_parameters(capability, marked)
+            tool.validate_parameters(capability, marked)
+        
+        step = time_us(marked_step)
+        print(f"{capability:<28} {legacy:>11.2f}us {compiled:>7.2f}us {legacy * 3:>8.2f}us {step:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,9 @@ Configuration Management - Application settings and environment variables
 """
 
 import os
-from typing import Optional
-from pydantic import BaseSettings, Field
+from typing import Dict, Optional
+from pydantic import Field
+from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
@@ -28,11 +29,93 @@ class Settings(BaseSettings):
     max_retries: int = Field(3, env="MAX_RETRIES")
     request_timeout: int = Field(30, env="REQUEST_TIMEOUT")
     cache_enabled: bool = Field(True, env="CACHE_ENABLED")
-    cache_ttl: int = Field(3600, env="CACHE_TTL")
+    cache_ttl: int = Field(3600, env="CACHE_TTL")  # Default for capabilities without their own TTL
+    cache_max_entries: int = Field(1024, env="CACHE_MAX_ENTRIES")
+    cache_max_bytes: int = Field(32 * 1024 * 1024, env="CACHE_MAX_BYTES")
+    capability_cache_ttls: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "get_current_weather": 600,
+            "get_weather_by_coordinates": 600,
+            "get_weather_forecast": 1800,
+            "get_top_headlines": 900,
+            "search_news": 900,
+            "get_sources": 21600,
+            "search_repositories": 1800,
+            "get_repository": 1800,
+            "get_user_info": 3600,
+            "list_repository_commits": 600
+        },
+        env="CAPABILITY_CACHE_TTLS"
+    )
+    
+    # Hedged Requests (duplicate slow idempotent calls, capped at a fraction of calls)
+    hedging_enabled: bool = Field(False, env="HEDGING_ENABLED")
+    hedge_percentile: float = Field(95.0, env="HEDGE_PERCENTILE")
+    hedge_min_samples: int = Field(20, env="HEDGE_MIN_SAMPLES")
+    hedge_max_ratio: float = Field(0.1, env="HEDGE_MAX_RATIO")
+    
+    # Circuit Breakers (per tool and per capability)
+    circuit_breaker_enabled: bool = Field(True, env="CIRCUIT_BREAKER_ENABLED")
+    circuit_failure_threshold: int = Field(5, env="CIRCUIT_FAILURE_THRESHOLD")  # Consecutive failures
+    circuit_window: int = Field(20, env="CIRCUIT_WINDOW")  # Recent calls used for the failure rate
+    circuit_failure_rate: float = Field(0.5, env="CIRCUIT_FAILURE_RATE")
+    circuit_reset_timeout: float = Field(30.0, env="CIRCUIT_RESET_TIMEOUT")  # Seconds open before probing
+    circuit_half_open_probes: int = Field(1, env="CIRCUIT_HALF_OPEN_PROBES")
+    
+    # GitHub Rate-Limit Pacing (remaining quota spread evenly until X-RateLimit-Reset)
+    github_pacing_enabled: bool = Field(True, env="GITHUB_PACING_ENABLED")
+    github_pacing_burst: int = Field(5, env="GITHUB_PACING_BURST")  # Requests sent back to back
+    github_pacing_max_wait: float = Field(60.0, env="GITHUB_PACING_MAX_WAIT")  # Longer waits fail as rate-limited; 0 = no limit
+    
+    # Result Post-Processing (payloads of at least POSTPROCESS_THRESHOLD items leave the event loop)
+    postprocess_executor: str = Field("thread", env="POSTPROCESS_EXECUTOR")  # "inline", "thread" or "process"
+    postprocess_max_workers: int = Field(4, env="POSTPROCESS_MAX_WORKERS")
+    postprocess_threshold: int = Field(200, env="POSTPROCESS_THRESHOLD")  # Above real page sizes (<= 100 items)
     
     # Agent Settings
     planner_temperature: float = Field(0.1, env="PLANNER_TEMPERATURE")
+    planner_fast_path_enabled: bool = Field(True, env="PLANNER_FAST_PATH_ENABLED")  # Rule-based plans for simple intents
+    planner_capability_top_k: int = Field(8, env="PLANNER_CAPABILITY_TOP_K")  # Capabilities per planning prompt; 0 = all
+    planner_streaming_enabled: bool = Field(True, env="PLANNER_STREAMING_ENABLED")  # Start dependency-free steps while the plan streams
     executor_max_retries: int = Field(3, env="EXECUTOR_MAX_RETRIES")
+    executor_retry_base_delay: float = Field(0.5, env="EXECUTOR_RETRY_BASE_DELAY")
+    executor_retry_max_delay: float = Field(30.0, env="EXECUTOR_RETRY_MAX_DELAY")
+    executor_retry_budget: int = Field(10, env="EXECUTOR_RETRY_BUDGET")  # Per plan; -1 = unlimited
+    executor_mode: str = Field("concurrent", env="EXECUTOR_MODE")  # "sequential" or "concurrent"
+    executor_max_concurrency: int = Field(8, env="EXECUTOR_MAX_CONCURRENCY")
+    executor_plan_deadline: float = Field(120.0, env="EXECUTOR_PLAN_DEADLINE")  # 0 = no deadline
+    executor_fail_fast: bool = Field(True, env="EXECUTOR_FAIL_FAST")  # Cancel in-flight steps on a required failure
+    executor_step_priority: str = Field("critical_path", env="EXECUTOR_STEP_PRIORITY")  # "fifo" or "critical_path"
+    executor_trace_dir: str = Field("", env="EXECUTOR_TRACE_DIR")  # Chrome trace per execution; empty = off
+    capability_timeouts: Dict[str, float] = Field(
+        default_factory=lambda: {"get_current_weather": 10.0, "get_weather_by_coordinates": 10.0},
+        env="CAPABILITY_TIMEOUTS"
+    )  # Falls back to REQUEST_TIMEOUT
+    
+    # Plan Cache (validated plans keyed by normalized user input)
+    plan_cache_enabled: bool = Field(True, env="PLAN_CACHE_ENABLED")
+    plan_cache_ttl: float = Field(900.0, env="PLAN_CACHE_TTL")
+    plan_cache_max_entries: int = Field(512, env="PLAN_CACHE_MAX_ENTRIES")
+    
+    # Plan Index (successful plans reused for near-duplicate tasks with new entity values)
+    plan_index_enabled: bool = Field(True, env="PLAN_INDEX_ENABLED")
+    plan_index_threshold: float = Field(0.85, env="PLAN_INDEX_THRESHOLD")  # Minimum cosine similarity
+    plan_index_max_entries: int = Field(256, env="PLAN_INDEX_MAX_ENTRIES")
+    
+    # Checkpointing (per-step results persisted so failed plans can be resumed)
+    checkpoint_enabled: bool = Field(False, env="CHECKPOINT_ENABLED")
+    checkpoint_path: str = Field(".checkpoints.db", env="CHECKPOINT_PATH")
+    
+    # Tool Concurrency Limits (0 or missing = unlimited; dicts are JSON in env)
+    tool_global_concurrency: int = Field(16, env="TOOL_GLOBAL_CONCURRENCY")
+    tool_concurrency_limits: Dict[str, int] = Field(
+        default_factory=lambda: {"github": 4, "weather": 8, "news": 4},
+        env="TOOL_CONCURRENCY_LIMITS"
+    )
+    capability_concurrency_limits: Dict[str, int] = Field(
+        default_factory=lambda: {"search_repositories": 2, "search_news": 2},
+        env="CAPABILITY_CONCURRENCY_LIMITS"
+    )
     verifier_temperature: float = Field(0.1, env="VERIFIER_TEMPERATURE")
     
     class Config:
@@ -4,7 +4,7 @@ Anthropic LLM Provider - Integration with Anthropic Claude models
 
 import json
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 import anthropic
 from pydantic import ValidationError
 
@@ -29,17 +29,7 @@ class AnthropicProvider(BaseLLM):
     ) -> LLMResponse:
         """Generate response from Anthropic."""
         try:
-            # Convert messages to Anthropic format
-            anthropic_messages = []
-            system_message = None
-            
-            for msg in messages:
-                if msg.role == "system":
-                    system_message = msg.content
-                elif msg.role == "user":
-                    anthropic_messages.append({"role": "user", "content": msg.content})
-                elif msg.role == "assistant":
-                    anthropic_messages.append({"role": "assistant", "content": msg.content})
+            system_message, anthropic_messages = self._convert_messages(messages)
             
             response = await self.client.messages.create(
                 model=self.model,
@@ -75,36 +65,8 @@ class AnthropicProvider(BaseLLM):
     ) -> Dict[str, Any]:
         """Generate structured response following JSON schema."""
         try:
-            # Add schema instruction to system message
-            schema_instruction = f"""
-You must respond with valid JSON that follows this schema:
-{json.dumps(schema, indent=2)}
-
-Do not include any other text, explanations, or formatting - only the JSON response.
-Your entire response should be a single JSON object.
-"""
-            
-            enhanced_messages = []
-            system_found = False
-            
-            for msg in messages:
-                if msg.role == "system":
-                    enhanced_messages.append(LLMMessage(
-                        role="system",
-                        content=msg.content + "\n\n" + schema_instruction
-                    ))
-                    system_found = True
-                else:
-                    enhanced_messages.append(msg)
-            
-            if not system_found:
-                enhanced_messages.insert(0, LLMMessage(
-                    role="system",
-                    content=schema_instruction
-                ))
-            
             response = await self.generate(
-                messages=enhanced_messages,
+                messages=self._add_schema_instruction(messages, schema),
                 temperature=temperature,
                 max_tokens=max_tokens,
                 **kwargs
@@ -122,10 +84,98 @@ Your entire response should be a single JSON object.
                 return json.loads(content)
             except json.JSONDecodeError as e:
                 raise RuntimeError(f"Invalid JSON response from Anthropic: {e}")
-                
+        
         except Exception as e:
             raise RuntimeError(f"Anthropic structured generation error: {str(e)}")
     
+    async def stream(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream response text from Anthropic as it is generated."""
+        try:
+            system_message, anthropic_messages = self._convert_messages(messages)
+            
+            async with self.client.messages.stream(
+                model=self.model,
+                messages=anthropic_messages,
+                system=system_message,
+                temperature=temperature,
+                max_tokens=max_tokens or 4096,
+                **kwargs
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        
+        except Exception as e:
+            raise RuntimeError(f"Anthropic API error: {str(e)}")
+    
+    async def stream_structured(
+        self,
+        messages: List[LLMMessage],
+        schema: Dict[str, Any],
+        temperature: float = 0.1,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream the raw JSON text of a structured response from Anthropic."""
+        async for text in self.stream(
+            messages=self._add_schema_instruction(messages, schema),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        ):
+            yield text
+    
+    def _convert_messages(self, messages: List[LLMMessage]) -> Tuple[Optional[str], List[Dict[str, str]]]:
+        """Convert messages to Anthropic format (system prompt, conversation)."""
+        anthropic_messages = []
+        system_message = None
+                
+        for msg in messages:
+            if msg.role == "system":
+                system_message = msg.content
+            elif msg.role == "user":
+                anthropic_messages.append({"role": "user", "content": msg.content})
+            elif msg.role == "assistant":
+                anthropic_messages.append({"role": "assistant", "content": msg.content})
+        
+        return system_message, anthropic_messages
+    
+    def _add_schema_instruction(self, messages: List[LLMMessage], schema: Dict[str, Any]) -> List[LLMMessage]:
+        """Add the JSON schema instruction to the system message."""
+        schema_instruction = f"""
+You must respond with valid JSON that follows this schema:
+{json.dumps(schema, indent=2)}
+
+Do not include any other text, explanations, or formatting - only the JSON response.
+Your entire response should be a single JSON object.
+"""
+
+        enhanced_messages = []
+        system_found = False
+        
+        for msg in messages:
+            if msg.role == "system":
+                enhanced_messages.append(LLMMessage(
+                    role="system",
+                    content=msg.content + "\n\n" + schema_instruction
+                ))
+                system_found = True
+            else:
+                enhanced_messages.append(msg)
+        
+        if not system_found:
+            enhanced_messages.insert(0, LLMMessage(
+                role="system",
+                content=schema_instruction
+            ))
+        
+        return enhanced_messages
+    
     def validate_api_key(self) -> bool:
         """Validate Anthropic API key."""
         try:
@@ -2,8 +2,9 @@
 Base LLM Interface - Abstract interface for LLM providers
 """
 
+import json
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 from pydantic import BaseModel
 
 
@@ -54,6 +55,40 @@ class BaseLLM(ABC):
         """Generate structured response following JSON schema."""
         pass
     
+    async def stream(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream response text as it is generated.
+        
+        Providers without streaming yield the whole ``generate`` response once.
+        """
+        response = await self.generate(messages, temperature=temperature, max_tokens=max_tokens, **kwargs)
+        yield response.content
+    
+    async def stream_structured(
+        self,
+        messages: List[LLMMessage],
+        schema: Dict[str, Any],
+        temperature: float = 0.1,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream the raw JSON text of a structured response as it is generated.
+        
+        Providers without streaming yield the ``generate_structured`` result
+        serialized once.
+        """
+        data = await self.generate_structured(
+            messages, schema, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+        yield json.dumps(data)
+    
     @abstractmethod
     def validate_api_key(self) -> bool:
         """Validate that API key is properly configured."""
@@ -4,7 +4,7 @@ OpenAI LLM Provider - Integration with OpenAI GPT models
 
 import json
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 import openai
 from pydantic import ValidationError
 
@@ -32,18 +32,9 @@ class OpenAIProvider(BaseLLM):
     ) -> LLMResponse:
         """Generate response from OpenAI."""
         try:
-            openai_messages = [
-                {"role": msg.role, "content": msg.content, "name": msg.name}
-                for msg in messages if msg.name
-            ]
-            openai_messages.extend([
-                {"role": msg.role, "content": msg.content}
-                for msg in messages if not msg.name
-            ])
-            
             response = await self.client.chat.completions.create(
                 model=self.model,
-                messages=openai_messages,
+                messages=self._convert_messages(messages),
                 temperature=temperature,
                 max_tokens=max_tokens,
                 **kwargs
@@ -74,35 +65,8 @@ class OpenAIProvider(BaseLLM):
     ) -> Dict[str, Any]:
         """Generate structured response following JSON schema."""
         try:
-            # Add schema instruction to system message
-            schema_instruction = f"""
-You must respond with valid JSON that follows this schema:
-{json.dumps(schema, indent=2)}
-
-Do not include any other text, explanations, or formatting - only the JSON response.
-"""
-            
-            enhanced_messages = []
-            system_found = False
-            
-            for msg in messages:
-                if msg.role == "system":
-                    enhanced_messages.append(LLMMessage(
-                        role="system",
-                        content=msg.content + "\n\n" + schema_instruction
-                    ))
-                    system_found = True
-                else:
-                    enhanced_messages.append(msg)
-            
-            if not system_found:
-                enhanced_messages.insert(0, LMMessage(
-                    role="system",
-                    content=schema_instruction
-                ))
-            
             response = await self.generate(
-                messages=enhanced_messages,
+                messages=self._add_schema_instruction(messages, schema),
                 temperature=temperature,
                 max_tokens=max_tokens,
                 response_format={"type": "json_object"},
@@ -114,10 +78,94 @@ Do not include any other text, explanations, or formatting - only the JSON respo
                 return json.loads(response.content)
             except json.JSONDecodeError as e:
                 raise RuntimeError(f"Invalid JSON response from OpenAI: {e}")
-                
+        
         except Exception as e:
             raise RuntimeError(f"OpenAI structured generation error: {str(e)}")
     
+    async def stream(
+        self,
+        messages: List[LLMMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream response text from OpenAI as it is generated."""
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._convert_messages(messages),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **kwargs
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {str(e)}")
+    
+    async def stream_structured(
+        self,
+        messages: List[LLMMessage],
+        schema: Dict[str, Any],
+        temperature: float = 0.1,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream the raw JSON text of a structured response from OpenAI."""
+        async for text in self.stream(
+            messages=self._add_schema_instruction(messages, schema),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            **kwargs
+        ):
+            yield text
+    
+    def _convert_messages(self, messages: List[LLMMessage]) -> List[Dict[str, str]]:
+        """Convert messages to OpenAI format."""
+        openai_messages = [
+            {"role": msg.role, "content": msg.content, "name": msg.name}
+            for msg in messages if msg.name
+        ]
+        openai_messages.extend([
+            {"role": msg.role, "content": msg.content}
+            for msg in messages if not msg.name
+        ])
+        return openai_messages
+    
+    def _add_schema_instruction(self, messages: List[LLMMessage], schema: Dict[str, Any]) -> List[LLMMessage]:
+        """Add the JSON schema instruction to the system message."""
+        schema_instruction = f"""
+You must respond with valid JSON that follows this schema:
+{json.dumps(schema, indent=2)}
+
+Do not include any other text, explanations, or formatting - only the JSON response.
+"""
+
+        enhanced_messages = []
+        system_found = False
+        
+        for msg in messages:
+            if msg.role == "system":
+                enhanced_messages.append(LLMMessage(
+                    role="system",
+                    content=msg.content + "\n\n" + schema_instruction
+                ))
+                system_found = True
+            else:
+                enhanced_messages.append(msg)
+        
+        if not system_found:
+            enhanced_messages.insert(0, LLMMessage(
+                role="system",
+                content=schema_instruction
+            ))
+        
+        return enhanced_messages
+    
     def validate_api_key(self) -> bool:
         """Validate OpenAI API key."""
         try:
@@ -8,14 +8,17 @@ plans execution steps, calls APIs, and returns structured answers.
 
 import asyncio
 import sys
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-from agents.planner import PlannerAgent
-from agents.executor import ExecutorAgent  
+from config import settings
+from agents.planner import ExecutionPlan, PlannerAgent
+from agents.fast_path import FastPathPlanner
+from agents.executor import EarlyDispatch, ExecutorAgent  
+from agents.batch import BatchExecutor
 from agents.verifier import VerifierAgent
 from llm.factory import LLMFactory
 from tools.registry import ToolRegistry
@@ -40,8 +43,13 @@ class AIOpsAssistant:
         self.tool_registry.register_tool(NewsTool())
         
         # Initialize agents
-        self.planner = PlannerAgent(self.llm_factory, self.tool_registry)
-        self.executor = ExecutorAgent(self.llm_factory, self.tool_registry)
+        fast_path = FastPathPlanner(self.tool_registry) if settings.planner_fast_path_enabled else None
+        self.planner = PlannerAgent(self.llm_factory, self.tool_registry, fast_path=fast_path)
+        # Concurrent requests (e.g. from the API) share one fair step scheduler
+        if settings.executor_mode.lower() == "concurrent":
+            self.executor = BatchExecutor(self.llm_factory, self.tool_registry)
+        else:
+            self.executor = ExecutorAgent(self.llm_factory, self.tool_registry)
         self.verifier = VerifierAgent(self.llm_factory)
     
     async def process_request(self, user_input: str) -> dict:
@@ -59,7 +67,8 @@ class AIOpsAssistant:
             
             # Step 1: Planning
             console.print("[yellow]🤔 Planning execution steps...[/yellow]")
-            plan = await self.planner.create_plan(user_input)
+            early_dispatch = self._create_early_dispatch()
+            plan = await self._create_plan(user_input, early_dispatch)
             console.print(Panel(
                 Text(str(plan), style="green"),
                 title="✅ Execution Plan Created",
@@ -68,7 +77,9 @@ class AIOpsAssistant:
             
             # Step 2: Execution
             console.print("[yellow]⚡ Executing plan...[/yellow]")
-            execution_result = await self.executor.execute_plan(plan)
+            execution_result = await self.executor.execute_plan(plan, early_dispatch=early_dispatch)
+            if execution_result["status"] == "success":
+                self.planner.remember_plan(user_input, plan)
             console.print(Panel(
                 Text(str(execution_result), style="blue"),
                 title="⚡ Plan Execution Complete",
@@ -95,6 +106,58 @@ class AIOpsAssistant:
                 border_style="red"
             ))
             return {"error": str(e), "status": "failed"}
+    
+    async def process_request_stream(self, user_input: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a request, yielding progress events as each stage produces them.
+        
+        Yields a "plan" event, then the executor's step events ("started",
+        "retried", "succeeded", "failed", "cancelled", "completed"), then a
+        final "result" event with the verified result. Failures yield an "error" event.
+        
+        Args:
+            user_input: Natural language task description
+            
+        Yields:
+            JSON-friendly event dicts
+        """
+        try:
+            early_dispatch = self._create_early_dispatch()
+            plan = await self._create_plan(user_input, early_dispatch)
+            yield {"event": "plan", "plan": plan.model_dump()}
+            
+            execution_result = None
+            async for step_event in self.executor.execute_plan_stream(plan, early_dispatch=early_dispatch):
+                if step_event.event == "completed":
+                    execution_result = step_event.execution
+                yield step_event.to_dict()
+            
+            if execution_result["status"] == "success":
+                self.planner.remember_plan(user_input, plan)
+            
+            verified_result = await self.verifier.verify_result(
+                user_input, plan, execution_result
+            )
+            yield {"event": "result", "result": verified_result}
+            
+        except Exception as e:
+            yield {"event": "error", "error": str(e), "status": "failed"}
+    
+    def _create_early_dispatch(self) -> Optional[EarlyDispatch]:
+        """Create the EarlyDispatch for a request's streamed plan (None if PLANNER_STREAMING_ENABLED is off)."""
+        if not settings.planner_streaming_enabled:
+            return None
+        return self.executor.create_early_dispatch()
+    
+    async def _create_plan(self, user_input: str, early_dispatch: Optional[EarlyDispatch]) -> ExecutionPlan:
+        """Plan a request, starting dependency-free steps while the plan streams in."""
+        on_step = early_dispatch.dispatch if early_dispatch is not None else None
+        try:
+            return await self.planner.create_plan(user_input, on_step=on_step)
+        except BaseException:
+            if early_dispatch is not None:
+                early_dispatch.cancel()
+            raise
 
 
 @click.command()
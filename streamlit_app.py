@@ -69,6 +69,43 @@ def display_message(role: str, content: str, metadata: dict = None):
                 st.write(content)
 
 
+def run_task_streaming(task: str) -> dict:
+    """Run a task, rendering plan and step events as they arrive."""
+    status = st.status("🤔 Planning...", expanded=True)
+    step_icons = {"started": "⏳", "retried": "🔁", "succeeded": "✅", "failed": "❌"}
+    
+    async def consume() -> dict:
+        result = {"success": False, "error": "No result produced"}
+        async for event in st.session_state.assistant.process_request_stream(task):
+            kind = event["event"]
+            if kind == "plan":
+                status.update(label="⚡ Executing...")
+                status.write(f"📋 Plan with {len(event['plan']['steps'])} step(s) created")
+            elif kind in step_icons:
+                line = f"{step_icons[kind]} Step {event['step_id']} {kind}"
+                if event["attempt"] > 1:
+                    line += f" (attempt {event['attempt']})"
+                status.write(line)
+                if kind == "succeeded" and event["result"] and event["result"].get("data"):
+                    with status.expander(f"Step {event['step_id']} data"):
+                        st.json(event["result"]["data"])
+            elif kind == "completed":
+                status.update(label="🔍 Verifying...")
+            elif kind == "result":
+                result = event["result"]
+            elif kind == "error":
+                result = {"success": False, "error": event["error"]}
+        return result
+    
+    result = asyncio.run(consume())
+    status.update(
+        label="✅ Done" if result.get("success") else "⚠️ Finished with issues",
+        state="complete" if result.get("success") else "error",
+        expanded=False
+    )
+    return result
+
+
 def display_example_prompts():
     """Display example prompts for testing."""
     st.sidebar.markdown("### 🧪 Example Prompts")
@@ -169,26 +206,25 @@ def main():
         # Display user message
         display_message("user", st.session_state.current_task)
         
-        # Process task
-        with st.spinner("🤔 Planning... ⚡ Executing... 🔍 Verifying..."):
-            start_time = time.time()
-            try:
-                result = await st.session_state.assistant.process_request(st.session_state.current_task)
-                execution_time = time.time() - start_time
-                
-                display_message(
-                    "assistant", 
-                    result, 
-                    metadata={"execution_time": execution_time}
-                )
-                
-            except Exception as e:
-                execution_time = time.time() - start_time
-                display_message(
-                    "assistant",
-                    {"success": False, "error": str(e)},
-                    metadata={"execution_time": execution_time}
-                )
+        # Process task, showing step results as they complete
+        start_time = time.time()
+        try:
+            result = run_task_streaming(st.session_state.current_task)
+            execution_time = time.time() - start_time
+            
+            display_message(
+                "assistant", 
+                result, 
+                metadata={"execution_time": execution_time}
+            )
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            display_message(
+                "assistant",
+                {"success": False, "error": str(e)},
+                metadata={"execution_time": execution_time}
+            )
         
         # Clear current task
         st.session_state.current_task = ""
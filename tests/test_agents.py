@@ -4,13 +4,25 @@ Tests for AI Agents - Unit tests for Planner, Executor, and Verifier agents
 
 import pytest
 import asyncio
+import json
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from agents.planner import PlannerAgent, ExecutionPlan, PlanStep
-from agents.executor import ExecutorAgent
+from agents.plan_cache import normalize_task
+from agents.fast_path import FastPathPlanner
+from agents.executor import ExecutorAgent, StepEvent
+from agents.batch import BatchExecutor
+from agents.timeline import chrome_trace
+from agents.retry import RetryPolicy
+from agents.checkpoint import CheckpointStore
 from agents.verifier import VerifierAgent
-from tools.base import ToolResult, ToolStatus
+from tools.base import ErrorCategory, ToolResult, ToolStatus
+from tools.latency import LatencyTracker
+from tools.limits import ConcurrencyLimiter
 from tools.registry import ToolRegistry
+from tools.weather import WeatherTool
+from tools.github import GitHubTool
 
 
 class TestPlannerAgent:
@@ -27,9 +39,13 @@ class TestPlannerAgent:
     @pytest.fixture
     def mock_tool_registry(self):
         """Mock tool registry."""
-        registry = MagicMock()
+        registry = MagicMock(spec=ToolRegistry)
+        registry.catalog_version = 0
         registry.list_tools.return_value = ["github", "weather", "news"]
+        registry.list_capabilities.return_value = ["get_current_weather"]
         registry.get_tool_for_capability.return_value = MagicMock()
+        registry.get_capability.return_value = None
+        registry.get_catalog_prompt.return_value = "- get_current_weather(city): Current weather for a city"
         return registry
     
     @pytest.fixture
@@ -100,6 +116,165 @@ class TestPlannerAgent:
         
         with pytest.raises(RuntimeError, match="Failed to create valid plan"):
             await planner.create_plan("Invalid task")
+    
+    @pytest.mark.asyncio
+    async def test_create_plan_reuses_cached_plan_for_normalized_input(self, planner, mock_llm_factory):
+        """Test that repeated tasks skip the LLM and invalid plans are not cached."""
+        llm = mock_llm_factory.create_llm.return_value
+        llm.generate_structured.return_value = {
+            "task_description": "Weather in London",
+            "steps": [{
+                "step_id": 1,
+                "capability": "get_current_weather",
+                "parameters": {"city": "London"},
+                "description": "Get current weather for London"
+            }],
+            "estimated_complexity": "simple",
+            "required_tools": ["weather"],
+            "success_criteria": ["Weather retrieved"]
+        }
+        planner.tool_registry.get_tool_for_capability.return_value.validate_parameters.return_value = (True, None)
+        
+        first = await planner.create_plan("Weather in London")
+        second = await planner.create_plan("  weather in LONDON? ")
+        
+        assert llm.generate_structured.call_count == 1
+        assert second.steps == first.steps
+        assert second.task_description == "  weather in LONDON? "
+        second.steps[0].parameters["city"] = "Paris"
+        assert (await planner.create_plan("weather in london")).steps[0].parameters["city"] == "London"
+        
+        planner.tool_registry.get_tool_for_capability.return_value = None
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await planner.create_plan("Weather in Paris")
+        
+        stats = planner.plan_cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 3, 1)
+        assert stats["hit_ratio"] == 0.4
+        
+        # Meaningful punctuation is part of the key
+        planner.plan_cache.set("top c++ repos", first)
+        assert planner.plan_cache.get("top c repos") is None
+        assert normalize_task("news about c#") != normalize_task("news about c")
+        assert normalize_task("repo facebook/react.") == "repo facebook/react"
+    
+    @pytest.mark.asyncio
+    async def test_create_plan_reuses_similar_plan_with_new_slot_values(self, planner, mock_llm_factory):
+        """Test that a paraphrased task reuses a successful plan with its own entity values."""
+        plan = ExecutionPlan(
+            task_description="What's the weather in London?",
+            steps=[PlanStep(
+                step_id=1,
+                capability="get_current_weather",
+                parameters={"city": "London", "units": "metric"},
+                description="Get current weather for London"
+            )],
+            estimated_complexity="simple",
+            required_tools=["weather"],
+            success_criteria=["Weather for London retrieved"]
+        )
+        planner.remember_plan("What's the weather in London?", plan)
+        validate = planner.tool_registry.get_tool_for_capability.return_value.validate_parameters
+        validate.return_value = (True, None)
+        llm = mock_llm_factory.create_llm.return_value
+        
+        reused = await planner.create_plan("Tokyo weather now")
+        assert reused.steps[0].parameters == {"city": "Tokyo", "units": "metric"}
+        assert reused.steps[0].description == "Get current weather for Tokyo"
+        assert reused.success_criteria == ["Weather for Tokyo retrieved"]
+        validate.assert_called_with("get_current_weather", reused.steps[0].parameters)
+        
+        # Different intent, or a substituted plan that fails validation, goes to the LLM
+        llm.generate_structured.side_effect = RuntimeError("LLM called")
+        for task in ["latest news about London", "Paris weather forecast next week"]:
+            with pytest.raises(RuntimeError, match="LLM called"):
+                await planner.create_plan(task)
+        
+        # Slot values must not absorb intent or qualifier words
+        for task in ["weather forecast Paris", "weather in Paris tomorrow", "weather in Paris France"]:
+            assert planner.plan_index.match(task) is None
+        validate.return_value = (False, "Unknown city")
+        with pytest.raises(RuntimeError, match="LLM called"):
+            await planner.create_plan("weather in Atlantis")
+        assert planner.plan_index.get_stats()["matches"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_fast_path_plans_simple_intents_without_llm(self, mock_llm_factory):
+        """Test that simple intents get rule-based plans and anything ambiguous goes to the LLM."""
+        registry = ToolRegistry()
+        registry.register_tool(WeatherTool())
+        registry.register_tool(GitHubTool())
+        planner = PlannerAgent(mock_llm_factory, registry, fast_path=FastPathPlanner(registry))
+        llm = mock_llm_factory.create_llm.return_value
+        llm.generate_structured.side_effect = RuntimeError("LLM called")
+        
+        expected = {
+            "What's the weather in New York?": ("get_current_weather", {"city": "New York"}),
+            "berlin weather forecast": ("get_weather_forecast", {"city": "berlin"}),
+            "info on github user torvalds": ("get_user_info", {"username": "torvalds"}),
+            "repo facebook/react": ("get_repository", {"owner": "facebook", "repo": "react"})
+        }
+        for task, (capability, parameters) in expected.items():
+            plan = await planner.create_plan(task)
+            assert (plan.steps[0].capability, plan.steps[0].parameters) == (capability, parameters)
+            assert plan.required_tools and plan.task_description == task
+        
+        # Multiple entities, unknown intents and unregistered capabilities fall through
+        for task in ["weather in London and Paris", "top python repos", "technology headlines"]:
+            with pytest.raises(RuntimeError, match="LLM called"):
+                await planner.create_plan(task)
+        
+        assert llm.generate_structured.call_count == 3
+        assert planner.fast_path.get_stats()["hits"] == 4
+        
+        # Time, unit and trip qualifiers are not swallowed into the city
+        for task in [
+            "weather in London tomorrow",
+            "weather in London next week",
+            "weather in Paris in celsius",
+            "weather for my trip to Rome",
+            "weather in the UK",
+            "weather in london please"
+        ]:
+            assert planner.fast_path.plan(task) is None
+
+    @pytest.mark.asyncio
+    async def test_prompt_has_top_k_capabilities_with_full_fallback(self, mock_llm_factory):
+        """Test that only relevant capabilities are prompted and an invalid plan retries with all."""
+        registry = ToolRegistry()
+        registry.register_tool(WeatherTool())
+        registry.register_tool(GitHubTool())
+        planner = PlannerAgent(mock_llm_factory, registry, capability_top_k=3)
+        planner.plan_cache = planner.plan_index = None
+
+        def plan_data(capability, parameters):
+            return {
+                "task_description": "task",
+                "steps": [{"step_id": 1, "capability": capability, "parameters": parameters, "description": "step"}],
+                "estimated_complexity": "simple",
+                "required_tools": [],
+                "success_criteria": []
+            }
+
+        llm = mock_llm_factory.create_llm.return_value
+        llm.generate_structured.side_effect = [
+            plan_data("get_current_weather", {"city": "Oslo"}),
+            plan_data("get_repository", {}),  # Missing parameters -> invalid
+            plan_data("list_repository_commits", {"owner": "python", "repo": "cpython"})
+        ]
+
+        await planner.create_plan("Will it rain in Oslo this weekend? Check the forecast")
+        prompt = llm.generate_structured.call_args_list[0].kwargs["messages"][0].content
+        assert "get_weather_forecast" in prompt
+        assert "search_repositories" not in prompt
+
+        plan = await planner.create_plan("recent changes to the cpython repository")
+        first, second = [call.kwargs["messages"][0].content for call in llm.generate_structured.call_args_list[1:]]
+        assert "get_user_info" not in first
+        assert all(name in second for name in registry.list_capabilities())
+        assert plan.steps[0].capability == "list_repository_commits"
+        assert planner.retrieval_stats == {"plans": 2, "fallbacks": 1}
 
 
 class TestExecutorAgent:
@@ -116,7 +291,10 @@ class TestExecutorAgent:
     @pytest.fixture
     def mock_tool_registry(self):
         """Mock tool registry."""
-        registry = MagicMock()
+        registry = MagicMock(spec=ToolRegistry)
+        registry.get_capability.return_value = None
+        registry.list_capabilities.return_value = ["get_current_weather"]
+        registry.latency = LatencyTracker()
         return registry
     
     @pytest.fixture
@@ -224,6 +402,509 @@ class TestExecutorAgent:
         
         assert result["status"] == "success"
         assert result["execution_summary"]["successful_steps"] == 2
+    
+    @staticmethod
+    def _wide_plan(width: int, dependencies: dict = None) -> ExecutionPlan:
+        """Create a plan of independent weather steps."""
+        dependencies = dependencies or {}
+        steps = [
+            PlanStep(
+                step_id=i,
+                capability="get_current_weather",
+                parameters={"city": f"City {i}"},
+                description=f"Get weather for city {i}",
+                dependencies=dependencies.get(i, [])
+            )
+            for i in range(1, width + 1)
+        ]
+        return ExecutionPlan(
+            task_description="Get weather in several cities",
+            steps=steps,
+            estimated_complexity="moderate",
+            required_tools=["weather"],
+            success_criteria=["Weather retrieved"]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_mode_respects_concurrency_limit(self, mock_llm_factory, mock_tool_registry):
+        """Test that independent steps overlap but never exceed max_concurrency."""
+        executor = ExecutorAgent(mock_llm_factory, mock_tool_registry, mode="concurrent", max_concurrency=2)
+        in_flight = 0
+        peak = 0
+        
+        async def slow_call(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ToolResult(status=ToolStatus.SUCCESS, data={"city": kwargs["parameters"]["city"]})
+        
+        executor.tool_registry.execute_capability = AsyncMock(side_effect=slow_call)
+        
+        result = await executor.execute_plan(self._wide_plan(5))
+        
+        assert result["status"] == "success"
+        assert result["execution_summary"]["successful_steps"] == 5
+        assert peak == 2
+        assert result["metadata"]["scheduler"]["mode"] == "concurrent"
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_mode_waits_for_dependencies(self, mock_llm_factory, mock_tool_registry):
+        """Test that a dependent step starts only after its dependencies finish."""
+        executor = ExecutorAgent(mock_llm_factory, mock_tool_registry, mode="concurrent", max_concurrency=4)
+        finished = []
+        
+        async def call(**kwargs):
+            step_id = kwargs["context"]["step_id"]
+            if step_id == 3:
+                assert finished == [1, 2] or finished == [2, 1]
+            await asyncio.sleep(0.01)
+            finished.append(step_id)
+            return ToolResult(status=ToolStatus.SUCCESS, data={"step": step_id})
+        
+        executor.tool_registry.execute_capability = AsyncMock(side_effect=call)
+        
+        result = await executor.execute_plan(self._wide_plan(3, dependencies={3: [1, 2]}))
+        
+        assert result["status"] == "success"
+        assert finished[-1] == 3
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_mode_skips_dependents_of_failed_step(self, mock_llm_factory, mock_tool_registry):
+        """Test that a required failure stops dependents from running."""
+        executor = ExecutorAgent(mock_llm_factory, mock_tool_registry, mode="concurrent")
+        executor.retry_policy = RetryPolicy(base_delay=0)
+        executor.tool_registry.execute_capability = AsyncMock(
+            return_value=ToolResult(status=ToolStatus.ERROR, error="API call failed")
+        )
+        
+        result = await executor.execute_plan(self._wide_plan(2, dependencies={2: [1]}))
+        
+        assert result["status"] == "failed"
+        assert result["execution_summary"]["failed_steps"] == 1
+        assert 2 not in result["data"]
+    
+    @pytest.mark.asyncio
+    async def test_required_failure_cancels_in_flight_steps(self, mock_llm_factory, mock_tool_registry):
+        """Test that a required failure cancels running siblings but an optional one does not."""
+        executor = ExecutorAgent(
+            mock_llm_factory, mock_tool_registry, mode="concurrent", max_concurrency=4,
+            retry_policy=RetryPolicy(max_attempts=1)
+        )
+        cancelled = []
+        
+        async def weather(**kwargs):
+            city = kwargs["parameters"]["city"]
+            if city == "City 1":
+                return ToolResult(status=ToolStatus.ERROR, error="API call failed")
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(city)
+                raise
+            return ToolResult(status=ToolStatus.SUCCESS, data={"city": city})
+        
+        executor.tool_registry.execute_capability = AsyncMock(side_effect=weather)
+        
+        delay = 5
+        result = await asyncio.wait_for(
+            executor.execute_plan(self._wide_plan(5, dependencies={5: [1]})), timeout=2
+        )
+        
+        assert result["status"] == "failed"
+        assert sorted(cancelled) == ["City 2", "City 3", "City 4"]
+        assert result["execution_summary"]["failed_steps"] == 1
+        assert result["execution_summary"]["cancelled_steps"] == 4
+        assert {step["step_id"] for step in result["results"]["cancelled"]} == {2, 3, 4, 5}
+        
+        delay = 0.01
+        plan = self._wide_plan(4)
+        plan.steps[0].optional = True
+        result = await executor.execute_plan(plan)
+        
+        assert result["status"] == "success"
+        assert result["execution_summary"]["successful_steps"] == 3
+        assert result["execution_summary"]["cancelled_steps"] == 0
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("priority, first", [("fifo", "City 1"), ("critical_path", "City 4")])
+    async def test_step_priority_orders_ready_steps(self, mock_llm_factory, mock_tool_registry, priority, first):
+        """Test that critical-path priority starts the head of the longest chain first."""
+        executor = ExecutorAgent(
+            mock_llm_factory, mock_tool_registry, mode="concurrent", max_concurrency=1, priority=priority
+        )
+        started = []
+        
+        async def weather(**kwargs):
+            started.append(kwargs["parameters"]["city"])
+            return ToolResult(status=ToolStatus.SUCCESS, data={})
+        
+        executor.tool_registry.execute_capability = AsyncMock(side_effect=weather)
+        result = await executor.execute_plan(self._wide_plan(6, dependencies={5: [4], 6: [5]}))
+        
+        assert result["status"] == "success"
+        assert started[0] == first
+        assert result["metadata"]["scheduler"]["priority"] == priority
+    
+    @pytest.mark.asyncio
+    async def test_timeline_records_queue_attempts_and_backoff(self, mock_llm_factory, mock_tool_registry, tmp_path):
+        """Test that each step's timeline separates queueing, attempts and backoff."""
+        executor = ExecutorAgent(
+            mock_llm_factory, mock_tool_registry, mode="concurrent", max_concurrency=1,
+            retry_policy=RetryPolicy(base_delay=0.02), trace_dir=str(tmp_path)
+        )
+        executor.tool_registry.execute_capability = AsyncMock(side_effect=[
+            ToolResult(status=ToolStatus.ERROR, error="Service unavailable"),
+            ToolResult(status=ToolStatus.SUCCESS, data={}),
+            ToolResult(status=ToolStatus.SUCCESS, data={})
+        ])
+        
+        result = await executor.execute_plan(self._wide_plan(2))
+        
+        first, second = result["timeline"]["steps"]
+        assert [attempt["status"] for attempt in first["attempts"]] == ["error", "success"]
+        assert len(first["backoffs"]) == 1
+        assert first["ready"] <= first["started"] <= first["attempts"][0]["start"]
+        assert first["finished"] >= first["attempts"][1]["end"]
+        # The second step waited for the only concurrency slot
+        assert second["queue_time"] >= first["finished"] - first["started"] - 0.001
+        
+        trace = json.loads(next(tmp_path.iterdir()).read_text())
+        assert trace == chrome_trace(result)
+        names = {event["name"] for event in trace["traceEvents"]}
+        assert {"queued", "attempt 1", "attempt 2", "backoff"} <= names
+    
+    @pytest.mark.asyncio
+    async def test_estimate_replays_schedule_and_learns_from_steps(self, mock_llm_factory, mock_tool_registry):
+        """Test the dry-run estimate before and after steps have been recorded."""
+        executor = ExecutorAgent(mock_llm_factory, mock_tool_registry, mode="concurrent", max_concurrency=2)
+        plan = self._wide_plan(5, dependencies={5: [4]})
+        plan.steps[1].parameters = dict(plan.steps[0].parameters)  # Duplicate call
+        
+        estimate = executor.estimate(plan)
+        assert estimate["unique_calls"] == 4
+        assert estimate["upstream_calls"] == 4.0
+        # 5 default-latency steps on 2 slots, with 4 -> 5 chained: 3 rounds
+        assert estimate["wall_time"]["p50"] == 3 * ExecutorAgent.DEFAULT_STEP_LATENCY
+        assert estimate["wall_time"]["critical_path"] == 2 * ExecutorAgent.DEFAULT_STEP_LATENCY
+        assert estimate["capabilities_without_history"] == ["get_current_weather"]
+        assert estimate["verification_tokens"]["total"] > estimate["verification_tokens"]["prompt"]
+        
+        executor.tool_registry.execute_capability = AsyncMock(side_effect=[
+            ToolResult(status=ToolStatus.ERROR, error="Service unavailable"),
+            ToolResult(status=ToolStatus.SUCCESS, data={"temperature": 20}),
+            ToolResult(status=ToolStatus.SUCCESS, data={"temperature": 21})
+        ])
+        executor.retry_policy = RetryPolicy(base_delay=0.01)
+        await executor.execute_plan(self._wide_plan(2))
+        
+        # Results served from the registry's cache are not upstream calls
+        executor.tool_registry.execute_capability = AsyncMock(return_value=ToolResult(
+            status=ToolStatus.SUCCESS, data={"temperature": 20}, metadata={"cache": "hit"}
+        ))
+        await executor.execute_plan(self._wide_plan(2))
+        
+        learned = executor.estimate(plan)
+        assert learned["capabilities_without_history"] == []
+        assert learned["upstream_calls"] == 6.0  # 1.5 recorded attempts per step
+        assert learned["wall_time"]["p50"] < estimate["wall_time"]["p50"]
+        assert learned["verification_tokens"]["prompt"] < estimate["verification_tokens"]["prompt"]
+        
+        sequential = ExecutorAgent(mock_llm_factory, mock_tool_registry, mode="sequential")
+        assert sequential.estimate(plan)["wall_time"]["p50"] == 5 * ExecutorAgent.DEFAULT_STEP_LATENCY
+    
+    @pytest.mark.asyncio
+    async def test_execute_plan_stream_yields_step_events(self, mock_llm_factory, mock_tool_registry):
+        """Test that streaming yields each step result before the final summary."""
+        executor = ExecutorAgent(mock_llm_factory, mock_tool_registry, mode="concurrent")
+        executor.retry_policy = RetryPolicy(base_delay=0)
+        executor.tool_registry.execute_capability = AsyncMock(side_effect=[
+            ToolResult(status=ToolStatus.ERROR, error="Temporary failure"),
+            ToolResult(status=ToolStatus.SUCCESS, data={"temperature": 72})
+        ])
+        
+        events = [event async for event in executor.execute_plan_stream(self._wide_plan(1))]
+        
+        assert [event.event for event in events] == ["started", "retried", "succeeded", "completed"]
+        assert all(isinstance(event, StepEvent) for event in events)
+        assert events[2].result.data == {"temperature": 72}
+        assert events[2].attempt == 2
+        assert events[-1].execution["status"] == "success"
+        assert events[2].to_dict()["result"]["status"] == "success"
+    
+    @pytest.mark.asyncio
+    async def test_step_timeout_and_budget_in_context(self, mock_llm_factory):
+        """Test that a hung step times out and tools receive their time budget."""
+        registry = ToolRegistry()
+        tool = WeatherTool()
+        registry.register_tool(tool)
+        executor = ExecutorAgent(mock_llm_factory, registry, plan_deadline=0)
+        executor.retry_policy = RetryPolicy(base_delay=0)
+        executor.capability_timeouts = {"get_current_weather": 0.05}
+        budgets = []
+        
+        async def hang(capability, parameters, context=None):
+            budgets.append(context["timeout"])
+            await asyncio.sleep(10)
+        
+        tool.execute = hang
+        
+        result = await executor.execute_plan(self._wide_plan(1))
+        
+        assert result["status"] == "failed"
+        assert "timed out" in result["results"]["failed"][0]["error"]
+        assert budgets == [0.05] * executor.retry_policy.max_attempts
+    
+    @pytest.mark.asyncio
+    async def test_step_timeout_excludes_concurrency_queue(self, mock_llm_factory):
+        """Test that waiting for a concurrency slot neither times steps out nor counts as run time."""
+        registry = ToolRegistry(limiter=ConcurrencyLimiter(capability_limits={"get_current_weather": 1}))
+        tool = WeatherTool()
+        registry.register_tool(tool)
+        executor = ExecutorAgent(mock_llm_factory, registry, mode="concurrent")
+        executor.capability_timeouts = {"get_current_weather": 0.25}
+        
+        async def weather(capability, parameters, context=None):
+            await asyncio.sleep(0.1)
+            return ToolResult(status=ToolStatus.SUCCESS, data={"city": parameters["city"]})
+        
+        tool.execute = weather
+        
+        result = await executor.execute_plan(self._wide_plan(5))
+        
+        assert result["status"] == "success"
+        assert result["metadata"].get("retries", 0) == 0
+        steps = result["timeline"]["steps"]
+        last = max(steps, key=lambda step: step["queue_time"])
+        assert len(last["slot_waits"]) == 1
+        assert last["queue_time"] >= 0.35
+        assert last["run_time"] < 0.2
+    
+    @pytest.mark.asyncio
+    async def test_plan_deadline_skips_steps_that_cannot_start(self, mock_llm_factory, mock_tool_registry):
+        """Test that steps not started before the deadline are marked skipped."""
+        executor = ExecutorAgent(mock_llm_factory, mock_tool_registry, mode="concurrent", max_concurrency=1)
+        
+        async def slow(**kwargs):
+            await asyncio.sleep(0.2)
+            return ToolResult(status=ToolStatus.SUCCESS, data={"ok": True})
+        
+        executor.tool_registry.execute_capability = AsyncMock(side_effect=slow)
+        plan = self._wide_plan(2)
+        plan.steps[0].optional = True
+        
+        # Step 1 is cut off by the deadline, leaving no time to start step 2
+        result = await executor.execute_plan(plan, deadline=0.05)
+        
+        assert executor.tool_registry.execute_capability.call_count == 1
+        assert result["status"] == "failed"
+        assert result["error"] == "Plan deadline exceeded"
+        assert result["execution_summary"]["skipped_steps"] == 1
+        assert result["results"]["skipped"][0]["step_id"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_permanent_errors_are_not_retried(self, mock_llm_factory, mock_tool_registry):
+        """Test that permanent failures fail on the first attempt."""
+        executor = ExecutorAgent(mock_llm_factory, mock_tool_registry)
+        executor.tool_registry.execute_capability = AsyncMock(return_value=ToolResult(
+            status=ToolStatus.ERROR,
+            error="City not found",
+            metadata={"error_category": ErrorCategory.PERMANENT.value}
+        ))
+        
+        result = await executor.execute_plan(self._wide_plan(1))
+        
+        assert result["status"] == "failed"
+        assert executor.tool_registry.execute_capability.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_retry_budget_is_shared_across_plan(self, mock_llm_factory, mock_tool_registry):
+        """Test that retries stop once the plan-wide budget is spent."""
+        executor = ExecutorAgent(
+            mock_llm_factory, mock_tool_registry,
+            retry_policy=RetryPolicy(max_attempts=3, base_delay=0, retry_budget=2)
+        )
+        executor.tool_registry.execute_capability = AsyncMock(
+            return_value=ToolResult(status=ToolStatus.ERROR, error="Upstream unavailable")
+        )
+        plan = self._wide_plan(3)
+        for step in plan.steps:
+            step.optional = True
+        
+        result = await executor.execute_plan(plan)
+        
+        # 3 first attempts + 2 budgeted retries
+        assert executor.tool_registry.execute_capability.call_count == 5
+        assert result["metadata"]["retries"] == 2
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["sequential", "concurrent"])
+    async def test_duplicate_calls_run_once(self, mock_llm_factory, mode):
+        """Test that identical (capability, parameters) steps share one call."""
+        registry = ToolRegistry()
+        registry.register_tool(WeatherTool())
+        executor = ExecutorAgent(mock_llm_factory, registry, mode=mode)
+        
+        async def weather(**kwargs):
+            await asyncio.sleep(0.01)
+            return ToolResult(status=ToolStatus.SUCCESS, data={"city": kwargs["parameters"]["city"]})
+        
+        registry.execute_capability = AsyncMock(side_effect=weather)
+        plan = self._wide_plan(3)
+        plan.steps[0].parameters = {"city": "London"}
+        # Same call once defaults and whitespace are normalized
+        plan.steps[1].parameters = {"city": " London ", "units": "metric"}
+        plan.steps[2].parameters = {"city": "Paris"}
+        
+        result = await executor.execute_plan(plan)
+        
+        assert result["status"] == "success"
+        assert registry.execute_capability.call_count == 2
+        assert result["execution_summary"]["calls_saved"] == 1
+        assert result["data"][2] == {"city": "London"}
+
+    @pytest.mark.asyncio
+    async def test_streamed_plan_starts_independent_steps_early(self, mock_llm_factory):
+        """Test that valid dependency-free steps start while the rest of the plan is still streaming."""
+        registry = ToolRegistry()
+        registry.register_tool(WeatherTool())
+        steps = [
+            {"step_id": 1, "capability": "get_current_weather", "parameters": {"city": "London"}, "description": "London"},
+            {"step_id": 2, "capability": "get_current_weather", "parameters": {"city": "Paris"}, "description": "Paris", "dependencies": [1]}
+        ]
+        invalid = {"step_id": 3, "capability": "get_current_weather", "parameters": {}, "description": "No city"}
+        streams = [
+            json.dumps({"task_description": "t", "steps": [invalid] + steps, "estimated_complexity": "simple", "required_tools": [], "success_criteria": []}),
+            json.dumps({"task_description": "t", "steps": steps, "estimated_complexity": "simple", "required_tools": [], "success_criteria": []})
+        ]
+        stream_done = asyncio.Event()
+        
+        async def stream_structured(**kwargs):
+            stream_done.clear()
+            text = streams.pop(0)
+            for i in range(0, len(text), 20):
+                await asyncio.sleep(0.001)
+                yield text[i:i + 20]
+            stream_done.set()
+        
+        mock_llm_factory.create_llm.return_value.stream_structured = stream_structured
+        planner = PlannerAgent(mock_llm_factory, registry, capability_top_k=0)
+        planner.plan_cache = planner.plan_index = None
+        executor = ExecutorAgent(mock_llm_factory, registry)
+        
+        calls = []
+        
+        async def weather(**kwargs):
+            calls.append((kwargs["parameters"]["city"], not stream_done.is_set()))
+            await asyncio.sleep(0.01)
+            return ToolResult(status=ToolStatus.SUCCESS, data={"city": kwargs["parameters"]["city"]})
+        
+        registry.execute_capability = AsyncMock(side_effect=weather)
+        
+        # The invalid step is never started; the plan is rejected as a whole
+        early_dispatch = executor.create_early_dispatch()
+        with pytest.raises(RuntimeError, match="Failed to create valid plan"):
+            await planner.create_plan("weather in London, then Paris", on_step=early_dispatch.dispatch)
+        early_dispatch.cancel()
+        assert calls == [("London", True)]
+        
+        calls.clear()
+        early_dispatch = executor.create_early_dispatch()
+        plan = await planner.create_plan("weather in London, then Paris", on_step=early_dispatch.dispatch)
+        result = await executor.execute_plan(plan, early_dispatch=early_dispatch)
+        
+        assert result["status"] == "success"
+        # Step 1 started during planning and its call was reused; step 2 waited for it
+        assert calls == [("London", True), ("Paris", False)]
+        assert result["metadata"]["early_dispatch"] == {"dispatched": 1, "used": 1}
+        timeline = {step["step_id"]: step for step in result["timeline"]["steps"]}
+        assert timeline[1]["started"] < 0 <= timeline[2]["started"]
+
+    @pytest.mark.asyncio
+    async def test_resume_plan_reruns_only_unfinished_steps(self, mock_llm_factory, mock_tool_registry, tmp_path):
+        """Test that a resumed plan restores checkpointed successes and re-runs the rest."""
+        store = CheckpointStore(str(tmp_path / "checkpoints.db"))
+        executor = ExecutorAgent(
+            mock_llm_factory, mock_tool_registry, mode="sequential",
+            retry_policy=RetryPolicy(max_attempts=1), checkpoint_store=store
+        )
+        outage = True
+        
+        async def weather(**kwargs):
+            city = kwargs["parameters"]["city"]
+            if city == "City 2" and outage:
+                return ToolResult(status=ToolStatus.ERROR, error="Service unavailable")
+            return ToolResult(status=ToolStatus.SUCCESS, data={"city": city})
+        
+        executor.tool_registry.execute_capability = AsyncMock(side_effect=weather)
+        result = await executor.execute_plan(self._wide_plan(3, dependencies={3: [2]}))
+        
+        assert result["status"] == "failed"
+        execution_id = result["metadata"]["execution_id"]
+        assert store.get_status(execution_id) == "failed"
+        
+        outage = False
+        executor.tool_registry.execute_capability.reset_mock()
+        resumed = await executor.resume_plan(execution_id)
+        
+        assert resumed["status"] == "success"
+        assert resumed["metadata"]["resumed_steps"] == 1
+        assert resumed["execution_summary"]["successful_steps"] == 3
+        called = [call.kwargs["parameters"]["city"] for call in executor.tool_registry.execute_capability.call_args_list]
+        assert called == ["City 2", "City 3"]
+        assert store.get_status(execution_id) == "success"
+        store.close()
+    
+    @pytest.mark.asyncio
+    async def test_batch_executor_is_fair_and_shares_in_flight_calls(self, mock_llm_factory):
+        """Test that a small plan is not starved by a bulk plan and identical calls are shared."""
+        registry = ToolRegistry()
+        registry.register_tool(WeatherTool())
+        executor = BatchExecutor(mock_llm_factory, registry, max_concurrency=2)
+        finished = []
+        
+        async def weather(**kwargs):
+            await asyncio.sleep(0.02)
+            finished.append(kwargs["parameters"]["city"])
+            return ToolResult(status=ToolStatus.SUCCESS, data={"city": kwargs["parameters"]["city"]})
+        
+        registry.execute_capability = AsyncMock(side_effect=weather)
+        bulk = self._wide_plan(20)
+        interactive = self._wide_plan(1)
+        interactive.steps[0].parameters = {"city": "Interactive"}
+        
+        async def submit_later():
+            await asyncio.sleep(0.03)
+            return await executor.execute_plan(interactive)
+        
+        bulk_result, interactive_result = await asyncio.gather(executor.execute_plan(bulk), submit_later())
+        
+        assert bulk_result["status"] == "success"
+        assert interactive_result["status"] == "success"
+        assert interactive_result["metadata"]["scheduler"]["batch"] is True
+        # FIFO would run it after all 20 bulk steps
+        assert finished.index("Interactive") < 8
+        
+        # Identical calls in flight in two plans reach the upstream once
+        registry.execute_capability.reset_mock()
+        first, second = await executor.execute_plans([self._wide_plan(2), self._wide_plan(2)])
+        
+        assert registry.execute_capability.call_count == 2
+        assert second["execution_summary"]["calls_saved"] + first["execution_summary"]["calls_saved"] == 2
+        assert executor.get_batch_stats()["active_plans"] == 0
+    
+    def test_sort_handles_long_chains_and_cycles(self, executor):
+        """Test that the topological sort is iterative and still rejects cycles."""
+        length = sys.getrecursionlimit() * 2
+        plan = self._wide_plan(length, {i: [i - 1] for i in range(2, length + 1)})
+        
+        sorted_steps = executor._sort_steps_by_dependencies(list(reversed(plan.steps)))
+        assert [step.step_id for step in sorted_steps] == list(range(1, length + 1))
+        
+        cyclic = self._wide_plan(3, {1: [3], 2: [1], 3: [2]})
+        with pytest.raises(ValueError, match="Circular dependency"):
+            executor._sort_steps_by_dependencies(cyclic.steps)
 
 
 class TestVerifierAgent:
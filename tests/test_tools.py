@@ -4,12 +4,20 @@ Tests for API Tools - Unit tests for GitHub, Weather, and News tools
 
 import pytest
 import asyncio
+import copy
+import json
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from tools.github import GitHubTool
 from tools.weather import WeatherTool
 from tools.news import NewsTool
-from tools.base import ToolResult, ToolStatus
+from tools.base import BaseTool, ToolCapability, ToolResult, ToolStatus, ErrorCategory, ToolError
+from tools.registry import ToolRegistry
+from tools.limits import ConcurrencyLimiter
+from tools.cache import ResultCache
+from tools.offload import PostProcessor
+from tools.pacing import RateLimitPacer
+from tools.validation import is_validated, mark_validated
 
 
 class TestGitHubTool:
@@ -99,6 +107,52 @@ class TestGitHubTool:
         assert result.status == ToolStatus.ERROR
         assert "Repository search failed" in result.error
     
+    @pytest.mark.asyncio
+    async def test_search_repositories_error_category(self, github_tool):
+        """Test that classified failures are reported in result metadata."""
+        error = ToolError("Rate limit exceeded", ErrorCategory.RATE_LIMITED, retry_after=12.0)
+        with patch.object(github_tool, '_make_request', side_effect=error):
+            result = await github_tool.execute("search_repositories", {
+                "query": "react"
+            })
+        
+        assert result.metadata["error_category"] == "rate_limited"
+        assert result.metadata["retry_after"] == 12.0
+        
+        with patch.object(github_tool, '_make_request', side_effect=ToolError("Resource not found", ErrorCategory.PERMANENT)):
+            result = await github_tool.execute("get_user_info", {"username": "nobody"})
+        
+        assert result.metadata["error_category"] == "permanent"
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_pacing(self):
+        """Test that quota is spread until reset and search/core are paced separately."""
+        import time
+        pacer = RateLimitPacer({"core": 5000, "search": 30}, burst=1, max_wait=5.0)
+        reset = str(time.time() + 1.0)
+        pacer.update("core", {"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": reset})
+        pacer.update("core", {
+            "X-RateLimit-Resource": "search",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(time.time() + 60)
+        })
+        
+        # 20 requests left for 1s: one immediately, then one every ~50ms
+        start = time.perf_counter()
+        for _ in range(3):
+            async with pacer.acquire("core"):
+                pass
+        assert time.perf_counter() - start >= 0.08
+        assert pacer.get_stats()["core"]["paced"] == 2
+        
+        # Exhausted search quota queues beyond max_wait -> rate limited, core unaffected
+        with pytest.raises(ToolError) as exc_info:
+            async with pacer.acquire("search"):
+                pass
+        assert exc_info.value.category == ErrorCategory.RATE_LIMITED
+        assert exc_info.value.retry_after > 50
+        assert pacer.get_stats()["search"]["acquired"] == 0
+    
     def test_validate_api_key(self, github_tool):
         """Test API key validation."""
         # No key (should be valid for public endpoints)
@@ -189,6 +243,40 @@ class TestWeatherTool:
         assert result.data["current"]["temperature"] == 22.5
         assert result.data["weather"]["main"] == "Clear"
     
+    @pytest.mark.asyncio
+    async def test_forecast_post_processing_offload(self, weather_tool):
+        """Test that large forecasts are summarized off the loop with the same result."""
+        mock_response = {
+            "city": {"name": "London", "country": "GB"},
+            "list": [
+                {
+                    "dt": 1609459200 + i * 3 * 3600,
+                    "main": {"temp": 10 + i % 8, "humidity": 70},
+                    "weather": [{"description": "light rain"}],
+                    "wind": {"speed": 4.0}
+                }
+                for i in range(40)
+            ]
+        }
+        weather_tool.api_key = "1234567890abcdef1234567890abcdef"
+        
+        results = {}
+        for kind in ("inline", "thread"):
+            weather_tool.post_processor = PostProcessor(kind=kind, threshold=32)
+            with patch.object(weather_tool, '_make_request', return_value=mock_response):
+                results[kind] = await weather_tool.execute("get_weather_forecast", {"city": "London"})
+            stats = weather_tool.post_processor.get_stats()
+            weather_tool.post_processor.shutdown()
+        
+        assert results["thread"].status == ToolStatus.SUCCESS
+        assert results["thread"].data == results["inline"].data
+        assert stats == {"kind": "thread", "threshold": 32, "inline": 0, "offloaded": 1}
+        
+        # Payloads below the threshold stay inline
+        processor = PostProcessor(kind="thread", threshold=32)
+        assert await processor.run(len, [1, 2], size=2) == 2
+        assert processor.get_stats()["inline"] == 1
+    
     @pytest.mark.asyncio
     async def test_get_current_weather_no_api_key(self, weather_tool):
         """Test weather retrieval without API key."""
@@ -341,5 +429,272 @@ class TestNewsTool:
         assert news_tool.validate_api_key() is True
 
 
+
+class SlowTool(BaseTool):
+    """Tool that sleeps briefly and tracks peak concurrency."""
+    
+    def __init__(self, name: str = "slow", capabilities: tuple = ("slow_call",), delay: float = 0.01):
+        super().__init__(name=name, description="Slow test tool")
+        self.capabilities = [
+            ToolCapability(name=cap, description="Slow call", parameters=[])
+            for cap in capabilities
+        ]
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+    
+    async def execute(self, capability, parameters, context=None):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return ToolResult(status=ToolStatus.SUCCESS, data={"capability": capability, **parameters})
+    
+    def get_capabilities(self):
+        return self.capabilities
+    
+    def validate_parameters(self, capability, parameters):
+        return True, None
+
+
+class TestToolRegistry:
+    """Test cases for Tool Registry."""
+    
+    @pytest.mark.asyncio
+    async def test_tool_concurrency_limit(self):
+        """Test that per-tool limits bound in-flight calls and record queue wait."""
+        registry = ToolRegistry(limiter=ConcurrencyLimiter(tool_limits={"slow": 2}))
+        tool = SlowTool()
+        registry.register_tool(tool)
+        
+        await asyncio.gather(*[
+            registry.execute_capability("slow_call", {"n": i}) for i in range(6)
+        ])
+        
+        stats = registry.get_concurrency_stats()["tool:slow"]
+        assert tool.peak == 2
+        assert stats["acquired"] == 6
+        assert stats["in_flight"] == 0
+        assert stats["max_wait"] > 0
+    
+    @pytest.mark.asyncio
+    async def test_capability_limit_is_narrower_than_tool_limit(self):
+        """Test that a capability limit applies on top of tool and global limits."""
+        registry = ToolRegistry(limiter=ConcurrencyLimiter(
+            global_limit=10,
+            tool_limits={"slow": 5},
+            capability_limits={"slow_call": 1}
+        ))
+        tool = SlowTool()
+        registry.register_tool(tool)
+        
+        await asyncio.gather(*[
+            registry.execute_capability("slow_call", {"n": i}) for i in range(3)
+        ])
+        
+        info = registry.get_registry_info()["concurrency"]
+        assert tool.peak == 1
+        assert set(info) == {"capability:slow_call", "tool:slow", "global"}
+        assert info["global"]["acquired"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_result_cache_serves_repeated_calls(self):
+        """Test that equivalent calls are served from the cache."""
+        registry = ToolRegistry(cache=ResultCache(default_ttl=60))
+        tool = SlowTool()
+        registry.register_tool(tool)
+        
+        first = await registry.execute_capability("slow_call", {"city": "London"})
+        second = await registry.execute_capability("slow_call", {"city": " London"})
+        
+        assert tool.calls == 1
+        assert second.data == first.data
+        assert second.metadata["cache"] == "hit"
+        
+        # Mutating a returned result must not change later hits
+        first.data["city"] = "Paris"
+        second.data["extra"] = True
+        third = await registry.execute_capability("slow_call", {"city": "London"})
+        assert third.data == {"capability": "slow_call", "city": "London"}
+        stats = registry.get_registry_info()["cache"]
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+    
+    def test_result_cache_ttl_and_lru_eviction(self):
+        """Test per-capability TTLs and eviction by entry count and size."""
+        result = ToolResult(status=ToolStatus.SUCCESS, data={"value": "x" * 100})
+        
+        cache = ResultCache(default_ttl=60, capability_ttls={"uncached": 0}, max_entries=2)
+        cache.set("uncached", "u", result)
+        cache.set("cap", "a", result)
+        cache.set("cap", "b", result)
+        assert cache.get("a") is not None  # "a" is now most recently used
+        cache.set("cap", "c", result)
+        
+        assert cache.get("u") is None
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.get_stats()["evictions"] == 1
+        
+        size = len(result.model_dump_json())
+        cache = ResultCache(default_ttl=60, max_bytes=size * 2)
+        for key in ("a", "b", "c"):
+            cache.set("cap", key, result)
+        assert cache.get_stats()["entries"] == 2
+        assert cache.get_stats()["bytes"] <= size * 2
+        
+        cache = ResultCache(default_ttl=-1)
+        cache.set("cap", "a", result)
+        assert cache.get("a") is None
+    
+    def test_capability_catalog_cached_until_registry_changes(self):
+        """Test that the compact catalog is reused until a tool is registered."""
+        registry = ToolRegistry()
+        registry.register_tool(WeatherTool())
+        version = registry.catalog_version
+        
+        prompt = registry.get_catalog_prompt()
+        assert registry.get_catalog_prompt() is prompt
+        assert registry.catalog_version == version
+        
+        lines = [json.loads(line) for line in prompt.splitlines()]
+        assert len(lines) == len(WeatherTool().get_capabilities())
+        assert "\n " not in prompt and '": ' not in prompt  # Minified, no indentation
+        forecast = next(item for item in lines if item["name"] == "get_weather_forecast")
+        assert forecast["tool"] == "weather"
+        city = next(p for p in forecast["parameters"] if p["name"] == "city")
+        assert "optional" not in city and "default" not in city
+        assert any(p.get("optional") for p in forecast["parameters"])
+        
+        registry.register_tool(NewsTool())
+        assert registry.catalog_version > version
+        assert registry.get_catalog_prompt() != prompt
+        assert {item["tool"] for item in registry.get_capability_catalog()} == {"weather", "news"}
+    
+    @pytest.mark.asyncio
+    async def test_compiled_validators_and_validated_marker(self):
+        """Test schema-compiled validation and that marked parameters are not re-validated."""
+        news_tool = NewsTool()
+        is_valid, error = news_tool.validate_parameters("get_top_headlines", {"page_size": True})
+        assert not is_valid and error == "page_size must be an integer between 1 and 100"
+        is_valid, error = news_tool.validate_parameters("get_sources", {"category": "gossip"})
+        assert not is_valid and "category must be one of" in error
+        is_valid, error = news_tool.validate_parameters("search_news", {"query": "  "})
+        assert not is_valid and error == "query must be a non-empty string"
+        assert news_tool.validate_parameters("nope", {}) == (False, "Unknown capability: nope")
+        
+        registry = ToolRegistry()
+        tool = SlowTool(capabilities=("get_current_weather",))
+        tool.capabilities = WeatherTool().get_capabilities()
+        tool.validate_parameters = MagicMock(wraps=BaseTool.validate_parameters.__get__(tool))
+        registry.register_tool(tool)
+        
+        parameters = mark_validated({"city": "London"}, "get_current_weather")
+        result = await registry.execute_capability("get_current_weather", parameters)
+        assert result.is_success()
+        assert tool.validate_parameters.call_count == 1  # Returned early for the marked parameters
+        assert is_validated(copy.deepcopy(parameters), "get_current_weather")
+        assert not is_validated(parameters, "get_weather_forecast")
+        
+        parameters["city"] = ""
+        assert not is_validated(parameters, "get_current_weather")
+        with pytest.raises(ValueError, match="city must be a non-empty string"):
+            await registry.execute_capability("get_current_weather", parameters)
+    
+    @pytest.mark.asyncio
+    async def test_hedged_request_beats_straggler(self):
+        """Test that a slow idempotent call is hedged and the hedge budget is respected."""
+        registry = ToolRegistry(hedging=True)
+        tool = SlowTool(delay=0.01)
+        registry.register_tool(tool)
+        for _ in range(registry.hedge_min_samples):
+            registry.latency.record("slow_call", 0.01)
+        
+        original_execute = tool.execute
+        
+        async def execute(capability, parameters, context=None):
+            # The first request of every call straggles; the hedge is fast
+            if tool.calls % 2 == 0:
+                tool.calls += 1
+                await asyncio.sleep(1)
+            return await original_execute(capability, parameters, context)
+        
+        tool.execute = execute
+        
+        start = asyncio.get_running_loop().time()
+        result = await registry.execute_capability("slow_call", {"n": 1})
+        assert result.is_success()
+        assert asyncio.get_running_loop().time() - start < 0.5
+        
+        stats = registry.get_registry_info()["hedging"]
+        assert stats["hedged"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["latency"]["slow_call"]["samples"] == registry.hedge_min_samples + 1
+        
+        # One hedge in two calls exceeds HEDGE_MAX_RATIO, so the next call waits it out
+        registry.hedge_max_ratio = 0.5
+        tool.calls = 0
+        await asyncio.wait_for(registry.execute_capability("slow_call", {"n": 2}), timeout=2)
+        assert registry.get_hedging_stats()["hedged"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_opens_and_probes(self):
+        """Test that repeated upstream failures open the circuit and a probe closes it."""
+        registry = ToolRegistry(circuit_breakers=True)
+        tool = SlowTool(delay=0)
+        registry.register_tool(tool)
+        healthy = False
+        original_execute = tool.execute
+        
+        async def execute(capability, parameters, context=None):
+            if not healthy:
+                tool.calls += 1
+                return tool.error_result("Service unavailable", category=ErrorCategory.RETRYABLE)
+            return await original_execute(capability, parameters, context)
+        
+        tool.execute = execute
+        for i in range(5):
+            await registry.execute_capability("slow_call", {"n": i})
+        
+        rejected = await registry.execute_capability("slow_call", {"n": 5})
+        assert tool.calls == 5
+        assert rejected.metadata["circuit"] == "capability:slow_call"
+        assert rejected.metadata["error_category"] == "permanent"
+        circuits = registry.get_registry_info()["circuits"]
+        assert circuits["capability:slow_call"]["state"] == "open"
+        assert circuits["tool:slow"]["state"] == "open"
+        
+        # Once the reset timeout passes, a successful probe closes the circuit
+        for breaker in registry._breakers.values():
+            breaker.reset_timeout = 0
+        healthy = True
+        result = await registry.execute_capability("slow_call", {"n": 6})
+        
+        assert result.is_success()
+        assert registry.get_circuit_stats()["capability:slow_call"]["state"] == "closed"
+        assert registry.get_circuit_stats()["capability:slow_call"]["rejected"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_timed_out_calls_open_circuit(self):
+        """Test that calls to a hanging upstream count as failures and open the circuit."""
+        registry = ToolRegistry(circuit_breakers=True)
+        tool = SlowTool(delay=10)
+        registry.register_tool(tool)
+        
+        for i in range(5):
+            with pytest.raises(asyncio.TimeoutError):
+                await registry.execute_capability("slow_call", {"n": i}, context={"timeout": 0.01})
+        
+        rejected = await registry.execute_capability("slow_call", {"n": 5}, context={"timeout": 0.01})
+        assert tool.calls == 5
+        assert rejected.metadata["circuit"] == "capability:slow_call"
+        circuits = registry.get_circuit_stats()
+        assert circuits["capability:slow_call"]["state"] == "open"
+        assert circuits["tool:slow"]["state"] == "open"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -2,11 +2,24 @@
 Base Tool Interface - Abstract interface for API integration tools
 """
 
+import json
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Any, Union
 from pydantic import BaseModel
 from enum import Enum
 
+from .offload import PostProcessor, get_post_processor
+from .validation import Validator, compile_validator, is_validated
+
+
+# Seconds the tool call in progress may take; set by ToolRegistry from the
+# executor's context so tools can size their HTTP timeouts.
+request_budget: ContextVar[Optional[float]] = ContextVar("request_budget", default=None)
+
 
 class ToolStatus(str, Enum):
     """Tool execution status."""
@@ -16,6 +29,60 @@ class ToolStatus(str, Enum):
     RETRY = "retry"
 
 
+class ErrorCategory(str, Enum):
+    """How a failed tool call should be treated by retry logic."""
+    RETRYABLE = "retryable"
+    RATE_LIMITED = "rate_limited"
+    PERMANENT = "permanent"
+
+
+class ToolError(Exception):
+    """Tool failure carrying an error category and optional retry delay."""
+    
+    def __init__(
+        self,
+        message: str,
+        category: ErrorCategory = ErrorCategory.RETRYABLE,
+        retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.category = category
+        self.retry_after = retry_after
+
+
+def parse_retry_after(headers: Any) -> Optional[float]:
+    """
+    Get seconds to wait before retrying from rate-limit response headers.
+    
+    Understands ``Retry-After`` (seconds or HTTP date) and
+    ``X-RateLimit-Reset`` (epoch seconds).
+    
+    Args:
+        headers: Response headers mapping
+        
+    Returns:
+        Seconds to wait, or None if no header is present
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    
+    reset = headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            return max(0.0, float(reset) - time.time())
+        except ValueError:
+            pass
+    
+    return None
+
+
 class ToolResult(BaseModel):
     """Result from tool execution."""
     status: ToolStatus
@@ -40,11 +107,16 @@ class ToolResult(BaseModel):
 class ToolParameter(BaseModel):
     """Tool parameter definition."""
     name: str
-    type: str  # "string", "number", "boolean", "array", "object"
+    type: str  # "string", "number", "integer", "boolean", "array", "object"
     description: str
     required: bool = True
     default: Optional[Any] = None
     enum: Optional[List[Any]] = None
+    minimum: Optional[float] = None  # Inclusive range for numbers
+    maximum: Optional[float] = None
+    min_length: Optional[int] = None  # Length range for strings (stripped) and arrays
+    max_length: Optional[int] = None
+    error_message: Optional[str] = None  # Replaces the generated validation message
 
 
 class ToolCapability(BaseModel):
@@ -53,6 +125,48 @@ class ToolCapability(BaseModel):
     description: str
     parameters: List[ToolParameter]
     examples: List[str] = []
+    idempotent: bool = True  # Safe to repeat (e.g. hedged or retried) without side effects
+
+
+def canonicalize_parameters(
+    parameters: Dict[str, Any],
+    capability: Optional[ToolCapability] = None
+) -> Dict[str, Any]:
+    """
+    Normalize call parameters so equivalent calls compare equal.
+    
+    Fills in the capability's declared defaults, trims and collapses
+    whitespace in strings, drops None values, turns integral floats into
+    ints, and sorts keys.
+    
+    Args:
+        parameters: Parameters as given by the plan
+        capability: Capability definition used to fill defaults
+        
+    Returns:
+        Canonical parameter dict
+    """
+    canonical: Dict[str, Any] = {}
+    if capability:
+        for param in capability.parameters:
+            if param.default is not None:
+                canonical[param.name] = param.default
+    
+    for name, value in parameters.items():
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = " ".join(value.split())
+        elif isinstance(value, float) and value.is_integer():
+            value = int(value)
+        canonical[name] = value
+    
+    return dict(sorted(canonical.items()))
+
+
+def call_key(capability: str, parameters: Dict[str, Any]) -> str:
+    """Build a stable string key for a capability call with canonical parameters."""
+    return capability + ":" + json.dumps(parameters, sort_keys=True, separators=(",", ":"), default=str)
 
 
 class BaseTool(ABC):
@@ -63,6 +177,9 @@ class BaseTool(ABC):
         self.name = name
         self.description = description
         self.capabilities: List[ToolCapability] = []
+        self.request_timeout = float(os.getenv("REQUEST_TIMEOUT", "30"))
+        self.post_processor: Optional[PostProcessor] = None  # None = shared pool from settings
+        self._validators: Optional[Dict[str, Validator]] = None  # Compiled on first validation
     
     @abstractmethod
     async def execute(
@@ -79,14 +196,42 @@ class BaseTool(ABC):
         """Get list of available capabilities for this tool."""
         pass
     
-    @abstractmethod
     def validate_parameters(
         self,
         capability: str,
         parameters: Dict[str, Any]
     ) -> tuple[bool, Optional[str]]:
-        """Validate parameters for a specific capability."""
-        pass
+        """
+        Validate parameters for a specific capability.
+        
+        Uses validators compiled once from the capabilities' parameter
+        schemas. Parameters already marked as validated for this capability
+        (see ``tools.validation.mark_validated``) are accepted without
+        checking again.
+        """
+        if is_validated(parameters, capability):
+            return True, None
+        
+        if self._validators is None:
+            self._validators = {cap.name: compile_validator(cap) for cap in self.capabilities}
+        validator = self._validators.get(capability)
+        if validator is None:
+            return False, f"Unknown capability: {capability}"
+        
+        error = validator(parameters)
+        return error is None, error
+    
+    async def post_process(self, func: Callable[..., Any], *args: Any, size: int = 0) -> Any:
+        """
+        Shape an API response, off the event loop if the payload is large.
+        
+        Args:
+            func: Module-level post-processing function (picklable for process pools)
+            *args: Arguments for ``func``
+            size: Payload size in items, compared to POSTPROCESS_THRESHOLD
+        """
+        processor = self.post_processor or get_post_processor()
+        return await processor.run(func, *args, size=size)
     
     def get_tool_info(self) -> Dict[str, Any]:
         """Get information about this tool."""
@@ -114,6 +259,42 @@ class BaseTool(ABC):
             ]
         }
     
+    def error_result(
+        self,
+        message: str,
+        error: Optional[Exception] = None,
+        category: Optional[ErrorCategory] = None
+    ) -> ToolResult:
+        """
+        Build an error result, classifying the failure for retry logic.
+        
+        The category (and retry delay, if known) is reported in
+        ``metadata["error_category"]`` / ``metadata["retry_after"]``.
+        Unclassified exceptions are treated as retryable.
+        
+        Args:
+            message: Error message for the result
+            error: Exception that caused the failure, if any
+            category: Explicit category, overriding the exception's
+        """
+        retry_after = None
+        if isinstance(error, ToolError):
+            category = category or error.category
+            retry_after = error.retry_after
+        
+        metadata: Dict[str, Any] = {"error_category": (category or ErrorCategory.RETRYABLE).value}
+        if retry_after is not None:
+            metadata["retry_after"] = retry_after
+        
+        return ToolResult(status=ToolStatus.ERROR, error=message, metadata=metadata)
+    
+    def get_request_timeout(self) -> float:
+        """Get the HTTP timeout for the current call, capped by the executor's budget."""
+        budget = request_budget.get()
+        if budget is None:
+            return self.request_timeout
+        return max(0.001, min(self.request_timeout, budget))
+    
     def validate_api_key(self) -> bool:
         """Validate that required API keys are configured."""
         return True  # Override in subclasses that need API keys
@@ -0,0 +1,138 @@
+"""
+Circuit Breaker - Fail fast while an upstream API is failing
+"""
+
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Optional
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"  # Calls pass through
+    OPEN = "open"  # Calls are rejected until the reset timeout passes
+    HALF_OPEN = "half_open"  # A limited number of probe calls test the upstream
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one tool or capability.
+    
+    Opens after ``failure_threshold`` consecutive failures, or once at least
+    ``failure_rate`` of the last ``window`` calls failed. While open, calls
+    are rejected. After ``reset_timeout`` seconds up to ``half_open_probes``
+    concurrent probe calls are let through: a successful probe closes the
+    circuit and a failed one opens it again.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        window: int = 20,
+        failure_rate: float = 0.5,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1
+    ):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            name: Label used in stats and errors (e.g. "tool:news")
+            failure_threshold: Consecutive failures that open the circuit
+            window: Number of recent calls used for the failure rate
+            failure_rate: Failure ratio over a full window that opens the circuit
+            reset_timeout: Seconds the circuit stays open before probing
+            half_open_probes: Concurrent probe calls allowed while half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.failure_rate = failure_rate
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = max(1, half_open_probes)
+        
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probes_in_flight = 0
+        self.times_opened = 0
+        self.rejected = 0
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True = success
+    
+    def allow(self) -> bool:
+        """Check whether a call may pass, moving from open to half-open once the timeout passes."""
+        if self.state == CircuitState.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = CircuitState.HALF_OPEN
+            self.probes_in_flight = 0
+        
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.HALF_OPEN:
+            return self.probes_in_flight < self.half_open_probes
+        return False
+    
+    def retry_after(self) -> float:
+        """Get seconds until an open circuit starts probing."""
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+    
+    def start_call(self) -> None:
+        """Mark an allowed call as started (counts half-open probes)."""
+        if self.state == CircuitState.HALF_OPEN:
+            self.probes_in_flight += 1
+    
+    def record_success(self) -> None:
+        """Record a successful call, closing a half-open circuit."""
+        self._finish_probe()
+        self.consecutive_failures = 0
+        self._outcomes.append(True)
+        if self.state == CircuitState.HALF_OPEN:
+            self.state = CircuitState.CLOSED
+            self._outcomes.clear()
+    
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if a threshold is crossed."""
+        self._finish_probe()
+        self.consecutive_failures += 1
+        self._outcomes.append(False)
+        
+        if self.state == CircuitState.HALF_OPEN:
+            self._open()
+        elif self.state == CircuitState.CLOSED:
+            failures = self._outcomes.count(False)
+            window_full = len(self._outcomes) == self._outcomes.maxlen
+            if self.consecutive_failures >= self.failure_threshold or (
+                window_full and failures / len(self._outcomes) >= self.failure_rate
+            ):
+                self._open()
+    
+    def record_cancelled(self) -> None:
+        """Release a call that ended without an outcome (e.g. cancelled)."""
+        self._finish_probe()
+    
+    def _finish_probe(self) -> None:
+        """Release a half-open probe slot."""
+        if self.state == CircuitState.HALF_OPEN and self.probes_in_flight > 0:
+            self.probes_in_flight -= 1
+    
+    def _open(self) -> None:
+        """Open the circuit."""
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        self.probes_in_flight = 0
+        self.times_opened += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get circuit state and failure statistics."""
+        self.allow()  # Report half-open once the reset timeout has passed
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "window_failures": self._outcomes.count(False),
+            "window_calls": len(self._outcomes),
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_after": self.retry_after()
+        }
@@ -0,0 +1,128 @@
+"""
+Result Cache - TTL + LRU cache for tool capability results
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .base import ToolResult
+
+
+class ResultCache:
+    """
+    Cache of successful tool results keyed by capability call.
+    
+    Entries expire after a per-capability TTL and the least recently used
+    entries are evicted once either the entry count or the approximate
+    serialized size exceeds its bound.
+    """
+    
+    def __init__(
+        self,
+        default_ttl: float = 3600,
+        capability_ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024
+    ):
+        """
+        Initialize result cache.
+        
+        Args:
+            default_ttl: Seconds a result stays fresh if its capability has no TTL
+            capability_ttls: Mapping of capability name -> TTL in seconds
+                (0 disables caching for that capability)
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total approximate size of cached results
+        """
+        self.default_ttl = default_ttl
+        self.capability_ttls = dict(capability_ttls or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        
+        # key -> (expires_at, size, result); order is least to most recently used
+        self._entries: "OrderedDict[str, Tuple[float, int, ToolResult]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get_ttl(self, capability: str) -> float:
+        """Get the TTL in seconds for a capability."""
+        return self.capability_ttls.get(capability, self.default_ttl)
+    
+    def get(self, key: str) -> Optional[ToolResult]:
+        """
+        Get a fresh cached result.
+        
+        Args:
+            key: Call key (see tools.base.call_key)
+        
+        Returns:
+            Cached result or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expires_at, _, result = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+    
+    def set(self, capability: str, key: str, result: ToolResult) -> None:
+        """
+        Cache a result if it is successful and its capability is cacheable.
+        
+        Args:
+            capability: Capability that produced the result
+            key: Call key (see tools.base.call_key)
+            result: Result to cache
+        """
+        ttl = self.get_ttl(capability)
+        if ttl <= 0 or not result.is_success():
+            return
+        
+        size = len(result.model_dump_json())
+        if size > self.max_bytes:
+            return
+        
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, size, result)
+        self.total_bytes += size
+        
+        while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+    
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its size."""
+        _, size, _ = self._entries.pop(key)
+        self.total_bytes -= size
+    
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        self._entries.clear()
+        self.total_bytes = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions
+        }
@@ -8,7 +8,58 @@ import aiohttp
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-from .base import BaseTool, ToolResult, ToolStatus, ToolCapability, ToolParameter
+from config import settings
+from .base import (
+    BaseTool, ToolResult, ToolStatus, ToolCapability, ToolParameter,
+    ErrorCategory, ToolError, parse_retry_after
+)
+from .pacing import RateLimitPacer
+
+
+def format_repositories(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Extract the fields the tool returns from GitHub repository search items.
+    
+    Module-level so it can run in a process pool.
+    """
+    repositories = []
+    for item in items:
+        repo_info = {
+            "name": item["name"],
+            "full_name": item["full_name"],
+            "owner": item["owner"]["login"],
+            "description": item.get("description", ""),
+            "stars": item["stargazers_count"],
+            "forks": item["forks_count"],
+            "language": item.get("language"),
+            "updated_at": item["updated_at"],
+            "created_at": item["created_at"],
+            "url": item["html_url"],
+            "topics": item.get("topics", [])
+        }
+        repositories.append(repo_info)
+    return repositories
+
+
+_pacer: Optional[RateLimitPacer] = None
+
+
+def get_github_pacer() -> RateLimitPacer:
+    """
+    Get the pacer shared by every GitHubTool, creating it from settings on first use.
+    
+    GitHub meters the search API separately from the rest of the REST API
+    ("core"), so each has its own bucket. The assumed quotas apply until the
+    first response reports the real ones.
+    """
+    global _pacer
+    if _pacer is None:
+        _pacer = RateLimitPacer(
+            {"core": 5000, "search": 30},
+            burst=settings.github_pacing_burst,
+            max_wait=settings.github_pacing_max_wait or None
+        )
+    return _pacer
 
 
 class GitHubTool(BaseTool):
@@ -25,6 +76,9 @@ class GitHubTool(BaseTool):
         self.base_url = "https://api.github.com"
         self.rate_limit_remaining = 5000
         self.rate_limit_reset = None
+        self.pacer: Optional[RateLimitPacer] = (
+            get_github_pacer() if settings.github_pacing_enabled else None
+        )
         
         # Define capabilities
         self.capabilities = [
@@ -56,10 +110,12 @@ class GitHubTool(BaseTool):
                     ),
                     ToolParameter(
                         name="per_page",
-                        type="number",
+                        type="integer",
                         description="Number of results per page (max 100)",
                         required=False,
-                        default=10
+                        default=10,
+                        minimum=1,
+                        maximum=100
                     )
                 ],
                 examples=[
@@ -124,10 +180,12 @@ class GitHubTool(BaseTool):
                     ),
                     ToolParameter(
                         name="per_page",
-                        type="number",
+                        type="integer",
                         description="Number of commits to return (max 100)",
                         required=False,
-                        default=10
+                        default=10,
+                        minimum=1,
+                        maximum=100
                     )
                 ],
                 examples=[
@@ -148,9 +206,9 @@ class GitHubTool(BaseTool):
             # Validate parameters
             is_valid, error_msg = self.validate_parameters(capability, parameters)
             if not is_valid:
-                return ToolResult(
-                    status=ToolStatus.ERROR,
-                    error=f"Invalid parameters: {error_msg}"
+                return self.error_result(
+                    f"Invalid parameters: {error_msg}",
+                    category=ErrorCategory.PERMANENT
                 )
             
             # Execute the specific capability
@@ -163,16 +221,13 @@ class GitHubTool(BaseTool):
             elif capability == "list_repository_commits":
                 return await self._list_repository_commits(parameters)
             else:
-                return ToolResult(
-                    status=ToolStatus.ERROR,
-                    error=f"Unknown capability: {capability}"
+                return self.error_result(
+                    f"Unknown capability: {capability}",
+                    category=ErrorCategory.PERMANENT
                 )
                 
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"GitHub API error: {str(e)}"
-            )
+            return self.error_result(f"GitHub API error: {str(e)}", e)
     
     async def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make authenticated request to GitHub API."""
@@ -184,21 +239,56 @@ class GitHubTool(BaseTool):
         if self.token:
             headers["Authorization"] = f"token {self.token}"
         
+        if self.pacer is None:
+            return await self._send_request(url, headers, params)
+        
+        bucket = "search" if url.startswith(f"{self.base_url}/search/") else "core"
+        async with self.pacer.acquire(bucket):
+            return await self._send_request(url, headers, params, bucket)
+    
+    async def _send_request(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        bucket: str = "core"
+    ) -> Dict[str, Any]:
+        """Send a GET request and map the response to data or a ToolError."""
         async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
+            async with session.get(
+                url,
+                headers=headers,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=self.get_request_timeout())
+            ) as response:
                 # Update rate limit info
                 self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 0))
                 self.rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
+                if self.pacer is not None:
+                    self.pacer.update(bucket, response.headers)
                 
                 if response.status == 200:
                     return await response.json()
+                elif response.status == 429 or (
+                    response.status == 403 and (
+                        "Retry-After" in response.headers or
+                        response.headers.get("X-RateLimit-Remaining") == "0"
+                    )
+                ):
+                    # Primary (remaining == 0) or secondary (Retry-After) rate limit
+                    raise ToolError(
+                        "Rate limit exceeded",
+                        ErrorCategory.RATE_LIMITED,
+                        parse_retry_after(response.headers)
+                    )
                 elif response.status == 403:
-                    raise Exception("Rate limit exceeded or insufficient permissions")
+                    raise ToolError("Insufficient permissions", ErrorCategory.PERMANENT)
                 elif response.status == 404:
-                    raise Exception("Resource not found")
+                    raise ToolError("Resource not found", ErrorCategory.PERMANENT)
                 else:
                     error_text = await response.text()
-                    raise Exception(f"HTTP {response.status}: {error_text}")
+                    category = ErrorCategory.RETRYABLE if response.status >= 500 else ErrorCategory.PERMANENT
+                    raise ToolError(f"HTTP {response.status}: {error_text}", category)
     
     async def _search_repositories(self, params: Dict[str, Any]) -> ToolResult:
         """Search for repositories."""
@@ -215,22 +305,8 @@ class GitHubTool(BaseTool):
             data = await self._make_request(url, search_params)
             
             # Extract relevant information
-            repositories = []
-            for item in data.get("items", []):
-                repo_info = {
-                    "name": item["name"],
-                    "full_name": item["full_name"],
-                    "owner": item["owner"]["login"],
-                    "description": item.get("description", ""),
-                    "stars": item["stargazers_count"],
-                    "forks": item["forks_count"],
-                    "language": item.get("language"),
-                    "updated_at": item["updated_at"],
-                    "created_at": item["created_at"],
-                    "url": item["html_url"],
-                    "topics": item.get("topics", [])
-                }
-                repositories.append(repo_info)
+            items = data.get("items", [])
+            repositories = await self.post_process(format_repositories, items, size=len(items))
             
             return ToolResult(
                 status=ToolStatus.SUCCESS,
@@ -246,10 +322,7 @@ class GitHubTool(BaseTool):
             )
             
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"Repository search failed: {str(e)}"
-            )
+            return self.error_result(f"Repository search failed: {str(e)}", e)
     
     async def _get_repository(self, params: Dict[str, Any]) -> ToolResult:
         """Get detailed repository information."""
@@ -291,10 +364,7 @@ class GitHubTool(BaseTool):
             )
             
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"Repository lookup failed: {str(e)}"
-            )
+            return self.error_result(f"Repository lookup failed: {str(e)}", e)
     
     async def _get_user_info(self, params: Dict[str, Any]) -> ToolResult:
         """Get user information."""
@@ -329,10 +399,7 @@ class GitHubTool(BaseTool):
             )
             
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"User lookup failed: {str(e)}"
-            )
+            return self.error_result(f"User lookup failed: {str(e)}", e)
     
     async def _list_repository_commits(self, params: Dict[str, Any]) -> ToolResult:
         """List commits in a repository."""
@@ -369,43 +436,12 @@ class GitHubTool(BaseTool):
             )
             
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"Commit listing failed: {str(e)}"
-            )
+            return self.error_result(f"Commit listing failed: {str(e)}", e)
     
     def get_capabilities(self) -> List[ToolCapability]:
         """Get list of available capabilities."""
         return self.capabilities
     
-    def validate_parameters(
-        self,
-        capability: str,
-        parameters: Dict[str, Any]
-    ) -> tuple[bool, Optional[str]]:
-        """Validate parameters for a capability."""
-        cap = next((c for c in self.capabilities if c.name == capability), None)
-        if not cap:
-            return False, f"Unknown capability: {capability}"
-        
-        # Check required parameters
-        for param in cap.parameters:
-            if param.required and param.name not in parameters:
-                return False, f"Missing required parameter: {param.name}"
-        
-        # Validate parameter types and values
-        if capability == "search_repositories":
-            per_page = parameters.get("per_page", 10)
-            if not isinstance(per_page, int) or per_page < 1 or per_page > 100:
-                return False, "per_page must be an integer between 1 and 100"
-        
-        elif capability == "list_repository_commits":
-            per_page = parameters.get("per_page", 10)
-            if not isinstance(per_page, int) or per_page < 1 or per_page > 100:
-                return False, "per_page must be an integer between 1 and 100"
-        
-        return True, None
-    
     def validate_api_key(self) -> bool:
         """Validate GitHub API token."""
         if not self.token:
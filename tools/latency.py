@@ -0,0 +1,62 @@
+"""
+Latency Tracker - Rolling per-capability latency percentiles
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class LatencyTracker:
+    """Keeps the most recent call latencies per capability and reports percentiles."""
+    
+    def __init__(self, window: int = 256):
+        """
+        Initialize latency tracker.
+        
+        Args:
+            window: Number of most recent samples kept per capability
+        """
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+    
+    def record(self, capability: str, seconds: float) -> None:
+        """Record the latency of one call."""
+        samples = self._samples.get(capability)
+        if samples is None:
+            samples = self._samples[capability] = deque(maxlen=self.window)
+        samples.append(seconds)
+    
+    def sample_count(self, capability: str) -> int:
+        """Get the number of samples held for a capability."""
+        return len(self._samples.get(capability, ()))
+    
+    def percentile(self, capability: str, pct: float) -> Optional[float]:
+        """
+        Get a latency percentile for a capability.
+        
+        Args:
+            capability: Capability name
+            pct: Percentile between 0 and 100
+        
+        Returns:
+            Latency in seconds (nearest-rank), or None without samples
+        """
+        samples = self._samples.get(capability)
+        if not samples:
+            return None
+        
+        ordered = sorted(samples)
+        rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[rank]
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get sample counts and p50/p95/p99 for every tracked capability."""
+        return {
+            capability: {
+                "samples": len(samples),
+                "p50": self.percentile(capability, 50),
+                "p95": self.percentile(capability, 95),
+                "p99": self.percentile(capability, 99)
+            }
+            for capability, samples in self._samples.items()
+        }
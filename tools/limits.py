@@ -0,0 +1,147 @@
+"""
+Concurrency Limits - Semaphores that bound in-flight tool calls
+"""
+
+import asyncio
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+
+class ConcurrencyLimit:
+    """Named semaphore that records how long callers queue for a slot."""
+    
+    def __init__(self, name: str, limit: int):
+        """
+        Initialize concurrency limit.
+        
+        Args:
+            name: Label used in stats (e.g. "tool:github")
+            limit: Maximum number of concurrent holders
+        """
+        if limit < 1:
+            raise ValueError(f"Concurrency limit for {name} must be at least 1")
+        
+        self.name = name
+        self.limit = limit
+        self.in_flight = 0
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore for the running loop (CLI runs one loop per request)."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.limit)
+            self._loop = loop
+        return self._semaphore
+    
+    @asynccontextmanager
+    async def hold(self) -> AsyncIterator[float]:
+        """Hold a slot for the duration of the block, yielding the queue wait."""
+        semaphore = self._get_semaphore()
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        
+        wait = time.perf_counter() - start
+        self.acquired += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.in_flight += 1
+        try:
+            yield wait
+        finally:
+            self.in_flight -= 1
+            semaphore.release()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limit usage and queue-wait statistics."""
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "total_wait": self.total_wait,
+            "avg_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+            "max_wait": self.max_wait
+        }
+
+
+class ConcurrencyLimiter:
+    """Per-capability, per-tool and global concurrency limits for tool calls."""
+    
+    def __init__(
+        self,
+        global_limit: Optional[int] = None,
+        tool_limits: Optional[Dict[str, int]] = None,
+        capability_limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize concurrency limiter.
+        
+        Limits that are missing or non-positive are treated as unlimited.
+        
+        Args:
+            global_limit: Maximum concurrent calls across all tools
+            tool_limits: Mapping of tool name -> maximum concurrent calls
+            capability_limits: Mapping of capability name -> maximum concurrent calls
+        """
+        self.global_limit = (
+            ConcurrencyLimit("global", global_limit) if global_limit and global_limit > 0 else None
+        )
+        self.tool_limits = {
+            name: ConcurrencyLimit(f"tool:{name}", limit)
+            for name, limit in (tool_limits or {}).items()
+            if limit and limit > 0
+        }
+        self.capability_limits = {
+            name: ConcurrencyLimit(f"capability:{name}", limit)
+            for name, limit in (capability_limits or {}).items()
+            if limit and limit > 0
+        }
+    
+    def _limits_for(self, tool_name: str, capability: str) -> List[ConcurrencyLimit]:
+        """
+        Get the limits that apply to a call, narrowest first.
+        
+        Every caller acquires in the same order (capability, tool, global), so
+        slots cannot deadlock, and a global slot is only taken once the call is
+        allowed by its narrower limits.
+        """
+        limits = []
+        if capability in self.capability_limits:
+            limits.append(self.capability_limits[capability])
+        if tool_name in self.tool_limits:
+            limits.append(self.tool_limits[tool_name])
+        if self.global_limit:
+            limits.append(self.global_limit)
+        return limits
+    
+    @asynccontextmanager
+    async def slot(self, tool_name: str, capability: str) -> AsyncIterator[Dict[str, float]]:
+        """
+        Hold every applicable limit for the duration of the block.
+        
+        Yields:
+            Mapping of limit name -> seconds spent queueing for it
+        """
+        waits: Dict[str, float] = {}
+        async with AsyncExitStack() as stack:
+            for limit in self._limits_for(tool_name, capability):
+                waits[limit.name] = await stack.enter_async_context(limit.hold())
+            yield waits
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for every configured limit, keyed by limit name."""
+        limits = list(self.capability_limits.values()) + list(self.tool_limits.values())
+        if self.global_limit:
+            limits.append(self.global_limit)
+        return {limit.name: limit.get_stats() for limit in limits}
@@ -3,12 +3,64 @@ News API Tool - Integration with NewsAPI
 """
 
 import os
+import re
 import asyncio
 import aiohttp
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
-from .base import BaseTool, ToolResult, ToolStatus, ToolCapability, ToolParameter
+from .base import (
+    BaseTool, ToolResult, ToolStatus, ToolCapability, ToolParameter,
+    ErrorCategory, ToolError, parse_retry_after
+)
+
+
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def create_summary(content: str, max_length: int = 200) -> str:
+    """Create a summary from article content."""
+    if not content:
+        return ""
+    
+    # Remove HTML tags and extra whitespace
+    clean_content = HTML_TAG_PATTERN.sub('', content)
+    clean_content = WHITESPACE_PATTERN.sub(' ', clean_content).strip()
+    
+    if len(clean_content) <= max_length:
+        return clean_content
+    
+    # Truncate at word boundary
+    truncated = clean_content[:max_length]
+    last_space = truncated.rfind(' ')
+    if last_space > max_length * 0.8:  # Only truncate if we have most of the content
+        truncated = truncated[:last_space]
+    
+    return truncated + "..."
+
+
+def format_articles(raw_articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Convert NewsAPI articles to the tool's article format with summaries.
+    
+    Module-level so it can run in a process pool.
+    """
+    articles = []
+    for article in raw_articles:
+        article_info = {
+            "title": article.get("title", ""),
+            "description": article.get("description", ""),
+            "content": article.get("content", ""),
+            "source": article.get("source", {}).get("name", ""),
+            "author": article.get("author", ""),
+            "url": article.get("url", ""),
+            "image_url": article.get("urlToImage", ""),
+            "published_at": article.get("publishedAt", ""),
+            "summary": create_summary(article.get("description", article.get("content", "")))
+        }
+        articles.append(article_info)
+    return articles
 
 
 class NewsTool(BaseTool):
@@ -34,7 +86,10 @@ class NewsTool(BaseTool):
                         name="country",
                         type="string",
                         description="ISO 3166-1 alpha-2 country code (e.g., 'us', 'gb', 'jp')",
-                        required=False
+                        required=False,
+                        min_length=2,
+                        max_length=2,
+                        error_message="country must be a 2-letter ISO country code"
                     ),
                     ToolParameter(
                         name="category",
@@ -57,10 +112,12 @@ class NewsTool(BaseTool):
                     ),
                     ToolParameter(
                         name="page_size",
-                        type="number",
+                        type="integer",
                         description="Number of results to return (max 100)",
                         required=False,
-                        default=20
+                        default=20,
+                        minimum=1,
+                        maximum=100
                     )
                 ],
                 examples=[
@@ -77,14 +134,18 @@ class NewsTool(BaseTool):
                         name="query",
                         type="string",
                         description="Search query or keywords",
-                        required=True
+                        required=True,
+                        min_length=1
                     ),
                     ToolParameter(
                         name="language",
                         type="string",
                         description="ISO 639-1 language code (e.g., 'en', 'es', 'fr')",
                         required=False,
-                        default="en"
+                        default="en",
+                        min_length=2,
+                        max_length=2,
+                        error_message="language must be a 2-letter ISO language code"
                     ),
                     ToolParameter(
                         name="sort_by",
@@ -96,10 +157,12 @@ class NewsTool(BaseTool):
                     ),
                     ToolParameter(
                         name="page_size",
-                        type="number",
+                        type="integer",
                         description="Number of results to return (max 100)",
                         required=False,
-                        default=20
+                        default=20,
+                        minimum=1,
+                        maximum=100
                     )
                 ],
                 examples=[
@@ -123,13 +186,19 @@ class NewsTool(BaseTool):
                         name="language",
                         type="string",
                         description="Filter by language (ISO 639-1)",
-                        required=False
+                        required=False,
+                        min_length=2,
+                        max_length=2,
+                        error_message="language must be a 2-letter ISO language code"
                     ),
                     ToolParameter(
                         name="country",
                         type="string",
                         description="Filter by country (ISO 3166-1)",
-                        required=False
+                        required=False,
+                        min_length=2,
+                        max_length=2,
+                        error_message="country must be a 2-letter ISO country code"
                     )
                 ],
                 examples=[
@@ -150,17 +219,17 @@ class NewsTool(BaseTool):
         try:
             # Validate API key
             if not self.validate_api_key():
-                return ToolResult(
-                    status=ToolStatus.ERROR,
-                    error="NEWS_API_KEY not configured or invalid"
+                return self.error_result(
+                    "NEWS_API_KEY not configured or invalid",
+                    category=ErrorCategory.PERMANENT
                 )
             
             # Validate parameters
             is_valid, error_msg = self.validate_parameters(capability, parameters)
             if not is_valid:
-                return ToolResult(
-                    status=ToolStatus.ERROR,
-                    error=f"Invalid parameters: {error_msg}"
+                return self.error_result(
+                    f"Invalid parameters: {error_msg}",
+                    category=ErrorCategory.PERMANENT
                 )
             
             # Execute the specific capability
@@ -171,16 +240,13 @@ class NewsTool(BaseTool):
             elif capability == "get_sources":
                 return await self._get_sources(parameters)
             else:
-                return ToolResult(
-                    status=ToolStatus.ERROR,
-                    error=f"Unknown capability: {capability}"
+                return self.error_result(
+                    f"Unknown capability: {capability}",
+                    category=ErrorCategory.PERMANENT
                 )
                 
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"News API error: {str(e)}"
-            )
+            return self.error_result(f"News API error: {str(e)}", e)
     
     async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Make request to NewsAPI."""
@@ -189,16 +255,25 @@ class NewsTool(BaseTool):
         url = f"{self.base_url}/{endpoint}"
         
         async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
+            async with session.get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=self.get_request_timeout())
+            ) as response:
                 if response.status == 200:
                     return await response.json()
                 elif response.status == 401:
-                    raise Exception("Invalid API key")
+                    raise ToolError("Invalid API key", ErrorCategory.PERMANENT)
                 elif response.status == 429:
-                    raise Exception("Rate limit exceeded")
+                    raise ToolError(
+                        "Rate limit exceeded",
+                        ErrorCategory.RATE_LIMITED,
+                        parse_retry_after(response.headers)
+                    )
                 else:
                     error_text = await response.text()
-                    raise Exception(f"HTTP {response.status}: {error_text}")
+                    category = ErrorCategory.RETRYABLE if response.status >= 500 else ErrorCategory.PERMANENT
+                    raise ToolError(f"HTTP {response.status}: {error_text}", category)
     
     async def _get_top_headlines(self, params: Dict[str, Any]) -> ToolResult:
         """Get top headlines."""
@@ -219,20 +294,8 @@ class NewsTool(BaseTool):
         try:
             data = await self._make_request("top-headlines", request_params)
             
-            articles = []
-            for article in data.get("articles", []):
-                article_info = {
-                    "title": article.get("title", ""),
-                    "description": article.get("description", ""),
-                    "content": article.get("content", ""),
-                    "source": article.get("source", {}).get("name", ""),
-                    "author": article.get("author", ""),
-                    "url": article.get("url", ""),
-                    "image_url": article.get("urlToImage", ""),
-                    "published_at": article.get("publishedAt", ""),
-                    "summary": self._create_summary(article.get("description", article.get("content", "")))
-                }
-                articles.append(article_info)
+            raw_articles = data.get("articles", [])
+            articles = await self.post_process(format_articles, raw_articles, size=len(raw_articles))
             
             return ToolResult(
                 status=ToolStatus.SUCCESS,
@@ -248,10 +311,7 @@ class NewsTool(BaseTool):
             )
             
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"Headlines lookup failed: {str(e)}"
-            )
+            return self.error_result(f"Headlines lookup failed: {str(e)}", e)
     
     async def _search_news(self, params: Dict[str, Any]) -> ToolResult:
         """Search for news articles."""
@@ -271,20 +331,8 @@ class NewsTool(BaseTool):
         try:
             data = await self._make_request("everything", request_params)
             
-            articles = []
-            for article in data.get("articles", []):
-                article_info = {
-                    "title": article.get("title", ""),
-                    "description": article.get("description", ""),
-                    "content": article.get("content", ""),
-                    "source": article.get("source", {}).get("name", ""),
-                    "author": article.get("author", ""),
-                    "url": article.get("url", ""),
-                    "image_url": article.get("urlToImage", ""),
-                    "published_at": article.get("publishedAt", ""),
-                    "summary": self._create_summary(article.get("description", article.get("content", "")))
-                }
-                articles.append(article_info)
+            raw_articles = data.get("articles", [])
+            articles = await self.post_process(format_articles, raw_articles, size=len(raw_articles))
             
             return ToolResult(
                 status=ToolStatus.SUCCESS,
@@ -304,10 +352,7 @@ class NewsTool(BaseTool):
             )
             
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"News search failed: {str(e)}"
-            )
+            return self.error_result(f"News search failed: {str(e)}", e)
     
     async def _get_sources(self, params: Dict[str, Any]) -> ToolResult:
         """Get available news sources."""
@@ -349,76 +394,16 @@ class NewsTool(BaseTool):
             )
             
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"Sources lookup failed: {str(e)}"
-            )
+            return self.error_result(f"Sources lookup failed: {str(e)}", e)
     
     def _create_summary(self, content: str, max_length: int = 200) -> str:
         """Create a summary from article content."""
-        if not content:
-            return ""
-        
-        # Remove HTML tags and extra whitespace
-        import re
-        clean_content = re.sub(r'<[^>]+>', '', content)
-        clean_content = re.sub(r'\s+', ' ', clean_content).strip()
-        
-        if len(clean_content) <= max_length:
-            return clean_content
-        
-        # Truncate at word boundary
-        truncated = clean_content[:max_length]
-        last_space = truncated.rfind(' ')
-        if last_space > max_length * 0.8:  # Only truncate if we have most of the content
-            truncated = truncated[:last_space]
-        
-        return truncated + "..."
+        return create_summary(content, max_length)
     
     def get_capabilities(self) -> List[ToolCapability]:
         """Get list of available capabilities."""
         return self.capabilities
     
-    def validate_parameters(
-        self,
-        capability: str,
-        parameters: Dict[str, Any]
-    ) -> tuple[bool, Optional[str]]:
-        """Validate parameters for a capability."""
-        cap = next((c for c in self.capabilities if c.name == capability), None)
-        if not cap:
-            return False, f"Unknown capability: {capability}"
-        
-        # Check required parameters
-        for param in cap.parameters:
-            if param.required and param.name not in parameters:
-                return False, f"Missing required parameter: {param.name}"
-        
-        # Validate parameter types and values
-        if capability == "search_news":
-            query = parameters.get("query", "")
-            if not isinstance(query, str) or len(query.strip()) == 0:
-                return False, "query must be a non-empty string"
-        
-        # Validate page_size
-        page_size = parameters.get("page_size", 20)
-        if not isinstance(page_size, int) or page_size < 1 or page_size > 100:
-            return False, "page_size must be an integer between 1 and 100"
-        
-        # Validate country codes
-        if "country" in parameters:
-            country = parameters["country"]
-            if not isinstance(country, str) or len(country) != 2:
-                return False, "country must be a 2-letter ISO country code"
-        
-        # Validate language codes
-        if "language" in parameters:
-            language = parameters["language"]
-            if not isinstance(language, str) or len(language) != 2:
-                return False, "language must be a 2-letter ISO language code"
-        
-        return True, None
-    
     def validate_api_key(self) -> bool:
         """Validate NewsAPI key."""
         if not self.api_key:
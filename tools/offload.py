@@ -0,0 +1,113 @@
+"""
+Post-Processing Offload - Runs CPU-heavy result shaping off the event loop
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from config import settings
+
+
+class PostProcessor:
+    """
+    Runs tool post-processing inline or in a thread/process pool.
+    
+    Small payloads (fewer than ``threshold`` items) are processed inline,
+    where the hand-off would cost more than it saves. Functions sent to a
+    process pool must be picklable, i.e. defined at module level.
+    """
+    
+    KINDS = ("inline", "thread", "process")
+    
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: Optional[int] = None,
+        threshold: int = 200,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize post-processor.
+        
+        Args:
+            kind: "inline", "thread" or "process"
+            max_workers: Pool size (None = concurrent.futures default)
+            threshold: Minimum payload size (items) that is offloaded
+            executor: Custom executor to use instead of creating a pool
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unsupported post-processing executor: {kind}")
+        
+        self.kind = kind
+        self.max_workers = max_workers
+        self.threshold = threshold
+        self._executor = executor
+        self.inline = 0
+        self.offloaded = 0
+    
+    def _get_executor(self) -> Executor:
+        """Create the pool on first use."""
+        if self._executor is None:
+            pool = ProcessPoolExecutor if self.kind == "process" else ThreadPoolExecutor
+            self._executor = pool(max_workers=self.max_workers)
+        return self._executor
+    
+    async def run(self, func: Callable[..., Any], *args: Any, size: int = 0) -> Any:
+        """
+        Run ``func(*args)``, offloading it when the payload is large enough.
+        
+        Args:
+            func: Post-processing function
+            *args: Arguments for ``func``
+            size: Payload size (e.g. number of items) compared to the threshold
+        
+        Returns:
+            Return value of ``func``
+        """
+        if self.kind == "inline" or size < self.threshold:
+            self.inline += 1
+            return func(*args)
+        
+        self.offloaded += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args))
+    
+    def shutdown(self) -> None:
+        """Shut down the pool (a new one is created on next use)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the configuration and inline/offloaded call counts."""
+        return {
+            "kind": self.kind,
+            "threshold": self.threshold,
+            "inline": self.inline,
+            "offloaded": self.offloaded
+        }
+
+
+_post_processor: Optional[PostProcessor] = None
+
+
+def get_post_processor() -> PostProcessor:
+    """Get the shared post-processor, creating it from settings on first use."""
+    global _post_processor
+    if _post_processor is None:
+        _post_processor = PostProcessor(
+            kind=settings.postprocess_executor.lower(),
+            max_workers=settings.postprocess_max_workers or None,
+            threshold=settings.postprocess_threshold
+        )
+    return _post_processor
+
+
+def set_post_processor(post_processor: Optional[PostProcessor]) -> None:
+    """Replace the shared post-processor (None recreates it from settings)."""
+    global _post_processor
+    if _post_processor is not None and _post_processor is not post_processor:
+        _post_processor.shutdown()
+    _post_processor = post_processor
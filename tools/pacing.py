@@ -0,0 +1,191 @@
+"""
+Rate-Limit Pacing - Spreads an API's remaining quota evenly until it resets
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from .base import ErrorCategory, ToolError, request_budget
+
+
+class RateLimitBucket:
+    """
+    Token bucket refilled so the remaining quota lasts until the reset time.
+    
+    The refill rate is recomputed from the latest ``X-RateLimit-Remaining`` /
+    ``X-RateLimit-Reset`` headers (minus requests still in flight), and up to
+    ``burst`` requests may go out back to back. Callers queue in FIFO order
+    for the next token instead of spending the quota early and failing later.
+    """
+    
+    def __init__(self, name: str, limit: int, burst: int = 5):
+        """
+        Initialize rate-limit bucket.
+        
+        Args:
+            name: Label used in stats and errors (e.g. "search")
+            limit: Quota assumed per window until headers report one
+            burst: Requests that may be sent back to back
+        """
+        self.name = name
+        self.limit = limit
+        self.burst = max(1, burst)
+        self.remaining = limit
+        self.reset_at: Optional[float] = None  # Epoch seconds
+        self.in_flight = 0
+        self.tokens = float(self.burst)
+        self.updated = time.time()
+        self.acquired = 0
+        self.paced = 0
+        self.total_wait = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the queue lock for the running loop (CLI runs one loop per request)."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+    
+    def update(self, remaining: int, reset_at: float, limit: Optional[int] = None) -> None:
+        """Apply the quota reported by a response."""
+        self.remaining = max(0, remaining)
+        self.reset_at = reset_at
+        if limit:
+            self.limit = limit
+    
+    def _available(self) -> int:
+        """Quota left for requests that have not been sent yet."""
+        return self.remaining - self.in_flight
+    
+    def delay(self) -> float:
+        """Get seconds until the next request may be sent, refilling tokens up to now."""
+        now = time.time()
+        if self.reset_at is not None and now >= self.reset_at:
+            # Window rolled over; the quota is full again until a response says otherwise
+            self.remaining = self.limit
+            self.reset_at = None
+        
+        available = self._available()
+        if self.reset_at is None:
+            # No quota information yet: only the (assumed) quota bounds requests
+            self.updated = now
+            self.tokens = float(self.burst)
+            return 0.0 if available > 0 else 1.0
+        if available <= 0:
+            return self.reset_at - now
+        
+        rate = available / max(self.reset_at - now, 1e-3)
+        self.tokens = min(float(min(self.burst, available)), self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) / rate
+    
+    @asynccontextmanager
+    async def acquire(self, max_wait: Optional[float] = None) -> AsyncIterator[float]:
+        """
+        Wait for a token and hold an in-flight slot for the duration of the block.
+        
+        Args:
+            max_wait: Longest acceptable wait; also capped by the current call's
+                request budget. Longer waits raise a rate-limited ToolError.
+        
+        Yields:
+            Seconds spent waiting
+        """
+        budget = request_budget.get()
+        if budget is not None:
+            max_wait = budget if max_wait is None else min(max_wait, budget)
+        
+        waited = 0.0
+        async with self._get_lock():
+            delay = self.delay()
+            while delay > 0:
+                if max_wait is not None and waited + delay > max_wait:
+                    raise ToolError(
+                        f"Rate limit budget for {self.name} exhausted",
+                        ErrorCategory.RATE_LIMITED,
+                        retry_after=delay
+                    )
+                await asyncio.sleep(delay)
+                waited += delay
+                delay = self.delay()
+            
+            self.tokens -= 1.0
+            self.in_flight += 1
+        
+        self.acquired += 1
+        self.total_wait += waited
+        if waited > 0:
+            self.paced += 1
+        try:
+            yield waited
+        finally:
+            self.in_flight -= 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get quota and pacing statistics."""
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_in": max(0.0, self.reset_at - time.time()) if self.reset_at is not None else None,
+            "in_flight": self.in_flight,
+            "acquired": self.acquired,
+            "paced": self.paced,
+            "total_wait": self.total_wait
+        }
+
+
+class RateLimitPacer:
+    """Set of named rate-limit buckets for one API (e.g. GitHub "core" and "search")."""
+    
+    def __init__(
+        self,
+        limits: Dict[str, int],
+        burst: int = 5,
+        max_wait: Optional[float] = None
+    ):
+        """
+        Initialize pacer.
+        
+        Args:
+            limits: Mapping of bucket name -> quota assumed until headers report one
+            burst: Requests per bucket that may be sent back to back
+            max_wait: Longest a request may queue for quota (None = no limit)
+        """
+        self.buckets = {
+            name: RateLimitBucket(name, limit, burst)
+            for name, limit in limits.items()
+        }
+        self.max_wait = max_wait
+    
+    def acquire(self, bucket: str):
+        """Wait for quota in ``bucket``; use as ``async with pacer.acquire(name)``."""
+        return self.buckets[bucket].acquire(self.max_wait)
+    
+    def update(self, bucket: str, headers: Any) -> None:
+        """
+        Apply ``X-RateLimit-*`` response headers to a bucket.
+        
+        ``X-RateLimit-Resource`` overrides ``bucket`` when it names a known
+        bucket. Responses without quota headers are ignored.
+        """
+        bucket = headers.get("X-RateLimit-Resource") or bucket
+        if bucket not in self.buckets:
+            return
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_at = float(headers["X-RateLimit-Reset"])
+            limit = int(headers.get("X-RateLimit-Limit") or 0)
+        except (KeyError, TypeError, ValueError):
+            return
+        self.buckets[bucket].update(remaining, reset_at, limit)
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for every bucket, keyed by bucket name."""
+        return {name: bucket.get_stats() for name, bucket in self.buckets.items()}
@@ -2,17 +2,86 @@
 Tool Registry - Manages registration and discovery of tools
 """
 
+import asyncio
+import json
+import time
 from typing import Dict, List, Optional, Type, Any
-from .base import BaseTool, ToolCapability, ToolResult
+
+from config import settings
+from .base import (
+    BaseTool, ErrorCategory, ToolCapability, ToolResult, ToolStatus, request_budget,
+    call_key, canonicalize_parameters
+)
+from .breaker import CircuitBreaker
+from .cache import ResultCache
+from .latency import LatencyTracker
+from .limits import ConcurrencyLimiter
+from .retrieval import CapabilityIndex
+from .validation import mark_validated
 
 
 class ToolRegistry:
     """Registry for managing available tools."""
     
-    def __init__(self):
-        """Initialize tool registry."""
+    def __init__(
+        self,
+        limiter: Optional[ConcurrencyLimiter] = None,
+        cache: Optional[ResultCache] = None,
+        hedging: Optional[bool] = None,
+        circuit_breakers: Optional[bool] = None
+    ):
+        """
+        Initialize tool registry.
+        
+        Args:
+            limiter: Concurrency limits for tool calls (defaults to the
+                TOOL_*_CONCURRENCY settings)
+            cache: Result cache for successful calls (defaults to the CACHE_*
+                settings; None when CACHE_ENABLED is false)
+            hedging: Send a duplicate request when an idempotent call runs
+                past its observed latency percentile (defaults to HEDGING_ENABLED)
+            circuit_breakers: Fail fast on tools and capabilities whose upstream
+                keeps failing (defaults to CIRCUIT_BREAKER_ENABLED)
+        """
         self._tools: Dict[str, BaseTool] = {}
         self._capability_index: Dict[str, str] = {}  # capability_name -> tool_name
+        self._capabilities: Dict[str, ToolCapability] = {}  # capability_name -> definition
+        self.limiter = limiter or ConcurrencyLimiter(
+            global_limit=settings.tool_global_concurrency,
+            tool_limits=settings.tool_concurrency_limits,
+            capability_limits=settings.capability_concurrency_limits
+        )
+        if cache is None and settings.cache_enabled:
+            cache = ResultCache(
+                default_ttl=settings.cache_ttl,
+                capability_ttls=settings.capability_cache_ttls,
+                max_entries=settings.cache_max_entries,
+                max_bytes=settings.cache_max_bytes
+            )
+        self.cache = cache
+        
+        # Per-capability latency of successful calls, used for hedging
+        self.latency = LatencyTracker()
+        self.hedging_enabled = settings.hedging_enabled if hedging is None else hedging
+        self.hedge_percentile = settings.hedge_percentile
+        self.hedge_min_samples = settings.hedge_min_samples
+        self.hedge_max_ratio = settings.hedge_max_ratio
+        self.hedge_stats = {"calls": 0, "hedged": 0, "hedge_wins": 0}
+        
+        # Circuit breakers keyed "tool:<name>" and "capability:<name>", created on first use
+        self.circuit_breakers_enabled = (
+            settings.circuit_breaker_enabled if circuit_breakers is None else circuit_breakers
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        
+        # Planner capability catalog, rebuilt only after the tool set changes
+        self.catalog_version = 0
+        self._catalog: Optional[List[Dict[str, Any]]] = None
+        self._catalog_prompt: Optional[str] = None
+        self._catalog_lines: Dict[str, str] = {}  # capability_name -> minified JSON
+        
+        # BM25 index over capability text for picking prompt capabilities
+        self.capability_search = CapabilityIndex()
     
     def register_tool(self, tool: BaseTool) -> None:
         """
@@ -26,6 +95,18 @@ class ToolRegistry:
         # Index capabilities for quick lookup
         for capability in tool.get_capabilities():
             self._capability_index[capability.name] = tool.name
+            self._capabilities[capability.name] = capability
+            self.capability_search.add(capability.name, " ".join([
+                capability.name.replace("_", " "),
+                tool.name,
+                capability.description,
+                *capability.examples
+            ]))
+        
+        self.catalog_version += 1
+        self._catalog = None
+        self._catalog_prompt = None
+        self._catalog_lines = {}
     
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """
@@ -33,7 +114,7 @@ class ToolRegistry:
         
         Args:
             name: Tool name
-            
+        
         Returns:
             Tool instance or None if not found
         """
@@ -45,7 +126,7 @@ class ToolRegistry:
         
         Args:
             capability: Capability name
-            
+        
         Returns:
             Tool instance or None if not found
         """
@@ -54,6 +135,18 @@ class ToolRegistry:
             return self._tools.get(tool_name)
         return None
     
+    def get_capability(self, capability: str) -> Optional[ToolCapability]:
+        """
+        Get the definition of a capability.
+        
+        Args:
+            capability: Capability name
+        
+        Returns:
+            Capability definition or None if not found
+        """
+        return self._capabilities.get(capability)
+    
     def list_tools(self) -> List[str]:
         """Get list of all registered tool names."""
         return list(self._tools.keys())
@@ -69,13 +162,96 @@ class ToolRegistry:
             result[tool_name] = tool.get_capabilities()
         return result
     
+    def get_capability_catalog(self) -> List[Dict[str, Any]]:
+        """
+        Get every capability as a compact dict for planner prompts.
+        
+        Keys that carry no information are left out: ``required`` only
+        appears as ``"optional": true``, and ``default``/``enum``/range
+        constraints/``examples`` only when set. Cached until
+        ``register_tool`` changes the registry.
+        
+        Returns:
+            List of capability dicts with their tool name
+        """
+        if self._catalog is None:
+            catalog = []
+            for tool_name, tool in self._tools.items():
+                for capability in tool.get_capabilities():
+                    parameters = []
+                    for param in capability.parameters:
+                        entry: Dict[str, Any] = {
+                            "name": param.name,
+                            "type": param.type,
+                            "description": param.description
+                        }
+                        if not param.required:
+                            entry["optional"] = True
+                        if param.default is not None:
+                            entry["default"] = param.default
+                        if param.enum:
+                            entry["enum"] = param.enum
+                        for constraint in ("minimum", "maximum", "min_length", "max_length"):
+                            value = getattr(param, constraint)
+                            if value is not None:
+                                entry[constraint] = value
+                        parameters.append(entry)
+                    
+                    item: Dict[str, Any] = {
+                        "name": capability.name,
+                        "tool": tool_name,
+                        "description": capability.description,
+                        "parameters": parameters
+                    }
+                    if capability.examples:
+                        item["examples"] = capability.examples
+                    catalog.append(item)
+            self._catalog = catalog
+        return self._catalog
+    
+    def get_catalog_prompt(self, capabilities: Optional[List[str]] = None) -> str:
+        """
+        Get the capability catalog as minified JSON (one capability per line).
+        
+        Cached until ``register_tool`` changes the registry; compare
+        ``catalog_version`` to tell whether it changed.
+        
+        Args:
+            capabilities: Only include these capabilities (in catalog order);
+                None for all of them
+        """
+        if not self._catalog_lines:
+            self._catalog_lines = {
+                item["name"]: json.dumps(item, separators=(",", ":"), ensure_ascii=False)
+                for item in self.get_capability_catalog()
+            }
+        if capabilities is not None:
+            selected = set(capabilities)
+            return "\n".join(line for name, line in self._catalog_lines.items() if name in selected)
+        if self._catalog_prompt is None:
+            self._catalog_prompt = "\n".join(self._catalog_lines.values())
+        return self._catalog_prompt
+    
+    def get_relevant_capabilities(self, query: str, k: int) -> List[str]:
+        """
+        Get the k capabilities whose name, description and examples best match a query (BM25).
+        
+        Args:
+            query: Natural language task
+            k: Maximum number of capabilities
+        
+        Returns:
+            Capability names, most relevant first (empty if nothing matches)
+        """
+        return [name for name, _ in self.capability_search.search(query, k)]
+    
     def search_capabilities(self, query: str) -> List[Dict[str, Any]]:
         """
         Search for capabilities matching a query.
         
         Args:
             query: Search query string
-            
+        
         Returns:
             List of matching capabilities with tool info
         """
@@ -114,23 +290,223 @@ class ToolRegistry:
             capability: Capability name to execute
             parameters: Parameters for the capability
             context: Optional execution context
-            
+        
         Returns:
             Result from tool execution
-            
+        
         Raises:
             ValueError: If capability is not found
+            asyncio.TimeoutError: If the call runs past ``context["timeout"]``
+                (recorded as a circuit breaker failure)
         """
         tool = self.get_tool_for_capability(capability)
         if not tool:
             raise ValueError(f"No tool found for capability: {capability}")
         
-        # Validate parameters
+        # Validate parameters (skipped if the planner already did) and mark
+        # them so the tool's own check is skipped too
         is_valid, error_msg = tool.validate_parameters(capability, parameters)
         if not is_valid:
             raise ValueError(f"Invalid parameters for {capability}: {error_msg}")
+        parameters = mark_validated(parameters, capability)
+        
+        # Serve repeated calls from the cache
+        key = None
+        if self.cache is not None:
+            key = call_key(capability, canonicalize_parameters(parameters, self._capabilities.get(capability)))
+            cached = self.cache.get(key)
+            if cached is not None:
+                # Deep copy so callers mutating a hit's data cannot corrupt the entry
+                return cached.model_copy(deep=True, update={"metadata": {**(cached.metadata or {}), "cache": "hit"}})
+        
+        # Fail fast while the upstream is known to be failing
+        breakers = self._get_breakers(tool.name, capability)
+        for breaker in breakers:
+            if not breaker.allow():
+                breaker.rejected += 1
+                return self._circuit_open_result(breaker)
+        for breaker in breakers:
+            breaker.start_call()
+        
+        try:
+            self.hedge_stats["calls"] += 1
+            hedge_delay = self._get_hedge_delay(capability)
+            if hedge_delay is None:
+                result = await self._invoke(tool, capability, parameters, context)
+            else:
+                result = await self._invoke_hedged(tool, capability, parameters, context, hedge_delay)
+        except asyncio.CancelledError:
+            for breaker in breakers:
+                breaker.record_cancelled()
+            raise
+        except Exception:
+            for breaker in breakers:
+                breaker.record_failure()
+            raise
+        
+        # Invalid requests say nothing about upstream health
+        upstream_failed = result.is_error() and (
+            (result.metadata or {}).get("error_category") != ErrorCategory.PERMANENT.value
+        )
+        for breaker in breakers:
+            if upstream_failed:
+                breaker.record_failure()
+            elif result.is_error():
+                breaker.record_cancelled()
+            else:
+                breaker.record_success()
+        
+        if key is not None:
+            self.cache.set(capability, key, result.model_copy(deep=True))
+        return result
+    
+    def _get_breakers(self, tool_name: str, capability: str) -> List[CircuitBreaker]:
+        """Get the circuit breakers for a call, creating them on first use."""
+        if not self.circuit_breakers_enabled:
+            return []
+        
+        breakers = []
+        for name in (f"capability:{capability}", f"tool:{tool_name}"):
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(
+                    name,
+                    failure_threshold=settings.circuit_failure_threshold,
+                    window=settings.circuit_window,
+                    failure_rate=settings.circuit_failure_rate,
+                    reset_timeout=settings.circuit_reset_timeout,
+                    half_open_probes=settings.circuit_half_open_probes
+                )
+            breakers.append(breaker)
+        return breakers
+    
+    def _circuit_open_result(self, breaker: CircuitBreaker) -> ToolResult:
+        """Build the error returned when a circuit rejects a call."""
+        retry_after = breaker.retry_after()
+        return ToolResult(
+            status=ToolStatus.ERROR,
+            error=f"Circuit open for {breaker.name} (upstream failing); retry in {retry_after:.0f}s",
+            metadata={
+                # Not retried within the plan: the circuit will not close before the backoff ends
+                "error_category": ErrorCategory.PERMANENT.value,
+                "circuit": breaker.name,
+                "retry_after": retry_after
+            }
+        )
+    
+    async def _invoke(
+        self,
+        tool: BaseTool,
+        capability: str,
+        parameters: Dict[str, Any],
+        context: Optional[Dict[str, Any]]
+    ) -> ToolResult:
+        """
+        Call the tool under its concurrency limits, recording its latency.
+        
+        The executor's per-attempt ``timeout`` from the context starts once
+        a concurrency slot is held, so queueing behind a limit does not time
+        calls out. The queue wait is reported back in the context as
+        ``queue_wait`` (seconds) and ``slot_acquired`` (time.perf_counter()).
         
-        return await tool.execute(capability, parameters, context)
+        Raises:
+            asyncio.TimeoutError: If the tool runs past the timeout
+        """
+        timeout = (context or {}).get("timeout")
+        # Expose the executor's time budget to the tool's HTTP calls
+        token = request_budget.set(timeout)
+        try:
+            async with self.limiter.slot(tool.name, capability) as waits:
+                start_time = time.perf_counter()
+                if context is not None and "slot_acquired" not in context:
+                    context["queue_wait"] = sum(waits.values())
+                    context["slot_acquired"] = start_time
+                result = await asyncio.wait_for(tool.execute(capability, parameters, context), timeout=timeout)
+                if result.is_success():
+                    self.latency.record(capability, time.perf_counter() - start_time)
+                return result
+        finally:
+            request_budget.reset(token)
+    
+    def _get_hedge_delay(self, capability: str) -> Optional[float]:
+        """Get how long to wait before hedging a call, or None if it is not eligible."""
+        if not self.hedging_enabled:
+            return None
+        
+        definition = self._capabilities.get(capability)
+        if definition is None or not definition.idempotent:
+            return None
+        if self.latency.sample_count(capability) < self.hedge_min_samples:
+            return None
+        
+        return self.latency.percentile(capability, self.hedge_percentile)
+    
+    async def _invoke_hedged(
+        self,
+        tool: BaseTool,
+        capability: str,
+        parameters: Dict[str, Any],
+        context: Optional[Dict[str, Any]],
+        delay: float
+    ) -> ToolResult:
+        """
+        Call the tool, sending a duplicate request if the first is slow.
+        
+        If the first request has not finished after ``delay`` seconds and the
+        hedge budget allows it, a second request is started. The first
+        successful response wins and the other request is cancelled.
+        """
+        tasks = [asyncio.create_task(self._invoke(tool, capability, parameters, context))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or self.hedge_stats["hedged"] >= self.hedge_max_ratio * self.hedge_stats["calls"]:
+                return await tasks[0]
+            
+            self.hedge_stats["hedged"] += 1
+            tasks.append(asyncio.create_task(self._invoke(tool, capability, parameters, context)))
+            
+            pending = set(tasks)
+            result: Optional[ToolResult] = None
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    result = task.result()
+                    if result.is_success() or result.is_partial():
+                        if task is tasks[1]:
+                            self.hedge_stats["hedge_wins"] += 1
+                        return result
+            
+            if result is None:
+                raise error
+            return result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    def get_hedging_stats(self) -> Dict[str, Any]:
+        """Get hedged request counts and per-capability latency percentiles."""
+        return {
+            "enabled": self.hedging_enabled,
+            **self.hedge_stats,
+            "latency": self.latency.get_stats()
+        }
+    
+    def get_circuit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the state of every circuit breaker, keyed by breaker name."""
+        return {name: breaker.get_stats() for name, breaker in self._breakers.items()}
+    
+    def get_concurrency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get in-flight counts and queue-wait times for each concurrency limit."""
+        return self.limiter.get_stats()
+    
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get result cache hit/miss statistics (None if caching is disabled)."""
+        return self.cache.get_stats() if self.cache is not None else None
     
     def get_registry_info(self) -> Dict[str, Any]:
         """Get comprehensive information about the registry."""
@@ -141,5 +517,9 @@ class ToolRegistry:
                 name: tool.get_tool_info()
                 for name, tool in self._tools.items()
             },
-            "capability_mapping": dict(self._capability_index)
+            "capability_mapping": dict(self._capability_index),
+            "concurrency": self.get_concurrency_stats(),
+            "cache": self.get_cache_stats(),
+            "hedging": self.get_hedging_stats(),
+            "circuits": self.get_circuit_stats()
         }
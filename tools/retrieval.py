@@ -0,0 +1,109 @@
+"""
+Capability Retrieval - BM25 index over capability names, descriptions and examples
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words that say nothing about which capability a task needs
+STOP_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "in", "at", "on", "of", "for", "to", "from", "by", "with",
+    "about", "is", "are", "be", "what", "whats", "how", "me", "my", "i", "you", "it", "this",
+    "that", "please", "show", "tell", "get", "give", "find", "s"
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words of text (snake_case split) with stop words dropped and plurals folded."""
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if token in STOP_WORDS:
+            continue
+        if len(token) > 4 and token.endswith("ies"):
+            token = token[:-3] + "y"
+        elif len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class CapabilityIndex:
+    """
+    Okapi BM25 index of capability documents.
+    
+    Documents are added as tools are registered; term statistics are kept
+    incrementally so adding a capability does not rebuild the index.
+    """
+    
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize capability index.
+        
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization (0-1)
+        """
+        self.k1 = k1
+        self.b = b
+        self._documents: Dict[str, Counter] = {}  # capability -> term frequencies
+        self._lengths: Dict[str, int] = {}
+        self._document_frequency: Counter = Counter()
+        self._total_length = 0
+    
+    def __len__(self) -> int:
+        return len(self._documents)
+    
+    def add(self, name: str, text: str) -> None:
+        """Index a capability's text, replacing any earlier document with that name."""
+        if name in self._documents:
+            self.remove(name)
+        terms = Counter(tokenize(text))
+        self._documents[name] = terms
+        self._lengths[name] = sum(terms.values())
+        self._total_length += self._lengths[name]
+        self._document_frequency.update(terms.keys())
+    
+    def remove(self, name: str) -> None:
+        """Drop a capability from the index."""
+        terms = self._documents.pop(name)
+        self._total_length -= self._lengths.pop(name)
+        self._document_frequency.subtract(terms.keys())
+        self._document_frequency += Counter()  # Drop zero counts
+    
+    def search(self, query: str, k: int) -> List[Tuple[str, float]]:
+        """
+        Get the k best-scoring capabilities for a query.
+        
+        Returns:
+            (capability, score) pairs, best first; capabilities sharing no
+            term with the query are never returned
+        """
+        terms = set(tokenize(query))
+        if not terms or not self._documents:
+            return []
+        
+        total = len(self._documents)
+        average_length = self._total_length / total or 1.0
+        idf = {}
+        for term in terms:
+            df = self._document_frequency[term]
+            if df:
+                idf[term] = math.log(1 + (total - df + 0.5) / (df + 0.5))
+        
+        scores = []
+        for name, frequencies in self._documents.items():
+            norm = self.k1 * (1 - self.b + self.b * self._lengths[name] / average_length)
+            score = sum(
+                weight * frequencies[term] * (self.k1 + 1) / (frequencies[term] + norm)
+                for term, weight in idf.items()
+                if term in frequencies
+            )
+            if score > 0:
+                scores.append((name, score))
+        scores.sort(key=lambda item: item[1], reverse=True)
+        return scores[:k]
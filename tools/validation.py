@@ -0,0 +1,202 @@
+"""
+Parameter Validation - Validators compiled from ToolCapability parameter schemas
+"""
+
+import copy
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .base import ToolCapability, ToolParameter  # base imports this module
+
+
+# Returns an error message, or None if the parameters are valid
+Validator = Callable[[Dict[str, Any]], Optional[str]]
+
+# Python types accepted for each parameter type (bool is rejected for numbers)
+TYPE_CHECKS: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,)
+}
+TYPE_NAMES = {
+    "string": "a string",
+    "number": "a number",
+    "integer": "an integer",
+    "boolean": "a boolean",
+    "array": "an array",
+    "object": "an object"
+}
+
+
+class ValidatedParameters(dict):
+    """
+    Parameters that passed validation for ``capability``.
+    
+    Later validations of the same capability are skipped. Any change to the
+    dict clears the marker; copies keep it.
+    """
+    
+    def __init__(self, parameters: Dict[str, Any], capability: Optional[str]):
+        super().__init__(parameters)
+        self.capability = capability
+    
+    def _modified(self) -> None:
+        self.capability = None
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._modified()
+        super().__setitem__(key, value)
+    
+    def __delitem__(self, key: str) -> None:
+        self._modified()
+        super().__delitem__(key)
+    
+    def __ior__(self, other: Any) -> "ValidatedParameters":
+        self._modified()
+        return super().__ior__(other)
+    
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._modified()
+        super().update(*args, **kwargs)
+    
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self._modified()
+        return super().setdefault(key, default)
+    
+    def pop(self, *args: Any) -> Any:
+        self._modified()
+        return super().pop(*args)
+    
+    def popitem(self) -> Any:
+        self._modified()
+        return super().popitem()
+    
+    def clear(self) -> None:
+        self._modified()
+        super().clear()
+    
+    def __copy__(self) -> "ValidatedParameters":
+        return ValidatedParameters(self, self.capability)
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ValidatedParameters":
+        return ValidatedParameters(copy.deepcopy(dict(self), memo), self.capability)
+    
+    def __reduce__(self) -> Any:
+        return (ValidatedParameters, (dict(self), self.capability))
+
+
+def mark_validated(parameters: Dict[str, Any], capability: str) -> ValidatedParameters:
+    """Get the parameters marked as valid for a capability."""
+    if isinstance(parameters, ValidatedParameters) and parameters.capability == capability:
+        return parameters
+    return ValidatedParameters(parameters, capability)
+
+
+def is_validated(parameters: Dict[str, Any], capability: str) -> bool:
+    """Check whether parameters are marked as valid for a capability and unchanged since."""
+    return isinstance(parameters, ValidatedParameters) and parameters.capability == capability
+
+
+def describe_constraint(param: "ToolParameter") -> str:
+    """Describe what a parameter accepts, e.g. "an integer between 1 and 100"."""
+    if param.enum:
+        return "one of " + ", ".join(str(value) for value in param.enum)
+    
+    description = TYPE_NAMES.get(param.type, f"of type {param.type}")
+    if param.type == "string":
+        if param.min_length is not None and param.min_length == param.max_length:
+            return f"a string of {param.min_length} characters"
+        if param.min_length == 1 and param.max_length is None:
+            return "a non-empty string"
+        if param.min_length is not None and param.max_length is not None:
+            return f"a string of {param.min_length} to {param.max_length} characters"
+        if param.min_length is not None:
+            return f"a string of at least {param.min_length} characters"
+        if param.max_length is not None:
+            return f"a string of at most {param.max_length} characters"
+    elif param.minimum is not None and param.maximum is not None:
+        return f"{description} between {param.minimum:g} and {param.maximum:g}"
+    elif param.minimum is not None:
+        return f"{description} of at least {param.minimum:g}"
+    elif param.maximum is not None:
+        return f"{description} of at most {param.maximum:g}"
+    return description
+
+
+def compile_parameter_check(param: "ToolParameter") -> Optional[Callable[[Any], Optional[str]]]:
+    """
+    Build a check for one parameter's type, enum and ranges.
+    
+    Ranges apply to numbers and integers, lengths to strings (measured
+    without surrounding whitespace) and arrays. Returns None if nothing is
+    checked.
+    """
+    types = TYPE_CHECKS.get(param.type)
+    reject_bool = param.type in ("number", "integer")
+    enum: Optional[Any] = None
+    if param.enum:
+        try:
+            enum = frozenset(param.enum)
+        except TypeError:
+            enum = tuple(param.enum)  # Unhashable values
+    ranged = param.type in ("number", "integer")
+    minimum = param.minimum if ranged else None
+    maximum = param.maximum if ranged else None
+    sized = param.type in ("string", "array")
+    min_length = param.min_length if sized else None
+    max_length = param.max_length if sized else None
+    strip = param.type == "string"
+    if types is None and enum is None:
+        return None
+    
+    message = param.error_message or f"{param.name} must be {describe_constraint(param)}"
+    
+    def check(value: Any) -> Optional[str]:
+        if types is not None and (not isinstance(value, types) or (reject_bool and isinstance(value, bool))):
+            return message
+        if enum is not None and value not in enum:
+            return message
+        if (minimum is not None and value < minimum) or (maximum is not None and value > maximum):
+            return message
+        if min_length is not None or max_length is not None:
+            length = len(value.strip()) if strip else len(value)
+            if (min_length is not None and length < min_length) or (max_length is not None and length > max_length):
+                return message
+        return None
+    
+    return check
+
+
+def compile_validator(capability: "ToolCapability") -> Validator:
+    """
+    Compile a capability's parameter schema into a single validator.
+    
+    The required names and per-parameter checks are built once. Required
+    parameters must be present; every declared parameter that is given must
+    match its type, enum and ranges. Undeclared parameters are ignored.
+    """
+    required = tuple(param.name for param in capability.parameters if param.required)
+    checks = []
+    for param in capability.parameters:
+        check = compile_parameter_check(param)
+        if check is not None:
+            checks.append((param.name, check))
+    missing = object()
+    
+    def validate(parameters: Dict[str, Any]) -> Optional[str]:
+        for name in required:
+            if name not in parameters:
+                return f"Missing required parameter: {name}"
+        for name, check in checks:
+            value = parameters.get(name, missing)
+            if value is not missing:
+                error = check(value)
+                if error is not None:
+                    return error
+        return None
+    
+    return validate
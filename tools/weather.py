@@ -8,7 +8,61 @@ import aiohttp
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
-from .base import BaseTool, ToolResult, ToolStatus, ToolCapability, ToolParameter
+from .base import (
+    BaseTool, ToolResult, ToolStatus, ToolCapability, ToolParameter,
+    ErrorCategory, ToolError, parse_retry_after
+)
+
+
+def summarize_forecast(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Summarize OpenWeatherMap 3-hourly forecast entries per day.
+    
+    Module-level so it can run in a process pool.
+    
+    Args:
+        items: Entries of the forecast response's "list"
+    
+    Returns:
+        Daily summaries (temperature range, dominant condition, averages)
+    """
+    # Group by day
+    daily_forecasts = {}
+    for item in items:
+        date = datetime.fromtimestamp(item["dt"]).date().isoformat()
+        
+        if date not in daily_forecasts:
+            daily_forecasts[date] = {
+                "date": date,
+                "temperatures": [],
+                "conditions": [],
+                "humidity": [],
+                "wind_speeds": []
+            }
+        
+        day_data = daily_forecasts[date]
+        day_data["temperatures"].append(item["main"]["temp"])
+        day_data["conditions"].append(item["weather"][0]["description"])
+        day_data["humidity"].append(item["main"]["humidity"])
+        day_data["wind_speeds"].append(item["wind"]["speed"])
+    
+    # Calculate daily summaries
+    forecasts = []
+    for date, day_data in daily_forecasts.items():
+        forecast = {
+            "date": date,
+            "temperature": {
+                "min": min(day_data["temperatures"]),
+                "max": max(day_data["temperatures"]),
+                "avg": sum(day_data["temperatures"]) / len(day_data["temperatures"])
+            },
+            "condition": max(set(day_data["conditions"]), key=day_data["conditions"].count),
+            "humidity": sum(day_data["humidity"]) / len(day_data["humidity"]),
+            "wind_speed": sum(day_data["wind_speeds"]) / len(day_data["wind_speeds"])
+        }
+        forecasts.append(forecast)
+    
+    return forecasts
 
 
 class WeatherTool(BaseTool):
@@ -34,7 +88,8 @@ class WeatherTool(BaseTool):
                         name="city",
                         type="string",
                         description="City name (e.g., 'London', 'New York', 'Tokyo')",
-                        required=True
+                        required=True,
+                        min_length=1
                     ),
                     ToolParameter(
                         name="country_code",
@@ -65,7 +120,8 @@ class WeatherTool(BaseTool):
                         name="city",
                         type="string",
                         description="City name",
-                        required=True
+                        required=True,
+                        min_length=1
                     ),
                     ToolParameter(
                         name="country_code",
@@ -95,13 +151,17 @@ class WeatherTool(BaseTool):
                         name="lat",
                         type="number",
                         description="Latitude",
-                        required=True
+                        required=True,
+                        minimum=-90,
+                        maximum=90
                     ),
                     ToolParameter(
                         name="lon",
                         type="number",
                         description="Longitude",
-                        required=True
+                        required=True,
+                        minimum=-180,
+                        maximum=180
                     ),
                     ToolParameter(
                         name="units",
@@ -129,17 +189,17 @@ class WeatherTool(BaseTool):
         try:
             # Validate API key
             if not self.validate_api_key():
-                return ToolResult(
-                    status=ToolStatus.ERROR,
-                    error="WEATHER_API_KEY not configured or invalid"
+                return self.error_result(
+                    "WEATHER_API_KEY not configured or invalid",
+                    category=ErrorCategory.PERMANENT
                 )
             
             # Validate parameters
             is_valid, error_msg = self.validate_parameters(capability, parameters)
             if not is_valid:
-                return ToolResult(
-                    status=ToolStatus.ERROR,
-                    error=f"Invalid parameters: {error_msg}"
+                return self.error_result(
+                    f"Invalid parameters: {error_msg}",
+                    category=ErrorCategory.PERMANENT
                 )
             
             # Execute the specific capability
@@ -150,16 +210,13 @@ class WeatherTool(BaseTool):
             elif capability == "get_weather_by_coordinates":
                 return await self._get_weather_by_coordinates(parameters)
             else:
-                return ToolResult(
-                    status=ToolStatus.ERROR,
-                    error=f"Unknown capability: {capability}"
+                return self.error_result(
+                    f"Unknown capability: {capability}",
+                    category=ErrorCategory.PERMANENT
                 )
-                
+        
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"Weather API error: {str(e)}"
-            )
+            return self.error_result(f"Weather API error: {str(e)}", e)
     
     async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Make request to OpenWeatherMap API."""
@@ -168,16 +225,27 @@ class WeatherTool(BaseTool):
         url = f"{self.base_url}/{endpoint}"
         
         async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
+            async with session.get(
+                url,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=self.get_request_timeout())
+            ) as response:
                 if response.status == 200:
                     return await response.json()
                 elif response.status == 401:
-                    raise Exception("Invalid API key")
+                    raise ToolError("Invalid API key", ErrorCategory.PERMANENT)
                 elif response.status == 404:
-                    raise Exception("City not found")
+                    raise ToolError("City not found", ErrorCategory.PERMANENT)
+                elif response.status == 429:
+                    raise ToolError(
+                        "Rate limit exceeded",
+                        ErrorCategory.RATE_LIMITED,
+                        parse_retry_after(response.headers)
+                    )
                 else:
                     error_text = await response.text()
-                    raise Exception(f"HTTP {response.status}: {error_text}")
+                    category = ErrorCategory.RETRYABLE if response.status >= 500 else ErrorCategory.PERMANENT
+                    raise ToolError(f"HTTP {response.status}: {error_text}", category)
     
     async def _get_current_weather(self, params: Dict[str, Any]) -> ToolResult:
         """Get current weather for a city."""
@@ -234,12 +302,9 @@ class WeatherTool(BaseTool):
                     "location_query": location
                 }
             )
-            
+        
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"Current weather lookup failed: {str(e)}"
-            )
+            return self.error_result(f"Current weather lookup failed: {str(e)}", e)
     
     async def _get_weather_forecast(self, params: Dict[str, Any]) -> ToolResult:
         """Get 5-day weather forecast for a city."""
@@ -255,41 +320,8 @@ class WeatherTool(BaseTool):
         try:
             data = await self._make_request("forecast", request_params)
             
-            # Process forecast data (group by day)
-            daily_forecasts = {}
-            for item in data["list"]:
-                date = datetime.fromtimestamp(item["dt"]).date().isoformat()
-                
-                if date not in daily_forecasts:
-                    daily_forecasts[date] = {
-                        "date": date,
-                        "temperatures": [],
-                        "conditions": [],
-                        "humidity": [],
-                        "wind_speeds": []
-                    }
-                
-                day_data = daily_forecasts[date]
-                day_data["temperatures"].append(item["main"]["temp"])
-                day_data["conditions"].append(item["weather"][0]["description"])
-                day_data["humidity"].append(item["main"]["humidity"])
-                day_data["wind_speeds"].append(item["wind"]["speed"])
-            
-            # Calculate daily summaries
-            forecasts = []
-            for date, day_data in daily_forecasts.items():
-                forecast = {
-                    "date": date,
-                    "temperature": {
-                        "min": min(day_data["temperatures"]),
-                        "max": max(day_data["temperatures"]),
-                        "avg": sum(day_data["temperatures"]) / len(day_data["temperatures"])
-                    },
-                    "condition": max(set(day_data["conditions"]), key=day_data["conditions"].count),
-                    "humidity": sum(day_data["humidity"]) / len(day_data["humidity"]),
-                    "wind_speed": sum(day_data["wind_speeds"]) / len(day_data["wind_speeds"])
-                }
-                forecasts.append(forecast)
+            # Group 3-hourly entries into daily summaries
+            forecasts = await self.post_process(summarize_forecast, data["list"], size=len(data["list"]))
             
             return ToolResult(
                 status=ToolStatus.SUCCESS,
@@ -307,12 +339,9 @@ class WeatherTool(BaseTool):
                     "forecast_days": len(forecasts)
                 }
             )
-            
+        
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"Weather forecast lookup failed: {str(e)}"
-            )
+            return self.error_result(f"Weather forecast lookup failed: {str(e)}", e)
     
     async def _get_weather_by_coordinates(self, params: Dict[str, Any]) -> ToolResult:
         """Get weather by geographic coordinates."""
@@ -365,50 +394,14 @@ class WeatherTool(BaseTool):
                     "coordinates": f"{params['lat']}, {params['lon']}"
                 }
             )
-            
+        
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"Coordinate weather lookup failed: {str(e)}"
-            )
+            return self.error_result(f"Coordinate weather lookup failed: {str(e)}", e)
     
     def get_capabilities(self) -> List[ToolCapability]:
         """Get list of available capabilities."""
         return self.capabilities
     
-    def validate_parameters(
-        self,
-        capability: str,
-        parameters: Dict[str, Any]
-    ) -> tuple[bool, Optional[str]]:
-        """Validate parameters for a capability."""
-        cap = next((c for c in self.capabilities if c.name == capability), None)
-        if not cap:
-            return False, f"Unknown capability: {capability}"
-        
-        # Check required parameters
-        for param in cap.parameters:
-            if param.required and param.name not in parameters:
-                return False, f"Missing required parameter: {param.name}"
-        
-        # Validate parameter types and values
-        if capability in ["get_current_weather", "get_weather_forecast"]:
-            city = parameters.get("city", "")
-            if not isinstance(city, str) or len(city.strip()) == 0:
-                return False, "city must be a non-empty string"
-        
-        elif capability == "get_weather_by_coordinates":
-            lat = parameters.get("lat")
-            lon = parameters.get("lon")
-            
-            if not isinstance(lat, (int, float)) or not (-90 <= lat <= 90):
-                return False, "lat must be a number between -90 and 90"
-            
-            if not isinstance(lon, (int, float)) or not (-180 <= lon <= 180):
-                return False, "lon must be a number between -180 and 180"
-        
-        return True, None
-    
     def validate_api_key(self) -> bool:
         """Validate OpenWeatherMap API key."""
         if not self.api_key: